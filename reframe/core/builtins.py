@@ -18,10 +18,10 @@ import reframe.utility as utils
 from reframe.core.deferrable import deferrable, _DeferredPerformanceExpression
 
 
-__all__ = ['deferrable', 'deprecate', 'final', 'fixture', 'loggable',
-           'loggable_as', 'parameter', 'performance_function', 'required',
-           'require_deps', 'run_before', 'run_after', 'sanity_function',
-           'variable', 'xfail']
+__all__ = ['deferrable', 'deprecate', 'early_failure', 'final', 'fixture',
+           'loggable', 'loggable_as', 'parameter', 'performance_function',
+           'required', 'require_deps', 'run_before', 'run_after',
+           'sanity_function', 'variable', 'xfail']
 
 parameter = parameters.TestParam
 variable = variables.TestVar
@@ -131,6 +131,42 @@ def sanity_function(fn):
     return _def_fn
 
 
+def early_failure(fn):
+    '''Decorate a test member function to mark it as an early failure check.
+
+    This decorator will convert the given function into a
+    :func:`~RegressionTestPlugin.deferrable`, which must return a sanity
+    expression just like a :func:`@sanity_function <sanity_function>`.
+    While the job of the test is running, the sanity expressions returned by
+    the early failure checks of the test are evaluated every time that the
+    job is polled; if any of them fails, the job is cancelled and the test
+    fails immediately with the error of the check, instead of holding its
+    resources until the job finishes. The decorated functions are called
+    only once, the first time that the job is polled.
+
+    .. code-block:: python
+
+       @early_failure
+       def fatal_error(self):
+           return sn.assert_not_found(r'FATAL', self.stdout)
+
+    Checks that return an :func:`~reframe.utility.sanity.assert_not_found`
+    expression are evaluated incrementally: only the lines appended to the
+    file since the previous evaluation are searched, so their patterns
+    should not span multiple lines. Any other check is evaluated in full
+    every time, so it should be cheap to evaluate.
+
+    A test may define multiple early failure checks and it inherits those of
+    its base classes, unless they are overridden.
+
+    .. versionadded:: 4.11
+    '''
+
+    _def_fn = deferrable(fn)
+    setattr(_def_fn, '_rfm_early_failure_fn', True)
+    return _def_fn
+
+
 def performance_function(unit, *, perf_key=None):
     '''Decorate a test member function to mark it as a performance metric
     function.
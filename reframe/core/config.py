@@ -7,16 +7,15 @@ import contextlib
 import copy
 import fnmatch
 import functools
+import hashlib
 import importlib
 import io
 import itertools
 import json
-import jsonschema
 import os
 import re
 import socket
-import yaml
-from jinja2.sandbox import SandboxedEnvironment
+import tempfile
 
 import reframe
 import reframe.core.settings as settings
@@ -29,30 +28,55 @@ from reframe.core.logging import getlogger
 from reframe.utility import ScopedDict
 
 
-def _match_option(opt, opt_map):
-    def _copy_if_mutable(item):
-        for c in (dict, list):
-            if isinstance(item, c):
-                return c(item)
+def _copy_if_mutable(item):
+    for c in (dict, list):
+        if isinstance(item, c):
+            return c(item)
 
-        return item
+    return item
 
-    if isinstance(opt, list):
-        opt = '/'.join(opt)
 
-    if opt in opt_map:
-        return _copy_if_mutable(opt_map[opt])
+class _OptionTable:
+    '''Lookup table of options, whose keys may be glob patterns.
+
+    An exact match of the option takes precedence; otherwise, the value of
+    the first pattern matching the option in the order of ``options`` is
+    returned. The patterns are compiled once when the table is created.
+    '''
+
+    def __init__(self, options):
+        self._options = options
+        self._patterns = [(re.compile(fnmatch.translate(k)).match, k)
+                          for k in options if re.search(r'[*?[]', k)]
+
+    def lookup(self, opt):
+        '''Return the value of ``opt`` or raise :class:`KeyError`.'''
 
-    for k, v in opt_map.items():
-        if fnmatch.fnmatchcase(opt, k):
-            return _copy_if_mutable(v)
+        try:
+            return self._options[opt]
+        except KeyError:
+            pass
 
-    raise KeyError(opt)
+        for match, key in self._patterns:
+            if match(opt):
+                return self._options[key]
+
+        raise KeyError(opt)
+
+
+def _match_option(opt, opt_table):
+    if isinstance(opt, list):
+        opt = '/'.join(opt)
+
+    return _copy_if_mutable(opt_table.lookup(opt))
 
 
 def _normalize_syntax(conv):
     '''Normalize syntax for options accepting multiple syntaxes'''
 
+    conv = [(re.compile(opt_patt), norm_fn)
+            for opt_patt, norm_fn in conv.items()]
+
     def _do_normalize(fn):
 
         @functools.wraps(fn)
@@ -61,8 +85,8 @@ def _normalize_syntax(conv):
             if option is None:
                 return ret
 
-            for opt_patt, norm_fn in conv.items():
-                if re.match(opt_patt, option):
+            for opt_patt, norm_fn in conv:
+                if opt_patt.match(option):
                     ret = norm_fn(ret)
                     break
 
@@ -73,15 +97,61 @@ def _normalize_syntax(conv):
     return _do_normalize
 
 
+class _ConfigCache:
+    '''Persistent cache of the validated configurations and of their
+    resolved subconfigurations.
+
+    Each entry is stored in a JSON file named after the hash of its key.
+    Any errors while reading or writing the entries are ignored, in which
+    case the configuration is simply validated and resolved again.
+    '''
+
+    def __init__(self, dirname):
+        self._dirname = dirname
+
+    def _filename(self, key):
+        digest = hashlib.sha256(json.dumps(key).encode()).hexdigest()
+        return os.path.join(self._dirname, f'{digest}.json')
+
+    def get(self, key):
+        '''Return the cached data for ``key`` or :obj:`None`.'''
+
+        try:
+            with open(self._filename(key)) as fp:
+                return json.load(fp)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def put(self, key, data):
+        try:
+            os.makedirs(self._dirname, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', dir=self._dirname,
+                                             delete=False) as fp:
+                json.dump(data, fp)
+
+            # Replace atomically any existing entry
+            os.replace(fp.name, self._filename(key))
+        except (OSError, TypeError, ValueError) as err:
+            getlogger().debug(f'could not cache configuration: {err}')
+
+
 class _SiteConfig:
-    def __init__(self):
+    def __init__(self, cache_dir=None):
         self._site_config = None
         self._config_modules = []
         self._sources = []
         self._subconfigs = {}
         self._local_system = None
         self._sticky_options = {}
+        self._sticky_table = _OptionTable(self._sticky_options)
         self._autodetect_methods = []
+
+        # Cache of the resolved options per selected system and option path
+        self._option_cache = {}
+
+        # Persistent cache of the validated and resolved configurations
+        self._config_cache = _ConfigCache(cache_dir) if cache_dir else None
+        self._config_digest = None
         self._definitions = {
             'systems': {},
             'partitions': {},
@@ -93,13 +163,19 @@ class _SiteConfig:
         schema_filename = os.path.join(reframe.INSTALL_PREFIX, 'reframe',
                                        'schemas', 'config.json')
         with open(schema_filename) as fp:
+            schema_src = fp.read()
+            self._schema_digest = hashlib.sha256(
+                schema_src.encode()
+            ).hexdigest()
             try:
-                self._schema = json.loads(fp.read())
+                self._schema = json.loads(schema_src)
             except json.JSONDecodeError as e:
                 raise ReframeFatalError(
                     f'invalid configuration schema: {schema_filename!r}'
                 ) from e
 
+        self._defaults_table = _OptionTable(self._schema['defaults'])
+
     def _update_system_defs(self, config, filename):
         for sys_entry in config:
             sys_name = sys_entry['name']
@@ -178,7 +254,37 @@ class _SiteConfig:
 
         return ret
 
+    def _invalidate_option_cache(self):
+        self._option_cache.clear()
+        self._config_digest = None
+
+    def _cache_key(self, kind, *args):
+        '''Return the key of a persistent cache entry or :obj:`None` if the
+        configuration cannot be cached.
+
+        The key depends on the contents of the merged configuration, the
+        configuration schema and the framework version.
+        '''
+
+        if self._config_cache is None:
+            return None
+
+        if self._config_digest is None:
+            try:
+                config_src = json.dumps(self._site_config, sort_keys=True)
+            except (TypeError, ValueError):
+                # The configuration contains objects that are not valid JSON
+                return None
+
+            self._config_digest = hashlib.sha256(
+                config_src.encode()
+            ).hexdigest()
+
+        return [kind, self._config_digest, self._schema_digest,
+                reframe.VERSION, *args]
+
     def update_config(self, config, filename):
+        self._invalidate_option_cache()
         self._sources.append(filename)
         self._update_defs(config, filename)
         nc = copy.deepcopy(config)
@@ -230,6 +336,7 @@ class _SiteConfig:
         return getattr(self._pick_config(), attr)
 
     def set_autodetect_methods(self, methods):
+        self._invalidate_option_cache()
         self._site_config['autodetect_methods'] = list(methods)
 
     @property
@@ -239,9 +346,13 @@ class _SiteConfig:
 
     def add_sticky_option(self, option, value):
         self._sticky_options[option] = value
+        self._sticky_table = _OptionTable(self._sticky_options)
+        self._invalidate_option_cache()
 
     def remove_sticky_option(self, option):
         self._sticky_options.pop(option, None)
+        self._sticky_table = _OptionTable(self._sticky_options)
+        self._invalidate_option_cache()
 
     def is_sticky_option(self, option):
         return option in self._sticky_options
@@ -251,12 +362,39 @@ class _SiteConfig:
         '''Retrieve value of option.
 
         If the option cannot be retrieved, ``default`` will be returned.
+
+        The options are resolved once for each selected system and then
+        cached; the cache is invalidated whenever the configuration or the
+        sticky options change.
         '''
 
         # Options may not start with a slash
         if not option or option[0] == '/':
             return default
 
+        key = (self._local_system, option)
+        try:
+            kind, value = self._option_cache[key]
+        except KeyError:
+            kind, value = self._option_cache[key] = self._resolve(option)
+
+        if kind == 'missing':
+            return default
+        elif kind == 'copy':
+            return _copy_if_mutable(value)
+        else:
+            return value
+
+    def _resolve(self, option):
+        '''Resolve an option path.
+
+        :returns: a tuple of the kind of the resolved value and the value
+            itself. The kind is ``'value'`` if the value comes from the
+            configuration, ``'copy'`` if it comes from the sticky options or
+            the defaults and a copy of it must be returned, and ``'missing'``
+            if the option cannot be resolved.
+        '''
+
         # Remove trailing /
         if option[-1] == '/':
             option = option[:-1]
@@ -320,18 +458,18 @@ class _SiteConfig:
         default_key = '/'.join(default_key)
         try:
             # If a sticky option exists, return that value
-            return _match_option(default_key, self._sticky_options)
+            return 'copy', self._sticky_table.lookup(default_key)
         except KeyError:
             pass
 
         if option_path_invalid:
             # Try the default and return
             try:
-                return _match_option(default_key, self._schema['defaults'])
+                return 'copy', self._defaults_table.lookup(default_key)
             except KeyError:
-                return default
+                return 'missing', None
 
-        return value
+        return 'value', value
 
     @property
     def sources(self):
@@ -371,6 +509,9 @@ class _SiteConfig:
         self.update_config(config, filename)
 
     def load_config_yaml(self, filename):
+        import yaml
+        from jinja2.sandbox import SandboxedEnvironment
+
         bindings = {
             'getenv': os.getenv,
             'gid': os.getgid(),
@@ -483,14 +624,16 @@ class _SiteConfig:
                           f'for the current system: {hostname!r}')
 
     def validate(self):
-        site_config = self._pick_config()
-        try:
-            jsonschema.validate(site_config, self._schema)
-        except jsonschema.ValidationError as e:
-            getlogger().debug(str(e))
-            sources = ', '.join(f'`{f}`' for f in self._sources)
-            raise ConfigError('could not validate configuration files: '
-                              f'{sources}') from e
+        cache_key = self._cache_key('validated', self._local_system)
+        if cache_key is None or self._config_cache.get(cache_key) is None:
+            self._validate_schema()
+            if cache_key is not None:
+                self._config_cache.put(cache_key, True)
+        else:
+            getlogger().debug('Configuration is already validated')
+
+        # The deprecated options are converted below
+        self._invalidate_option_cache()
 
         def _warn_variables(config, opt_path):
             opt_path = '/'.join(opt_path + ['variables'])
@@ -531,6 +674,18 @@ class _SiteConfig:
             opt_path = ['environments', f'@{envname}']
             _warn_variables(env, opt_path)
 
+    def _validate_schema(self):
+        import jsonschema
+
+        site_config = self._pick_config()
+        try:
+            jsonschema.validate(site_config, self._schema)
+        except jsonschema.ValidationError as e:
+            getlogger().debug(str(e))
+            sources = ', '.join(f'`{f}`' for f in self._sources)
+            raise ConfigError('could not validate configuration files: '
+                              f'{sources}') from e
+
     def select_subconfig(self, system_fullname=None,
                          ignore_resolve_errors=False):
         # First look for the current subconfig in the cache; if not found,
@@ -542,6 +697,17 @@ class _SiteConfig:
         if system_fullname in self._subconfigs:
             return
 
+        cache_key = self._cache_key('subconfig', system_fullname,
+                                    ignore_resolve_errors)
+        if cache_key is not None:
+            local_config = self._config_cache.get(cache_key)
+            if local_config is not None:
+                getlogger().debug2(
+                    f'Loaded subconfig for {system_fullname!r} from cache'
+                )
+                self._subconfigs[system_fullname] = local_config
+                return
+
         try:
             system_name, part_name = system_fullname.split(':', maxsplit=1)
         except ValueError:
@@ -590,7 +756,7 @@ class _SiteConfig:
                 target_systems = obj.get(
                     'target_systems',
                     _match_option(f'{name}/target_systems',
-                                  self._schema['defaults'])
+                                  self._defaults_table)
                 )
                 try:
                     key = obj['name']
@@ -664,6 +830,8 @@ class _SiteConfig:
                 )
 
         self._subconfigs[system_fullname] = local_config
+        if cache_key is not None:
+            self._config_cache.put(cache_key, local_config)
 
 
 def find_config_files(config_path=None, config_file=None):
@@ -692,8 +860,16 @@ def find_config_files(config_path=None, config_file=None):
     return res
 
 
-def load_config(*filenames):
-    ret = _SiteConfig()
+def load_config(*filenames, cache_dir=None):
+    '''Load the configuration from the given files.
+
+    :arg filenames: The configuration files to load.
+    :arg cache_dir: If not :obj:`None`, the validated configurations and the
+        resolved subconfigurations are cached in this directory and they are
+        reused as long as the configuration does not change.
+    '''
+
+    ret = _SiteConfig(cache_dir)
     getlogger().debug('Loading the builtin configuration')
     ret.update_config(settings.site_configuration, '<builtin>')
     for f in filenames:
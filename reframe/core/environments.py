@@ -58,6 +58,10 @@ class Environment(jsonext.JSONSerializable):
         self._features = features or []
         self._prepare_cmds = prepare_cmds or []
 
+    def __deepcopy__(self, memo):
+        # Environments are read-only, so they can be shared
+        return self
+
     @property
     def name(self):
         '''The name of this environment.
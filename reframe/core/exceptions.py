@@ -8,7 +8,6 @@
 #
 
 import inspect
-import jsonschema
 import os
 import sys
 
@@ -56,7 +55,11 @@ class ReframeBaseError(BaseException):
     def __str__(self):
         ret = self._message or ''
         if self.__cause__ is not None:
-            if isinstance(self.__cause__, jsonschema.ValidationError):
+            # Do not import `jsonschema` only for this check; if it is not
+            # loaded, the cause cannot be a validation error
+            jsonschema = sys.modules.get('jsonschema')
+            if (jsonschema is not None and
+                isinstance(self.__cause__, jsonschema.ValidationError)):
                 ret += ': ' + self.__cause__.message
             else:
                 ret += ': ' + str(self.__cause__)
@@ -7,6 +7,8 @@
 # Useful descriptors for advanced operations on fields
 #
 
+import weakref
+
 import reframe.utility.typecheck as types
 from reframe.core.warnings import user_deprecation_warning
 from reframe.utility import ScopedDict
@@ -68,6 +70,20 @@ class Field:
         obj.__dict__[self._name] = value
 
 
+# Types of the values, whose type check results are cached
+_CACHEABLE_TYPES = frozenset({type(None), bool, int, float, str, bytes})
+
+# Maximum number of cached type check results per field
+_TYPECHECK_CACHE_SIZE = 256
+
+# Types of the values that are type checked incrementally
+_INCREMENTAL_TYPES = frozenset({list, dict})
+
+# Minimum length of the values that are type checked incrementally; shorter
+# values are cheaper to check again than to keep a snapshot of
+_INCREMENTAL_MIN_LEN = 32
+
+
 class TypedField(Field):
     '''Stores a field of predefined type'''
 
@@ -80,12 +96,78 @@ class TypedField(Field):
             raise TypeError('{0} is not a sequence of types'.
                             format(self._types))
 
+        # Immutable values that have already passed the type check; checking
+        # against some types, e.g., string types with patterns, is expensive
+        self._valid_values = set()
+
+        # The snapshot of the last long list or dictionary that has passed the
+        # type check by the id of the object it was assigned to; if it is
+        # assigned again to the same object, only its elements that were
+        # added or replaced since are checked. Each entry holds a weak
+        # reference to the object, so that it is removed together with the
+        # object.
+        self._snapshots = {}
+
     @property
     def valid_types(self):
         return self._types
 
-    def _check_type(self, value):
-        if not any(isinstance(value, t) for t in self._types):
+    def _forget(self, key, objref):
+        entry = self._snapshots.get(key)
+        if entry is not None and entry[0] is objref:
+            del self._snapshots[key]
+
+    def _save_snapshot(self, obj, value, valid_type, snapshot):
+        key = id(obj)
+        try:
+            objref = weakref.ref(
+                obj, lambda ref: self._forget(key, ref)
+            )
+        except TypeError:
+            # The object does not support weak references
+            return
+
+        self._snapshots[key] = (objref, value, valid_type, snapshot)
+
+    def _revalidate(self, obj, value):
+        last_type, last_snapshot = None, None
+        if obj is not None:
+            try:
+                objref, last_value, t, snapshot = self._snapshots[id(obj)]
+            except KeyError:
+                pass
+            else:
+                if objref() is obj and last_value is value:
+                    last_type, last_snapshot = t, snapshot
+
+        for t in self._types:
+            valid, snapshot = types.revalidate(
+                t, value, last_snapshot if t is last_type else None
+            )
+            if valid:
+                if snapshot is not None and obj is not None:
+                    self._save_snapshot(obj, value, t, snapshot)
+
+                return True
+
+        return False
+
+    def _check_type(self, value, obj=None):
+        cacheable = type(value) in _CACHEABLE_TYPES
+        if cacheable and (type(value), value) in self._valid_values:
+            return
+
+        if (type(value) in _INCREMENTAL_TYPES and
+            len(value) >= _INCREMENTAL_MIN_LEN):
+            valid = self._revalidate(obj, value)
+        else:
+            valid = isinstance(value, self._types)
+
+        if valid:
+            if (cacheable and
+                len(self._valid_values) < _TYPECHECK_CACHE_SIZE):
+                self._valid_values.add((type(value), value))
+        else:
             typedescr = '|'.join(t.__name__ for t in self._types)
             raise TypeError(
                 "failed to set variable '%s': '%s' is not of type '%s'" %
@@ -93,7 +175,7 @@ class TypedField(Field):
 
     def __set__(self, obj, value):
         try:
-            self._check_type(value)
+            self._check_type(value, obj)
         except TypeError as err:
             last_error = err
             raw_value = remove_convertible(value)
@@ -158,7 +240,7 @@ class ScopedDictField(TypedField):
 
     def __set__(self, obj, value):
         value = remove_convertible(value)
-        self._check_type(value)
+        self._check_type(value, obj)
         if not isinstance(value, ScopedDict):
             value = ScopedDict(value) if value is not None else value
 
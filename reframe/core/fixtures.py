@@ -8,7 +8,6 @@
 #
 
 import sys
-import copy
 import itertools
 import traceback
 from collections.abc import Iterable, Mapping
@@ -17,7 +16,6 @@ from hashlib import sha256
 import reframe.core.namespaces as namespaces
 import reframe.core.runtime as runtime
 import reframe.utility.udeps as udeps
-import reframe.utility as utils
 from reframe.core.exceptions import ReframeSyntaxError, what
 from reframe.core.logging import getlogger
 
@@ -74,6 +72,28 @@ class FixtureData:
 
         return sha256(s.encode('utf-8')).hexdigest()[:8]
 
+    def identity(self):
+        '''Return a hashable key identifying the mangled fixture name.
+
+        Fixture data with the same identity key are mashed up to the same
+        name. If the fixture variables are not hashable, :obj:`None` is
+        returned.
+        '''
+        variables = self.variables
+        if not variables:
+            return (self.variant_num, self.scope_enc)
+
+        # The types of the values are part of the key, since values that
+        # compare equal may still be formatted differently in the name
+        key = tuple((k, type(variables[k]), variables[k])
+                    for k in sorted(variables))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+
+        return (self.variant_num, self.scope_enc, key)
+
 
 class FixtureRegistry:
     '''Regression test fixture registry.
@@ -105,15 +125,27 @@ class FixtureRegistry:
     def __init__(self):
         self._registry = dict()
 
-        # Build an index map to access the system partitions
-        sys_part = runtime.runtime().system.partitions
-        self._env_by_part = {
-            p.fullname: {e.name for e in p.environs} for p in sys_part
-        }
-
         # Store the system name for name-mangling purposes
         self._sys_name = runtime.runtime().system.name
 
+        # Index of the mangled fixture names by fixture class and the
+        # identity key of the fixture data; it is shared by all the
+        # registries of the session, since the same fixtures are registered
+        # by every test that uses them
+        self._names = runtime.runtime()._fixture_names
+
+    def _register(self, cls, fixt_data):
+        key = fixt_data.identity()
+        try:
+            name = self._names[cls, key]
+        except KeyError:
+            name = f'{cls.__name__}_{fixt_data.mashup()}'
+            if key is not None:
+                self._names[cls, key] = name
+
+        self._registry[cls][name] = fixt_data
+        return name
+
     def add(self, fixture, variant_num, parent_test):
         '''Register a fixture.
 
@@ -161,19 +193,10 @@ class FixtureRegistry:
 
         cls = fixture.cls
         scope = fixture.scope
-        fname = fixture.cls.variant_name(variant_num)
         variables = fixture.variables
         reg_names = []
         self._registry.setdefault(cls, dict())
 
-        # Mangle the fixture name with the modified variables (sorted by keys)
-        if variables:
-            vname = ''.join(
-                (f'%{k}={utils.toalphanum(str(v))}' for k, v
-                 in sorted(variables.items()))
-            )
-            fname += '_' + sha256(vname.encode('utf-8')).hexdigest()[:8]
-
         # Select only the valid partitions
         try:
             valid_sysenv = runtime.valid_sysenv_comb(
@@ -210,8 +233,7 @@ class FixtureRegistry:
             # Register the fixture
             fixt_data = FixtureData(variant_num, [ename], [pname],
                                     variables, scope, self._sys_name)
-            name = f'{cls.__name__}_{fixt_data.mashup()}'
-            self._registry[cls][name] = fixt_data
+            name = self._register(cls, fixt_data)
             reg_names.append(name)
         elif scope == 'partition':
             for part, environs in valid_sysenv.items():
@@ -226,8 +248,7 @@ class FixtureRegistry:
                 # Register the fixture
                 fixt_data = FixtureData(variant_num, [ename], [pname],
                                         variables, scope, pname)
-                name = f'{cls.__name__}_{fixt_data.mashup()}'
-                self._registry[cls][name] = fixt_data
+                name = self._register(cls, fixt_data)
                 reg_names.append(name)
         elif scope == 'environment':
             for part, environs in valid_sysenv.items():
@@ -238,8 +259,7 @@ class FixtureRegistry:
                     fixt_data = FixtureData(variant_num, [ename], [pname],
                                             variables, scope,
                                             f'{pname}+{ename}')
-                    name = f'{cls.__name__}_{fixt_data.mashup()}'
-                    self._registry[cls][name] = fixt_data
+                    name = self._register(cls, fixt_data)
                     reg_names.append(name)
         elif scope == 'test':
             # The mangled name contains the parent test name.
@@ -249,8 +269,7 @@ class FixtureRegistry:
                                     list(parent_test.valid_prog_environs),
                                     list(parent_test.valid_systems),
                                     variables, scope, parent_test.unique_name)
-            name = f'{cls.__name__}_{fixt_data.mashup()}'
-            self._registry[cls][name] = fixt_data
+            name = self._register(cls, fixt_data)
             reg_names.append(name)
 
         return reg_names
@@ -288,7 +307,7 @@ class FixtureRegistry:
                         ret._registry.setdefault(cls, dict())
                         ret._registry[cls][name] = args
             else:
-                ret._registry[cls] = copy.deepcopy(variants)
+                ret._registry[cls] = dict(variants)
 
         return ret
 
@@ -923,12 +942,19 @@ class FixtureSpace(namespaces.Namespace):
                          ns_name='_rfm_fixture_space',
                          ns_local_name='_rfm_local_fixture_space')
 
-        # Store all fixture variant combinations to allow random access.
-        self.__variant_combinations = tuple(
-            itertools.product(
-                *(list(f.fork_variants for f in self.fixtures.values()))
-            )
-        )
+        # The fixture variant combinations are not stored; they are decoded
+        # from their index on access, since their number is the product of
+        # the forks of all the fixtures.
+        self.__forks = tuple(f.fork_variants for f in self.fixtures.values())
+
+        # The stride of each fixture in the index of a fixture space point
+        self.__strides = []
+        stride = 1
+        for forks in reversed(self.__forks):
+            self.__strides.insert(0, stride)
+            stride *= len(forks)
+
+        self.__size = stride
 
     def join(self, other, cls):
         '''Join other fixture spaces into the current one.
@@ -1028,13 +1054,13 @@ class FixtureSpace(namespaces.Namespace):
 
     def __iter__(self):
         '''Walk through all index combinations for all fixtures.'''
-        yield from self.__variant_combinations
+        yield from itertools.product(*self.__forks)
 
     def __len__(self):
         if not self.fixtures:
             return 1
 
-        return len(self.__variant_combinations)
+        return self.__size
 
     def __getitem__(self, key):
         '''Access an element in the fixture space.
@@ -1047,15 +1073,26 @@ class FixtureSpace(namespaces.Namespace):
         underlying fixture object with that name.
         '''
         if isinstance(key, int):
-            ret = {}
-            f_ids = self.__variant_combinations[key]
-            for i, f in enumerate(self.fixtures):
-                ret[f] = f_ids[i]
-
-            return ret
+            return dict(zip(self.fixtures, self._decode(key)))
 
         return self.fixtures[key]
 
+    def _decode(self, index):
+        '''Return the fixture variants of the point ``index``.'''
+
+        if index < 0:
+            index += self.__size
+
+        if index < 0 or index >= self.__size:
+            raise IndexError('fixture space index out of range')
+
+        ret = []
+        for forks, stride in zip(self.__forks, self.__strides):
+            pos, index = divmod(index, stride)
+            ret.append(forks[pos])
+
+        return tuple(ret)
+
     @property
     def fixtures(self):
         return self._namespace
@@ -15,6 +15,10 @@ def is_dep_hook(func):
     return hasattr(func, '_rfm_resolve_deps')
 
 
+def is_stage_wrapper(func):
+    return hasattr(func, '_rfm_pipeline_stage')
+
+
 def attach_to(phase, always_last):
     '''Backend function to attach a hook to a given phase.
 
@@ -82,34 +86,43 @@ def require_deps(func):
     return _fn
 
 
-def attach_hooks(hooks):
-    '''Attach pipeline hooks to phase ``name''.
+def attach_hooks(stage):
+    '''Attach the pipeline hooks of a test to the pipeline stage ``stage``.
 
     This function returns a decorator for pipeline functions that will run the
-    registered hooks before and after the function.
+    pre- and post-hooks of the stage before and after the function. The hooks
+    are looked up in the ``_rfm_pipeline_hooks`` attribute of the test.
 
-    If ``name'' is :class:`None`, both pre- and post-hooks will run, otherwise
-    only the hooks of the phase ``name'' will be executed.
+    Only the outermost call of a stage runs the hooks; if the stage is
+    overriden and the original one is called through :func:`super`, the hooks
+    will not run again.
     '''
 
+    pre_phase = f'pre_{stage}'
+    post_phase = f'post_{stage}'
+
     def _deco(func):
-        def select_hooks(obj, kind):
-            phase = kind + func.__name__
-            if phase not in hooks:
+        def select_hooks(obj, phase):
+            hooks = obj._rfm_pipeline_hooks.get(phase)
+            if not hooks:
                 return []
 
-            return [h for h in hooks.get(phase, [])
-                    if h.__name__ not in getattr(obj, '_disabled_hooks', [])]
+            disabled = getattr(obj, '_disabled_hooks', [])
+            return [h for h in hooks if h.__name__ not in disabled]
 
         @functools.wraps(func)
         def _fn(obj, *args, **kwargs):
-            for h in select_hooks(obj, 'pre_'):
+            if getattr(type(obj), stage) is not _fn:
+                return func(obj, *args, **kwargs)
+
+            for h in select_hooks(obj, pre_phase):
                 getattr(obj, h.__name__)()
 
             func(obj, *args, **kwargs)
-            for h in select_hooks(obj, 'post_'):
+            for h in select_hooks(obj, post_phase):
                 getattr(obj, h.__name__)()
 
+        _fn._rfm_pipeline_stage = stage
         return _fn
 
     return _deco
@@ -5,16 +5,27 @@
 
 import abc
 import atexit
+import collections
+import contextlib
+import csv
+import gzip
+import io
 import itertools
+import json
+import locale
 import logging
 import logging.handlers
+import math
 import numbers
 import os
+import pickle
+import queue
 import re
-import requests
 import shutil
 import socket
 import sys
+import tempfile
+import threading
 import time
 import urllib
 from datetime import datetime
@@ -149,19 +160,38 @@ def _guess_delim(s):
 class MultiFileHandler(logging.FileHandler):
     '''A file handler that allows writing on different log files based on
     information from the log record.
+
+    At most ``max_open_files`` log files are kept open; the least recently
+    used one is closed when another one needs to be opened. If
+    ``flush_interval`` is positive, the formatted records are buffered and
+    written out at most every ``flush_interval`` seconds and whenever the
+    handler is flushed or closed, otherwise every record is written out
+    immediately. The buffered records of a file are written with a single
+    write under a single acquisition of the file lock.
     '''
 
     def __init__(self, prefix, mode='a', encoding=None, fmt=None,
                  perffmt=None, ignore_keys=None, use_locking=False,
-                 lockfile_mode=None):
+                 lockfile_mode=None, max_open_files=64, flush_interval=0):
         super().__init__(prefix, mode, encoding, delay=True)
 
         # Reset FileHandler's filename
         self.baseFilename = None
         self._prefix = prefix
 
-        # Associates filenames with open streams
-        self.__streams = {}
+        # Associates filenames with open file descriptors in the order that
+        # they were last used
+        self.__fds = collections.OrderedDict()
+        self.__max_open_files = max_open_files
+
+        # The files whose header has been checked
+        self.__files = set()
+
+        # The formatted records of each file that have not been written yet
+        self.__buffers = {}
+        self.__flush_interval = flush_interval
+        self.__flush_timer = None
+        self.__encoding = encoding or locale.getpreferredencoding(False)
 
         # Format specifiers
         self.__fmt = fmt
@@ -223,8 +253,64 @@ class MultiFileHandler(logging.FileHandler):
         basename, _ = os.path.splitext(os.path.basename(logfile))
         return os.path.join(prefix, f'.{basename}.lock')
 
+    def __lock(self, filename):
+        if not self.__use_locking:
+            return contextlib.nullcontext()
+
+        try:
+            rwlock = self.__locks[filename]
+        except KeyError:
+            rwlock = osext.ReadWriteFileLock(self.__lock_file_name(filename),
+                                             self.__lockfile_mode)
+            self.__locks[filename] = rwlock
+
+        return rwlock.write_lock()
+
+    def __reserve_fd(self, filename):
+        # Close the least recently used file, if there is no room for opening
+        # `filename`; this must be called before acquiring the lock of
+        # `filename`, so that the lock of another file is not acquired while
+        # holding it
+        if (filename not in self.__fds and
+            len(self.__fds) >= self.__max_open_files):
+            lru_file = next(iter(self.__fds))
+            self.__write_buffer(lru_file)
+            os.close(self.__fds.pop(lru_file))
+
+    def __fd(self, filename, truncate=False):
+        try:
+            self.__fds.move_to_end(filename)
+            return self.__fds[filename]
+        except KeyError:
+            pass
+
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+        if truncate:
+            flags |= os.O_TRUNC
+
+        fd = os.open(filename, flags, 0o666)
+        self.__fds[filename] = fd
+        return fd
+
+    def __write(self, fd, data):
+        data = memoryview(data.encode(self.__encoding))
+        while data:
+            data = data[os.write(fd, data):]
+
+    def __write_buffer(self, filename):
+        records = self.__buffers.pop(filename, None)
+        if not records:
+            return
+
+        try:
+            self.__reserve_fd(filename)
+            with self.__lock(filename):
+                self.__write(self.__fd(filename), ''.join(records))
+        except OSError as e:
+            raise LoggingError('logging failed') from e
+
     def _emit_header(self, record):
-        if self.baseFilename in self.__streams:
+        if self.baseFilename in self.__files:
             return
 
         record_header = self.__generate_header(record)
@@ -232,44 +318,231 @@ class MultiFileHandler(logging.FileHandler):
         # We are opening a file for the first time;
         # check if the header has changed
         try:
-            header = None
-            with open(self.baseFilename) as fp:
-                header = fp.readline().strip()
-        except FileNotFoundError:
+            self.__reserve_fd(self.baseFilename)
+            with self.__lock(self.baseFilename):
+                try:
+                    with open(self.baseFilename) as fp:
+                        header = fp.readline().strip()
+                except FileNotFoundError:
+                    header = None
+                else:
+                    if header != record_header:
+                        # Header changed; move the old file
+                        hcnt = 0
+                        while os.path.exists(self.baseFilename + f'.h{hcnt}'):
+                            hcnt += 1
+                            continue
+
+                        os.rename(self.baseFilename,
+                                  self.baseFilename + f'.h{hcnt}')
+
+                truncate = 'w' in self.mode
+                fd = self.__fd(self.baseFilename, truncate)
+                if truncate or header != record_header:
+                    self.__write(fd, f'{record_header}\n')
+        except OSError as e:
+            raise LoggingError('logging failed') from e
+
+        self.__files.add(self.baseFilename)
+
+    def emit(self, record):
+        try:
+            dirname = self._prefix % record.__dict__
+            os.makedirs(dirname, exist_ok=True)
+        except KeyError as e:
+            raise LoggingError(f'logging failed: unknown placeholder in '
+                               f'filename pattern: {e}') from None
+        except OSError as e:
+            raise LoggingError('logging failed') from e
+
+        check_basename = type(record.__rfm_check__).variant_name()
+        self.baseFilename = os.path.join(dirname, f'{check_basename}.log')
+        self._emit_header(record)
+        try:
+            msg = self.format(record) + self.terminator
+        except Exception:
+            self.handleError(record)
             return
-        else:
-            if header == record_header:
+
+        self.__buffers.setdefault(self.baseFilename, []).append(msg)
+        if self.__flush_interval <= 0:
+            self.__write_buffer(self.baseFilename)
+        elif self.__flush_timer is None:
+            self.__flush_timer = threading.Timer(self.__flush_interval,
+                                                 self.__flush_timeout)
+            self.__flush_timer.daemon = True
+            self.__flush_timer.start()
+
+    def __flush_timeout(self):
+        try:
+            self.flush()
+        except LoggingError as e:
+            getlogger().error(f'could not log records: {e}')
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self.__flush_timer:
+                self.__flush_timer.cancel()
+                self.__flush_timer = None
+
+            for filename in list(self.__buffers):
+                self.__write_buffer(filename)
+        finally:
+            self.release()
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            # Close all open files
+            for fd in self.__fds.values():
+                os.close(fd)
+
+            self.__fds.clear()
+            super().close()
+
+
+class ColumnarFileHandler(logging.Handler):
+    '''A handler that stores the performance values of the tests in typed
+    CSV files.
+
+    Each record is stored as one row per performance variable with the fixed
+    set of :attr:`COLUMNS`, so that the files can be loaded efficiently as
+    data frames with :func:`reframe.frontend.reporting.load_perflogs`. The
+    files are partitioned by test in the directories generated from
+    ``prefix`` and the name and type of their columns are stored in a JSON
+    schema file next to each of them.
+
+    All the rows of a record are appended to a file with a single write, so
+    that multiple processes may log to the same files concurrently.
+    '''
+
+    #: The columns of the performance log files and their data types
+    COLUMNS = (
+        ('job_completion_time', 'Float64'),
+        ('system', 'String'),
+        ('partition', 'String'),
+        ('environ', 'String'),
+        ('name', 'String'),
+        ('display_name', 'String'),
+        ('jobid', 'String'),
+        ('result', 'String'),
+        ('pvar', 'String'),
+        ('pval', 'Float64'),
+        ('pref', 'Float64'),
+        ('plower', 'Float64'),
+        ('pupper', 'Float64'),
+        ('punit', 'String'),
+        ('presult', 'String')
+    )
+
+    #: The check fields used by the handler
+    CHECK_FIELDS = frozenset({
+        'check_job_completion_time_unix', 'check_system', 'check_partition',
+        'check_environ', 'check_name', 'check_display_name', 'check_jobid',
+        'check_result', 'check_perfvalues'
+    })
+
+    def __init__(self, prefix, append=True):
+        super().__init__()
+        self._prefix = prefix
+        self._append = append
+
+        # The files whose schema has been checked
+        self._files = set()
+        self._schema = {
+            'columns': [{'name': name, 'type': dtype}
+                        for name, dtype in self.COLUMNS]
+        }
+
+    @staticmethod
+    def schema_filename(filename):
+        '''Return the name of the schema file of the CSV file ``filename``.'''
+
+        return os.path.splitext(filename)[0] + '.schema.json'
+
+    def _check_schema(self, filename):
+        if filename in self._files:
+            return
+
+        schema_file = self.schema_filename(filename)
+        if self._append and os.path.exists(filename):
+            try:
+                with open(schema_file) as fp:
+                    schema = json.load(fp)
+            except (OSError, json.JSONDecodeError):
+                schema = None
+
+            if schema == self._schema:
+                self._files.add(filename)
                 return
 
-            # Header changed; move the old file
+            # Schema changed; move the old files
             hcnt = 0
-            while os.path.exists(self.baseFilename + f'.h{hcnt}'):
+            while os.path.exists(filename + f'.h{hcnt}'):
                 hcnt += 1
+
+            os.rename(filename, filename + f'.h{hcnt}')
+            if os.path.exists(schema_file):
+                os.rename(schema_file, schema_file + f'.h{hcnt}')
+
+        with open(schema_file, 'w') as fp:
+            json.dump(self._schema, fp, indent=2)
+
+        with open(filename, 'w', encoding='utf-8', newline='') as fp:
+            csv.writer(fp, lineterminator='\n').writerow(
+                name for name, _ in self.COLUMNS
+            )
+
+        self._files.add(filename)
+
+    def _rows(self, record):
+        def _float(val):
+            if isinstance(val, numbers.Real) and not isinstance(val, bool):
+                return float(val)
+
+            return None
+
+        if getattr(record, 'check_perf_var', None) is not None:
+            # Multiline performance logging: one variable per record
+            perfvalues = {
+                record.check_perf_var: (
+                    record.check_perf_value, record.check_perf_ref,
+                    record.check_perf_lower_thres,
+                    record.check_perf_upper_thres,
+                    record.check_perf_unit, record.check_perf_result
+                )
+            }
+        else:
+            perfvalues = getattr(record, 'check_perfvalues', None) or {}
+
+        common = [
+            _float(getattr(record, 'check_job_completion_time_unix', None)),
+            getattr(record, 'check_system', None),
+            getattr(record, 'check_partition', None),
+            getattr(record, 'check_environ', None),
+            getattr(record, 'check_name', None),
+            getattr(record, 'check_display_name', None),
+            getattr(record, 'check_jobid', None),
+            getattr(record, 'check_result', None)
+        ]
+        for var, info in perfvalues.items():
+            val, ref, lower, upper, unit, result = info
+            if val is None:
+                # Ignore `None` performance values
+                # (performance tests that failed sanity)
                 continue
 
-            os.rename(self.baseFilename, self.baseFilename + f'.h{hcnt}')
-        finally:
-            if self.__use_locking:
-                # When using locking, we need to  open, append and write to
-                # the file at once
-                rwlock = osext.ReadWriteFileLock(self.__lock_file_name(),
-                                                 self.__lockfile_mode)
-                with rwlock.write_lock():
-                    with open(self.baseFilename, mode=self.mode,
-                              encoding=self.encoding) as fp:
-                        if record_header != header:
-                            fp.write(f'{record_header}\n')
-
-                self.__streams[self.baseFilename] = None
-                self.__locks[self.baseFilename] = rwlock
+            ref = _float(ref)
+            if ref is not None:
+                lower = ref * (1 + lower) if lower is not None else -math.inf
+                upper = ref * (1 + upper) if upper is not None else math.inf
             else:
-                # Open the file for writing and write the header
-                fp = open(self.baseFilename,
-                          mode=self.mode, encoding=self.encoding)
-                if record_header != header:
-                    fp.write(f'{record_header}\n')
+                lower = upper = None
 
-                self.__streams[self.baseFilename] = fp
+            yield common + [var.split(':')[-1], _float(val), ref,
+                            _float(lower), _float(upper), unit, result]
 
     def emit(self, record):
         try:
@@ -282,24 +555,24 @@ class MultiFileHandler(logging.FileHandler):
             raise LoggingError('logging failed') from e
 
         check_basename = type(record.__rfm_check__).variant_name()
-        self.baseFilename = os.path.join(dirname, f'{check_basename}.log')
-        self._emit_header(record)
-        if self.__use_locking:
-            with self.__locks[self.baseFilename].write_lock():
-                with open(self.baseFilename, mode=self.mode,
-                          encoding=self.encoding) as fp:
-                    self.stream = fp
-                    super().emit(record)
-        else:
-            self.stream = self.__streams[self.baseFilename]
-            super().emit(record)
+        filename = os.path.join(dirname, f'{check_basename}.csv')
+        data = io.StringIO()
+        csv.writer(data, lineterminator='\n').writerows(self._rows(record))
+        if not data.tell():
+            return
 
-    def close(self):
-        # Close all open streams
-        for stream in self.__streams.values():
-            if stream:
-                self.stream = stream
-                super().close()
+        try:
+            self._check_schema(filename)
+            fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+                         0o666)
+            try:
+                data = memoryview(data.getvalue().encode('utf-8'))
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+        except OSError as e:
+            raise LoggingError('logging failed') from e
 
 
 def _format_time_rfc3339(timestamp, datefmt):
@@ -345,9 +618,20 @@ class CheckFieldFormatter(logging.Formatter):
         self.__specs = re.findall(r'\%\((\S+?)\)s', fmt)
         self.__delim = perffmt[-1] if perffmt else ''
         self.__expand_vars = '%(check_#ALL)s' in self.__fmt
+        if self.__expand_vars:
+            self.__check_fields = None
+        else:
+            self.__check_fields = {s for s in self.__specs
+                                   if s.startswith('check_')}
         self.__expanded_fmt = {}
         self.__ignore_keys = set(ignore_keys) if ignore_keys else set()
 
+    @property
+    def check_fields(self):
+        '''The check fields used by the format or :obj:`None` if all the
+        check fields are used.'''
+        return self.__check_fields
+
     def _expand_fmt(self, record):
         if not self.__expand_vars:
             return self.__fmt
@@ -426,6 +710,7 @@ def _create_logger(site_config, *handlers_groups):
     logger.setLevel(_log_level_values[level])
 
     def stream_handler_kind(handler):
+        handler = _unwrap(handler)
         if not isinstance(handler, logging.StreamHandler):
             return None
         elif handler.stream is sys.stdout:
@@ -447,9 +732,39 @@ def _create_logger(site_config, *handlers_groups):
 
             logger.addHandler(handler)
 
+    logger.check_fields = _check_fields(logger.handlers)
     return logger
 
 
+def _check_fields(handlers):
+    '''Return the check fields used by any of the handlers.
+
+    If any handler may use any check field, e.g., because it logs the whole
+    record, :obj:`None` is returned.
+    '''
+
+    fields = set()
+    for hdlr in map(_unwrap, handlers):
+        if isinstance(hdlr, ColumnarFileHandler):
+            fields |= hdlr.CHECK_FIELDS
+        elif (isinstance(hdlr, (logging.StreamHandler,
+                                logging.handlers.SysLogHandler)) and
+              isinstance(hdlr.formatter, CheckFieldFormatter) and
+              hdlr.formatter.check_fields is not None):
+            fields |= hdlr.formatter.check_fields
+        else:
+            return None
+
+        if isinstance(hdlr, (MultiFileHandler, ColumnarFileHandler)):
+            # The filename pattern may also use check fields
+            fields.update(re.findall(r'\%\((check_\S+?)\)s', hdlr._prefix))
+
+    if 'check_job_completion_time' in fields:
+        fields.add('check_job_completion_time_unix')
+
+    return fields
+
+
 # Registry for log handler creation functions
 _create_handlers = {}
 
@@ -500,11 +815,26 @@ def _create_filelog_handler(site_config, config_prefix):
     if lockfile_mode is not None:
         lockfile_mode = int(lockfile_mode, base=8)
 
+    max_open_files = site_config.get(f'{config_prefix}/max_open_files')
+    flush_interval = site_config.get(f'{config_prefix}/flush_interval')
     return MultiFileHandler(filename_patt, mode='a+' if append else 'w+',
                             fmt=format, perffmt=format_perf,
                             ignore_keys=ignore_keys,
                             use_locking=use_locking,
-                            lockfile_mode=lockfile_mode)
+                            lockfile_mode=lockfile_mode,
+                            max_open_files=max_open_files,
+                            flush_interval=flush_interval)
+
+
+@register_log_handler('columnar')
+def _create_columnar_handler(site_config, config_prefix):
+    basedir = os.path.abspath(os.path.join(
+        site_config.get('systems/0/prefix'),
+        osext.expandvars(site_config.get(f'{config_prefix}/basedir'))
+    ))
+    prefix  = osext.expandvars(site_config.get(f'{config_prefix}/prefix'))
+    append = site_config.get(f'{config_prefix}/append')
+    return ColumnarFileHandler(os.path.join(basedir, prefix), append=append)
 
 
 @register_log_handler('syslog')
@@ -604,6 +934,9 @@ def _create_httpjson_handler(site_config, config_prefix):
     debug = site_config.get(f'{config_prefix}/debug')
     backoff_intervals = site_config.get(f'{config_prefix}/backoff_intervals')
     retry_timeout = site_config.get(f'{config_prefix}/retry_timeout')
+    batch_size = site_config.get(f'{config_prefix}/batch_size')
+    batch_timeout = site_config.get(f'{config_prefix}/batch_timeout')
+    compress = site_config.get(f'{config_prefix}/compress')
 
     parsed_url = urllib.parse.urlparse(url)
     if parsed_url.scheme not in {'http', 'https'}:
@@ -646,7 +979,8 @@ def _create_httpjson_handler(site_config, config_prefix):
 
     return HTTPJSONHandler(url, extras, ignore_keys, json_formatter,
                            authorization_header, extra_headers, debug,
-                           backoff_intervals, retry_timeout)
+                           backoff_intervals, retry_timeout,
+                           batch_size, batch_timeout, compress)
 
 
 def _record_to_json(record, extras, ignore_keys):
@@ -698,8 +1032,18 @@ class HTTPJSONHandler(logging.Handler):
     def __init__(self, url, extras=None, ignore_keys=None,
                  json_formatter=None,
                  authorization_header=None, extra_headers=None,
-                 debug=False, backoff_intervals=(1, 2, 3), retry_timeout=0):
+                 debug=False, backoff_intervals=(1, 2, 3), retry_timeout=0,
+                 batch_size=1, batch_timeout=0, compress=False):
         super().__init__()
+
+        # The JSON records of the current batch and the timer that will send
+        # it, if it is not filled up in time
+        self._batch = []
+        self._batch_timer = None
+
+        # The HTTP session is created on first use, so that `requests` is
+        # not imported unless needed
+        self._session = None
         self._url = url
         self._extras = extras
         self._ignore_keys = self.LOG_ATTRS
@@ -716,7 +1060,8 @@ class HTTPJSONHandler(logging.Handler):
                 "it must be 'json_formatter(record, extras, ignore_keys)'"
             )
 
-        if not is_trivially_callable(authorization_header):
+        if (authorization_header is not None and
+            not is_trivially_callable(authorization_header)):
             raise ConfigError(
                 "httpjson: 'authorization_header' has the wrong signature: "
                 "it must be 'authorization_header()'"
@@ -732,6 +1077,9 @@ class HTTPJSONHandler(logging.Handler):
         self._debug = debug
         self._timeout = retry_timeout
         self._backoff_intervals = backoff_intervals
+        self._batch_size = batch_size
+        self._batch_timeout = batch_timeout
+        self._compress = compress
 
     def emit(self, record):
         # Convert tags to a list to make them JSON friendly
@@ -742,26 +1090,79 @@ class HTTPJSONHandler(logging.Handler):
         if json_record is None:
             return
 
+        if self._batch_size <= 1:
+            self._send(json_record)
+            return
+
+        self._batch.append(json_record)
+        if len(self._batch) >= self._batch_size:
+            self._send_batch()
+        elif self._batch_timer is None and self._batch_timeout:
+            self._batch_timer = threading.Timer(self._batch_timeout,
+                                                self._send_batch_timeout)
+            self._batch_timer.daemon = True
+            self._batch_timer.start()
+
+    def _send_batch(self):
+        if self._batch_timer:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+
+        if not self._batch:
+            return
+
+        # Send the batch as newline-delimited JSON
+        batch, self._batch = self._batch, []
+        self._send(''.join(f'{r}\n' for r in batch),
+                   content_type='application/x-ndjson')
+
+    def _send_batch_timeout(self):
+        self.acquire()
+        try:
+            self._send_batch()
+        except LoggingError as e:
+            getlogger().error(f'could not log records: {e}')
+        finally:
+            self.release()
+
+    def _send(self, data, content_type=None):
         if self._debug:
             ts = int(time.time() * 1_000)
-            dump_file = f'httpjson_record_{ts}.json'
+            if content_type is None:
+                dump_file = f'httpjson_record_{ts}.json'
+            else:
+                dump_file = f'httpjson_batch_{ts}.ndjson'
+
             with open(dump_file, 'w') as fp:
-                fp.write(json_record)
+                fp.write(data)
 
             return
 
         if self._authorization_header is not None:
             self._headers['Authorization'] = self._authorization_header()
 
+        headers = self._headers
+        if content_type is not None:
+            headers = {**headers, 'Content-type': content_type}
+
+        data = data.encode('utf-8')
+        if self._compress:
+            data = gzip.compress(data)
+            headers = {**headers, 'Content-Encoding': 'gzip'}
+
         timeout_time = time.time() + self._timeout
 
+        import requests
+
+        if self._session is None:
+            # Reuse the connections to the server
+            self._session = requests.Session()
+
         try:
             backoff_intervals = itertools.cycle(self._backoff_intervals)
             while True:
-                response = requests.post(
-                    self._url, data=json_record,
-                    headers=self._headers
-                )
+                response = self._session.post(self._url, data=data,
+                                              headers=headers)
                 if response.ok:
                     break
 
@@ -777,6 +1178,138 @@ class HTTPJSONHandler(logging.Handler):
         except requests.exceptions.RequestException as e:
             raise LoggingError('logging failed') from e
 
+    def flush(self):
+        self.acquire()
+        try:
+            self._send_batch()
+        except LoggingError as e:
+            getlogger().error(f'could not log records: {e}')
+        finally:
+            self.release()
+
+    def close(self):
+        try:
+            self.flush()
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+        finally:
+            super().close()
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    def enqueue_sentinel(self):
+        # Wait for the queue to have space, since it may be bounded
+        self.queue.put(self._sentinel)
+
+    def handle(self, record):
+        try:
+            super().handle(record)
+        except Exception as e:
+            # The error cannot be raised from the listener thread and it must
+            # not stop it, so we only report it
+            getlogger().error(f'could not log record: {e}')
+
+
+class QueuedHandler(logging.handlers.QueueHandler):
+    '''Emit records through another handler from a background thread.
+
+    Records are put in a bounded queue, which a
+    :class:`~logging.handlers.QueueListener` thread drains by passing each
+    record to the wrapped handler, so that slow handlers, e.g., handlers
+    sending records over the network, do not block the logging thread.
+
+    :arg handler: The handler to wrap.
+    :arg maxsize: The maximum number of records in the queue; if ``0``, the
+        queue is unbounded.
+    :arg overflow: What to do when the queue is full: ``'block'`` until
+        there is space in the queue, ``'drop'`` the record or ``'spill'`` it
+        to a temporary file. Spilled records are emitted when the handler is
+        closed, after all the queued records.
+
+    The level of this handler replaces that of the wrapped handler. Closing
+    this handler emits any pending records and closes the wrapped handler.
+    '''
+
+    OVERFLOW_POLICIES = ('block', 'drop', 'spill')
+
+    def __init__(self, handler, maxsize=0, overflow='block'):
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f'invalid overflow policy: {overflow!r}')
+
+        super().__init__(queue.Queue(maxsize))
+        self.handler = handler
+        self._overflow = overflow
+        self._spill_file = None
+        self._listener = _QueueListener(self.queue, handler)
+        self._listener.start()
+        self._closed = False
+
+    def enqueue(self, record):
+        if threading.current_thread() is self._listener._thread:
+            # Records logged by the wrapped handler itself must not wait for
+            # the listener
+            self.handler.handle(record)
+        elif self._overflow == 'block':
+            self.queue.put(record)
+        else:
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                if self._overflow == 'drop':
+                    getprofiler().increment('log records dropped')
+                else:
+                    self._spill(record)
+
+    def _spill(self, record):
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(prefix='rfm-log-')
+
+        pickle.dump(record, self._spill_file)
+        getprofiler().increment('log records spilled')
+
+    def _unspill(self):
+        if self._spill_file is None:
+            return
+
+        with self._spill_file as fp:
+            fp.seek(0)
+            while True:
+                try:
+                    record = pickle.load(fp)
+                except EOFError:
+                    break
+
+                self._listener.handle(record)
+
+        self._spill_file = None
+
+    def flush(self):
+        if not self._closed:
+            self.queue.join()
+
+        self.handler.flush()
+
+    def close(self):
+        self.acquire()
+        try:
+            if not self._closed:
+                self._closed = True
+                self._listener.stop()
+                self._unspill()
+                self.handler.close()
+        finally:
+            self.release()
+
+        super().close()
+
+
+def _unwrap(handler):
+    if isinstance(handler, QueuedHandler):
+        return handler.handler
+
+    return handler
+
 
 def _extract_handlers(site_config, handlers_group):
     handler_prefix = f'logging/0/{handlers_group}'
@@ -806,6 +1339,16 @@ def _extract_handlers(site_config, handlers_group):
                                            datefmt=datefmt, perffmt=perffmt,
                                            ignore_keys=ignore_keys))
         hdlr.setLevel(_check_level(level))
+        if site_config.get(f'{handler_prefix}/{i}/queue_enable'):
+            hdlr = QueuedHandler(
+                hdlr,
+                maxsize=site_config.get(f'{handler_prefix}/{i}/queue_size'),
+                overflow=site_config.get(
+                    f'{handler_prefix}/{i}/queue_overflow'
+                )
+            )
+            hdlr.setLevel(_check_level(level))
+
         hdlr._rfm_type = handler_type
         handlers.append(hdlr)
 
@@ -819,6 +1362,9 @@ class Logger(logging.Logger):
         super().__init__(name, logging.NOTSET)
         self.level = _check_level(level)
 
+        # The check fields used by the handlers; `None` means all fields
+        self.check_fields = None
+
     def setLevel(self, level):
         self.level = _check_level(level)
 
@@ -903,6 +1449,7 @@ class LoggerAdapter(logging.LoggerAdapter):
             }
         )
         self.check = check
+        self._check_attrs = None
         self.colorize = False
         self.warn_as_error = False
 
@@ -917,15 +1464,33 @@ class LoggerAdapter(logging.LoggerAdapter):
         else:
             return []
 
+    def _loggable_attrs(self):
+        if self._check_attrs is None:
+            self._check_attrs = [
+                (attr, f'check_{alt_name or attr}')
+                for attr, alt_name in type(self.check).loggable_attrs()
+            ]
+            self.extra['__rfm_loggable_attrs__'] = [
+                key for _, key in self._check_attrs
+            ]
+
+        return self._check_attrs
+
     def _update_check_extras(self):
-        '''Return a dictionary with all the check-specific information.'''
+        '''Update the check-specific information of the log records.
+
+        Only the check fields that are used by the handlers of the logger are
+        updated.
+        '''
 
         if self.check is None:
             return
 
         check_type = type(self.check)
-        for attr, alt_name in check_type.loggable_attrs():
-            extra_name  = alt_name or attr
+        fields = getattr(self.logger, 'check_fields', None)
+        for attr, key in self._loggable_attrs():
+            if fields is not None and key not in fields:
+                continue
 
             with suppress_deprecations():
                 # In case of AttributeError, i.e., the variable is undefined,
@@ -936,15 +1501,16 @@ class LoggerAdapter(logging.LoggerAdapter):
                 # Attribute is parameter, so format it
                 val = check_type.raw_params[attr].format(val)
 
-            key = f'check_{extra_name}'
-            self.extra['__rfm_loggable_attrs__'].append(key)
             self.extra[key] = val
 
         # Add special extras
-        self.extra['check_info'] = self.check.info()
-        self.extra['check_job_completion_time'] = _format_time_rfc3339(
-            self.extra['check_job_completion_time_unix'], r'%FT%T%:z'
-        )
+        if fields is None or 'check_info' in fields:
+            self.extra['check_info'] = self.check.info()
+
+        if fields is None or 'check_job_completion_time' in fields:
+            self.extra['check_job_completion_time'] = _format_time_rfc3339(
+                self.extra['check_job_completion_time_unix'], r'%FT%T%:z'
+            )
 
     def log_result(self, level, task, msg=None, multiline=False):
         if self.check is None:
@@ -1104,7 +1670,7 @@ def configure_logging(site_config, warn_as_error=False):
 
 
 def log_files():
-    return [hdlr.baseFilename for hdlr in _logger.handlers
+    return [hdlr.baseFilename for hdlr in map(_unwrap, _logger.handlers)
             if isinstance(hdlr, logging.FileHandler)]
 
 
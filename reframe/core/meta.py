@@ -99,7 +99,8 @@ class RegressionTestMeta(type):
                 self._namespace[key] = value
 
             # Register functions decorated with either @sanity_function or
-            # @performance_variables or @performance_function decorators.
+            # @performance_variables or @performance_function or
+            # @early_failure decorators.
             if hasattr(value, '_rfm_sanity_fn'):
                 try:
                     super().__setitem__('_rfm_sanity', value)
@@ -119,6 +120,14 @@ class RegressionTestMeta(type):
                         f"performance function '{key}()' has already been "
                         "defined", with_code_context=True
                     ) from None
+            elif hasattr(value, '_rfm_early_failure_fn'):
+                try:
+                    self['_rfm_early_failure_fns'][key] = value
+                except KeyError:
+                    raise ReframeSyntaxError(
+                        f"early failure check '{key}()' has already been "
+                        "defined", with_code_context=True
+                    ) from None
 
             # Register the final methods
             if hasattr(value, '_rfm_final'):
@@ -282,6 +291,7 @@ class RegressionTestMeta(type):
         namespace['_rfm_hook_registry'] = hooks.HookRegistry()
         namespace['_rfm_local_hook_registry'] = hooks.HookRegistry()
         namespace['_rfm_perf_fns'] = namespaces.LocalNamespace()
+        namespace['_rfm_early_failure_fns'] = namespaces.LocalNamespace()
 
         def bind(fn, name=None):
             '''Directive to bind a free function to a class.
@@ -375,6 +385,13 @@ class RegressionTestMeta(type):
 
         cls._rfm_hook_registry.update(cls._rfm_local_hook_registry)
 
+        # Install the pipeline stage wrappers that run the pipeline hooks;
+        # stages that are already wrapped in a base class are inherited as-is
+        for stage in getattr(cls, '_rfm_pipeline_stages', ()):
+            fn = getattr(cls, stage)
+            if not hooks.is_stage_wrapper(fn):
+                setattr(cls, stage, hooks.attach_hooks(stage)(fn))
+
         # Search the bases if no local sanity functions exist.
         if '_rfm_sanity' not in namespace:
             for base in cls._rfm_bases:
@@ -403,6 +420,16 @@ class RegressionTestMeta(type):
                     except KeyError:
                         '''Performance function overridden by other class'''
 
+        # Update the early failure checks with the bases.
+        for base in cls._rfm_bases:
+            for k, v in base._rfm_early_failure_fns.items():
+                if k not in namespace:
+                    try:
+                        cls._rfm_early_failure_fns[k] = v
+                    except KeyError:
+                        # Check inherited from a previous base
+                        pass
+
         # Add the final functions from its parents
         cls._rfm_final_methods.update(
             *(b._rfm_final_methods for b in cls._rfm_bases)
@@ -491,11 +518,12 @@ class RegressionTestMeta(type):
 
         # Inject fixture proxies to give access to fixture parameters during
         # the init phase
-        varinfo = cls.get_variant_info(variant_num, recurse=True)
-        for fname, finfo in varinfo['fixtures'].items():
-            fixt = cls.fixture_space[fname]
-            if fixt.action != 'join':
-                setattr(obj, fname, fixtures.FixtureProxy(finfo))
+        if cls._rfm_fixture_space.fixtures:
+            varinfo = cls.get_variant_info(variant_num, recurse=True)
+            for fname, finfo in varinfo['fixtures'].items():
+                fixt = cls.fixture_space[fname]
+                if fixt.action != 'join':
+                    setattr(obj, fname, fixtures.FixtureProxy(finfo))
 
         obj.__init__(*args, **kwargs)
         if reset_sysenv & 1:
@@ -738,13 +766,13 @@ class RegressionTestMeta(type):
         # system. The inner_variants only contain the variants filtered in the
         # range of [0, len(cls.param_space)), so we use this "mask" to compute
         # the full variant indices in the range [0, cls.num_variants).
-        outer_variants = []
         param_space_size = len(cls.param_space)
-        for i in range(cls.num_variants // param_space_size):
-            outer_variants += map(lambda x: x + param_space_size*i,
-                                  inner_variants)
+        num_outer = cls.num_variants // param_space_size
+        if num_outer == 1:
+            return inner_variants
 
-        return outer_variants
+        return [x + param_space_size*i
+                for i in range(num_outer) for x in inner_variants]
 
     def get_variant_info(cls, variant_num, *, recurse=False, max_depth=None,
                          **kwargs):
@@ -872,6 +900,41 @@ class RegressionTestMeta(type):
 
         return name
 
+    def _variant_display_name(cls, variant_num=None):
+        '''Return the display name of a test variant.
+
+        The display name encodes the parameter values of the variant and
+        those of its fixtures, so that it can be computed without
+        instantiating the test.
+
+        :param variant_num: An integer in the range of
+            ``[0, cls.num_variants)``.
+        '''
+
+        def _format_params(cls, info, prefix=' %'):
+            name = ''
+            raw_params = cls.raw_params
+            for p, v in info['params'].items():
+                format_fn = raw_params[p].format
+                name += f'{prefix}{p}={format_fn(v)}'
+
+            fixture_space = cls.fixture_space
+            for f, v in info['fixtures'].items():
+                fixt = fixture_space[f]
+                if fixt.action == 'join':
+                    continue
+
+                name += _format_params(fixt.cls, v, f'{prefix}{f}.')
+
+                # Append any variables set for the fixtures
+                for var, val in fixt.variables.items():
+                    name += f'{prefix}{f}.{var}={val}'
+
+            return name
+
+        variant_info = cls.get_variant_info(variant_num, recurse=True)
+        return cls.__name__ + _format_params(cls, variant_info)
+
     def loggable_attrs(cls):
         '''Get the loggable attributes of this class.'''
         loggable_vars = [(name, None) for name, var in cls.var_space.items()
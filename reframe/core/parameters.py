@@ -242,9 +242,13 @@ class ParamSpace(namespaces.Namespace):
     class that the parameter space is being built for. If no target class is
     provided, the parameter space is initialized as empty.
 
-    All the parameter combinations are stored under ``__param_combinations``.
-    This enables random-access to any of the available parameter combinations
-    through the ``__getitem__`` method.
+    The parameter combinations are not stored. Instead, each point of the
+    parameter space is addressed by an index, whose digits in a mixed-radix
+    number system are the indices of the parameter values; the last
+    parameter is the least significant digit, so that the points are ordered
+    as in the Cartesian product of the parameter values. This enables
+    random-access to any of the available parameter combinations through the
+    ``__getitem__`` method without materializing the parameter space.
     '''
 
     def __init__(self, target_cls=None, illegal_names=None):
@@ -252,12 +256,19 @@ class ParamSpace(namespaces.Namespace):
                          ns_name='_rfm_param_space',
                          ns_local_name='_rfm_local_param_space')
 
-        # Store all param combinations to allow random access.
-        self.__param_combinations = tuple(
-            itertools.product(
-                *(copy.deepcopy(p.values) for p in self.params.values())
-            )
-        )
+        # Store a copy of the parameter values, so that the instances cannot
+        # modify the class parameter space
+        self.__values = tuple(copy.deepcopy(p.values)
+                              for p in self.params.values())
+
+        # The stride of each parameter in the index of a parameter space point
+        self.__strides = []
+        stride = 1
+        for values in reversed(self.__values):
+            self.__strides.insert(0, stride)
+            stride *= len(values)
+
+        self.__size = stride
 
         # Map the parameter names to the position they are stored in the
         # parameter space
@@ -338,7 +349,7 @@ class ParamSpace(namespaces.Namespace):
         if self.params and params_index is not None:
             try:
                 # Get the parameter values for the specified variant
-                param_values = self.__param_combinations[params_index]
+                param_values = self._decode(params_index)
             except IndexError:
                 raise RuntimeError(
                     f'parameter space index out of range for '
@@ -378,7 +389,7 @@ class ParamSpace(namespaces.Namespace):
 
         :return: generator object to iterate over the parameter space.
         '''
-        yield from self.__param_combinations
+        yield from itertools.product(*self.__values)
 
     def __len__(self):
         '''Returns the number of all possible parameter combinations.
@@ -394,10 +405,7 @@ class ParamSpace(namespaces.Namespace):
         :return: length of the parameter space
 
         '''
-        if not self.params:
-            return 1
-
-        return len(self.__param_combinations)
+        return self.__size
 
     def __getitem__(self, key):
         '''Access an element in the parameter space.
@@ -413,18 +421,29 @@ class ParamSpace(namespaces.Namespace):
 
         '''
         if isinstance(key, int):
-            ret = {}
-            val = self.__param_combinations[key]
-            for i, name in enumerate(self.params):
-                ret[name] = val[i]
-
-            return ret
+            return dict(zip(self.params, self._decode(key)))
 
         try:
             return self.params[key].values
         except KeyError:
             return ()
 
+    def _decode(self, index):
+        '''Return the parameter values of the point ``index``.'''
+
+        if index < 0:
+            index += self.__size
+
+        if index < 0 or index >= self.__size:
+            raise IndexError('parameter space index out of range')
+
+        ret = []
+        for values, stride in zip(self.__values, self.__strides):
+            pos, index = divmod(index, stride)
+            ret.append(values[pos])
+
+        return tuple(ret)
+
     def is_empty(self):
         return self.params == {}
 
@@ -435,13 +454,21 @@ class ParamSpace(namespaces.Namespace):
         parameter names to apply the filtering on and the values are functions
         that expect the parameter's value as the sole argument.
 
+        Each condition is evaluated once for every value of its parameter and
+        the indices of the matching points are generated directly from the
+        matching values of each parameter, without visiting the rest of the
+        parameter space. If NumPy is available, large sets of indices are
+        generated with NumPy.
+
         :returns: the indices of the matching parameters in the parameter
             space.
 
         '''
-        candidates = range(len(self))
         if not conditions:
-            return list(candidates)
+            return list(range(len(self)))
+
+        # The positions of the selected values of each parameter
+        selected = [range(len(values)) for values in self.__values]
 
         # Validate conditions
         for param, cond in conditions.items():
@@ -461,13 +488,13 @@ class ParamSpace(namespaces.Namespace):
                     f'single argument'
                 )
 
-            def param_val(variant):
-                return self._get_param_value(param, variant)
-
-            # Filter the given condition
-            candidates = [v for v in candidates if cond(param_val(v))]
+            # Filter the given condition on the parameter values
+            pos = self._position[param]
+            selected[pos] = [i for i in selected[pos]
+                             if cond(self.__values[pos][i])]
 
-        return candidates
+        return _combine_indices(selected,
+                                [len(values) for values in self.__values])
 
     def _get_param_value(self, name, variant):
         '''Get the a parameter's value for a given variant.
@@ -475,4 +502,42 @@ class ParamSpace(namespaces.Namespace):
         In this context, a variant is a point in the parameter space.
         The name argument is simply the parameter name
         '''
-        return self.__param_combinations[variant][self._position[name]]
+        return self._decode(variant)[self._position[name]]
+
+
+# Use NumPy for combining more than this number of indices
+_NUMPY_THRESHOLD = 4096
+
+
+def _combine_indices(selected, radices):
+    '''Combine the selected digits of a mixed-radix number system.
+
+    :param selected: A list with the sorted selected digits of each position,
+        the most significant first.
+    :param radices: The radix of each position.
+    :returns: The sorted list of all the numbers that are formed by the
+        selected digits.
+    '''
+
+    num_indices = 1
+    for digits in selected:
+        num_indices *= len(digits)
+
+    if num_indices > _NUMPY_THRESHOLD:
+        try:
+            import numpy as np
+        except ImportError:
+            pass
+        else:
+            indices = np.zeros(1, dtype=np.int64)
+            for digits, radix in zip(selected, radices):
+                digits = np.asarray(digits, dtype=np.int64)
+                indices = np.add.outer(indices * radix, digits).ravel()
+
+            return indices.tolist()
+
+    indices = [0]
+    for digits, radix in zip(selected, radices):
+        indices = [i*radix + d for i in indices for d in digits]
+
+    return indices
@@ -18,6 +18,7 @@ __all__ = [
 ]
 
 
+import copy
 import glob
 import hashlib
 import functools
@@ -27,7 +28,6 @@ import numbers
 import os
 import re
 import shutil
-import yaml
 from collections import UserDict
 from pathlib import Path
 
@@ -45,7 +45,8 @@ from reframe.core.buildsystems import BuildSystemField
 from reframe.core.containers import ContainerPlatform
 from reframe.core.fields import remove_convertible
 from reframe.core.deferrable import (_DeferredExpression,
-                                     _DeferredPerformanceExpression)
+                                     _DeferredPerformanceExpression,
+                                     expression_cache)
 from reframe.core.environments import Environment
 from reframe.core.exceptions import (BuildError, DependencyError,
                                      PerformanceError, PipelineError,
@@ -54,7 +55,6 @@ from reframe.core.exceptions import (BuildError, DependencyError,
                                      UnexpectedSuccessError,
                                      ReferenceParseError,
                                      ReframeError)
-from reframe.core.hooks import attach_hooks
 from reframe.core.logging import getlogger
 from reframe.core.meta import RegressionTestMeta
 from reframe.core.schedulers import Job
@@ -121,6 +121,53 @@ _USER_PIPELINE_STAGES = (
 )
 
 
+def _display_name_hashcode(display_name):
+    '''Compute the hash code of a test from its display name.
+
+    The hash code does not depend on the order of the test parameters.
+    '''
+    m = hashlib.sha256()
+    basename, *params = display_name.split(' %')
+    m.update(basename.encode('utf-8'))
+    for p in sorted(params):
+        m.update(p.encode('utf-8'))
+
+    return m.hexdigest()[:8]
+
+
+# Types of the test attribute values that can be shared between clones
+_ATOMIC_TYPES = frozenset({type(None), bool, int, float, complex, str, bytes,
+                           range})
+
+
+def _clone_attr(value, memo):
+    '''Copy the value of a test attribute for a clone of the test.'''
+
+    cls = type(value)
+    if cls in _ATOMIC_TYPES:
+        return value
+
+    try:
+        return memo[id(value)]
+    except KeyError:
+        pass
+
+    if cls is tuple or cls is frozenset:
+        if all(type(v) in _ATOMIC_TYPES for v in value):
+            return value
+    elif cls is list or cls is set:
+        if all(type(v) in _ATOMIC_TYPES for v in value):
+            ret = memo[id(value)] = cls(value)
+            return ret
+    elif cls is dict:
+        if all(type(k) in _ATOMIC_TYPES and type(v) in _ATOMIC_TYPES
+               for k, v in value.items()):
+            ret = memo[id(value)] = dict(value)
+            return ret
+
+    return copy.deepcopy(value, memo)
+
+
 _RFM_TEST_KIND_MIXIN = 0
 _RFM_TEST_KIND_COMPILE = 1
 _RFM_TEST_KIND_RUN = 2
@@ -475,6 +522,8 @@ class _ReferenceDict(RegressionTestDict):
                 raise ReferenceParseError(f'{self.__ref_file}: {err}') from err
 
     def _read_ref_file(self, filename):
+        import yaml
+
         def _parse_ref_entry(key_path, val):
             key = '.'.join(str(k) for k in key_path)
             try:
@@ -1419,6 +1468,20 @@ class RegressionTest(RegressionTestPlugin, jsonext.JSONSerializable):
     #: .. versionadded:: 4.0.0
     require_reference = variable(typ.Bool, value=False, loggable=False)
 
+    #: Extract the performance values that are read from the same file in a
+    #: single scan of the file.
+    #:
+    #: This speeds up tests with many performance variables extracted with
+    #: similar patterns, but it may slow down tests whose patterns are
+    #: unrelated. Multiple values can also be extracted in a single scan
+    #: explicitly with :func:`~reframe.utility.sanity.extract_many`.
+    #:
+    #: :type: boolean
+    #: :default: :const:`False`
+    #:
+    #: .. versionadded:: 4.11
+    batch_perf_scans = variable(typ.Bool, value=False, loggable=False)
+
     #: Patterns for checking the sanity of this test.
     #:
     #: If not set, a sanity error may be raised during sanity checking if no
@@ -1702,6 +1765,10 @@ class RegressionTest(RegressionTestPlugin, jsonext.JSONSerializable):
     #: Dry-run mode
     _rfm_dry_run = variable(typ.Bool, value=False, loggable=False)
 
+    # The pipeline stages; these are wrapped by the metaclass upon class
+    # creation, so that they run the pipeline hooks of the test
+    _rfm_pipeline_stages = _PIPELINE_STAGES
+
     def __new__(cls, *args, **kwargs):
         obj = super().__new__(cls)
 
@@ -1710,13 +1777,12 @@ class RegressionTest(RegressionTestPlugin, jsonext.JSONSerializable):
         # call as a pre-init hook).
         obj.__deferred_rfm_init = obj.__rfm_init__()
 
-        # Build pipeline hook registry and add the pre-init hook
-        cls._rfm_pipeline_hooks = cls._process_hook_registry()
-        cls._rfm_pipeline_hooks['pre___init__'] = [obj.__pre_init__]
-
-        # Attach the hooks to the pipeline stages
-        for stage in _PIPELINE_STAGES:
-            cls._add_hooks(stage)
+        # Build the pipeline hook registry of the class and add the pre-init
+        # hook; this is done once, when the class is first instantiated
+        if '_rfm_pipeline_hooks' not in cls.__dict__:
+            pipeline_hooks = cls._process_hook_registry()
+            pipeline_hooks['pre___init__'] = [RegressionTest.__pre_init__]
+            cls._rfm_pipeline_hooks = pipeline_hooks
 
         return obj
 
@@ -1725,6 +1791,10 @@ class RegressionTest(RegressionTestPlugin, jsonext.JSONSerializable):
         '''Initialize the test defaults from a pre-init hook.'''
         self.__deferred_rfm_init.evaluate()
 
+        # The deferred initialization is not needed anymore; drop it, so that
+        # it is not carried over to the clones of the test
+        del self.__deferred_rfm_init
+
         # Build the default performance dict
         for fn in self._rfm_perf_fns.values():
             self.perf_variables[fn._rfm_perf_key] = fn(self)
@@ -1783,6 +1853,9 @@ class RegressionTest(RegressionTestPlugin, jsonext.JSONSerializable):
         # Associated job
         self._job = None
 
+        # Monitor of the early failure checks of the running job
+        self._output_monitor = None
+
         # Dynamic paths of the regression check; will be set in setup()
         self._stagedir = None
         self._outputdir = None
@@ -1846,20 +1919,21 @@ class RegressionTest(RegressionTestPlugin, jsonext.JSONSerializable):
 
         return _pipeline_hooks
 
-    @classmethod
-    def _add_hooks(cls, stage):
-        '''Decorate the pipeline stages.'''
-
-        pipeline_hooks = cls._rfm_pipeline_hooks
-        fn = getattr(cls, stage)
-        new_fn = attach_hooks(pipeline_hooks)(fn)
-        setattr(cls, '_rfm_pipeline_fn_' + stage, new_fn)
+    def __deepcopy__(self, memo):
+        '''Clone the test.
 
-    def __getattribute__(self, name):
-        if name in _PIPELINE_STAGES:
-            name = f'_rfm_pipeline_fn_{name}'
-
-        return super().__getattribute__(name)
+        The clone is created without calling :func:`__new__`, which would
+        rebuild the pipeline hooks of the test class. Immutable attribute
+        values are shared with the clone and containers of immutable values
+        are copied shallowly; only the rest is deep-copied.
+        '''
+        clone = super().__new__(type(self))
+        memo[id(self)] = clone
+        clone.__dict__.update(
+            (name, _clone_attr(value, memo))
+            for name, value in self.__dict__.items()
+        )
+        return clone
 
     def __getattr__(self, name):
         ''' Intercept the special builtin-related AttributeError.'''
@@ -1931,32 +2005,12 @@ class RegressionTest(RegressionTestPlugin, jsonext.JSONSerializable):
         .. versionadded:: 3.10.0
 
         '''
-        def _format_params(cls, info, prefix=' %'):
-            name = ''
-            for p, v in info['params'].items():
-                format_fn = cls.raw_params[p].format
-                name += f'{prefix}{p}={format_fn(v)}'
-
-            for f, v in info['fixtures'].items():
-                fixt = cls.fixture_space[f]
-                if fixt.action == 'join':
-                    continue
-
-                name += _format_params(fixt.cls, v, f'{prefix}{f}.')
-
-                # Append any variables set for the fixtures
-                for var, val in fixt.variables.items():
-                    name += f'{prefix}{f}.{var}={val}'
-
-            return name
-
         if hasattr(self, '_rfm_display_name'):
             return self._rfm_display_name
 
-        cls = type(self)
-        basename = cls.__name__
-        variant_info = cls.get_variant_info(self.variant_num, recurse=True)
-        self._rfm_display_name = basename + _format_params(cls, variant_info)
+        self._rfm_display_name = type(self)._variant_display_name(
+            self.variant_num
+        )
         if self.is_fixture():
             # Add the variable info and scope
             fixt_data = self._rfm_fixt_data
@@ -1973,16 +2027,13 @@ class RegressionTest(RegressionTestPlugin, jsonext.JSONSerializable):
         if hasattr(self, '_rfm_hashcode'):
             return self._rfm_hashcode
 
-        m = hashlib.sha256()
         if self.is_fixture():
+            m = hashlib.sha256()
             m.update(self.unique_name.encode('utf-8'))
+            self._rfm_hashcode = m.hexdigest()[:8]
         else:
-            basename, *params = self.display_name.split(' %')
-            m.update(basename.encode('utf-8'))
-            for p in sorted(params):
-                m.update(p.encode('utf-8'))
+            self._rfm_hashcode = _display_name_hashcode(self.display_name)
 
-        self._rfm_hashcode = m.hexdigest()[:8]
         return self._rfm_hashcode
 
     @loggable
@@ -2878,7 +2929,41 @@ class RegressionTest(RegressionTestPlugin, jsonext.JSONSerializable):
         if not self._job or self.is_dry_run():
             return True
 
-        return self._job.finished()
+        if self._job.finished():
+            return True
+
+        if self._rfm_early_failure_fns:
+            self._check_early_failures()
+
+        return False
+
+    def _check_early_failures(self):
+        '''Evaluate the early failure checks of the running job.
+
+        If any check fails, the job is cancelled.
+        '''
+        if self._output_monitor is None:
+            # Monitor the expressions returned by the checks, so that those of
+            # `assert_not_found()` can be evaluated incrementally
+            self._output_monitor = sn._OutputMonitor({
+                name: fn.__wrapped__(self)
+                for name, fn in self._rfm_early_failure_fns.items()
+            })
+
+        with osext.change_dir(self._stagedir):
+            try:
+                expected, message = self.__rfm_xfail_sanity__()
+                self._output_monitor.check()
+            except SanityError as err:
+                getlogger().verbose(
+                    f'cancelling job {self._job.jobid} of {self.name!r}: '
+                    f'early failure detected: {err}'
+                )
+                self._job.cancel()
+                if expected:
+                    raise ExpectedFailureError(message) from err
+
+                raise
 
     @final
     def run_wait(self):
@@ -2966,7 +3051,8 @@ class RegressionTest(RegressionTestPlugin, jsonext.JSONSerializable):
         if self.is_dry_run():
             return
 
-        with osext.change_dir(self._stagedir):
+        with (osext.change_dir(self._stagedir), sn.file_cache(),
+              expression_cache()):
             try:
                 expected, message = self.__rfm_xfail_sanity__()
                 success = sn.evaluate(self.sanity_patterns)
@@ -3071,10 +3157,22 @@ class RegressionTest(RegressionTestPlugin, jsonext.JSONSerializable):
 
         # Evaluate the performance function and retrieve the metrics
         xfailures = {}
-        with osext.change_dir(self._stagedir):
+        with (osext.change_dir(self._stagedir), sn.file_cache(),
+              expression_cache()):
+            # If requested, call all the performance functions before
+            # evaluating them, so that the values extracted from the same file
+            # are extracted in a single scan
+            if self.is_dry_run():
+                evaluators = {}
+            elif self.batch_perf_scans:
+                evaluators = sn._evaluate_batched(self.perf_variables)
+            else:
+                evaluators = {tag: expr.evaluate
+                              for tag, expr in self.perf_variables.items()}
+
             for tag, expr in self.perf_variables.items():
                 try:
-                    value = expr.evaluate() if not self.is_dry_run() else None
+                    value = evaluators[tag]() if evaluators else None
                     unit = expr.unit
                 except Exception as e:
                     getlogger().warning(
@@ -34,6 +34,14 @@ class RuntimeContext:
         self._timestamp = time.localtime()
         self._use_timestamps = use_timestamps
 
+        # Cache of the valid system/environment combinations of the tests;
+        # see `valid_sysenv_comb()`
+        self._sysenv_cache = {}
+
+        # Index of the mangled fixture names of the session; see
+        # `FixtureRegistry`
+        self._fixture_names = {}
+
     def _makedir(self, *dirs, wipeout=False):
         ret = os.path.join(*dirs)
         if wipeout:
@@ -288,111 +296,146 @@ def is_env_loaded(environ):
                 for k, v in environ.env_vars.items()))
 
 
-def _is_valid_part(part, valid_systems):
-    # Get sysname and partname for the partition being checked and construct
-    # all system:partition patterns that would match the sysname and partname
-    # being checked
-    sysname, partname = part.fullname.split(':')
-    syspart_matches = ['*', '*:*', sysname, f'{sysname}:*', f'*:{partname}',
-                       f'{part.fullname}']
+def _parse_features(spec):
+    '''Parse the ``+feat``, ``-feat`` and ``%key=val`` subspecs of ``spec``.
 
-    # If any of the specs in valid_systems matches, this is a valid partition
-    for spec in valid_systems:
-        plus_feats = []
-        minus_feats = []
-        props = {}
-        valid_match = True
-        for subspec in spec.split(' '):
-            if subspec.startswith('+'):
-                plus_feats.append(subspec[1:])
-            elif subspec.startswith('-'):
-                minus_feats.append(subspec[1:])
-            elif subspec.startswith('%'):
-                key, val = subspec[1:].split('=')
-                props[key] = val
-            else:
-                # If there is a system:partition specified, make sure it
-                # matches one of the items in syspart_matches
-                valid_match = True if subspec in syspart_matches else False
-
-        have_plus_feats = all(
-            (ft in part.features or
-             ft in part.resources or ft in part.extras)
-            for ft in plus_feats
-        )
-        have_minus_feats = any(
-            (ft in part.features or
-             ft in part.resources or ft in part.extras)
-            for ft in minus_feats
+    :returns: a tuple of the required features, the excluded features, the
+        required properties and the rest of the subspecs.
+    '''
+    plus_feats = []
+    minus_feats = []
+    props = {}
+    others = []
+    for subspec in spec.split(' '):
+        if subspec.startswith('+'):
+            plus_feats.append(subspec[1:])
+        elif subspec.startswith('-'):
+            minus_feats.append(subspec[1:])
+        elif subspec.startswith('%'):
+            key, val = subspec[1:].split('=')
+            props[key] = val
+        else:
+            others.append(subspec)
+
+    return plus_feats, minus_feats, props, others
+
+
+def _have_props(extras, props):
+    try:
+        for k, v in props.items():
+            extra_value = extras[k]
+            extra_type  = type(extra_value)
+            if extra_value != extra_type(v):
+                return False
+    except (KeyError, ValueError):
+        return False
+
+    return True
+
+
+class _SystemSpec:
+    '''A compiled spec of a test's :attr:`valid_systems`.'''
+
+    def __init__(self, spec):
+        self._plus_feats, self._minus_feats, self._props, others = (
+            _parse_features(spec)
         )
-        try:
-            have_props = True
-            for k, v in props.items():
-                extra_value = part.extras[k]
-                extra_type  = type(extra_value)
-                if extra_value != extra_type(v):
-                    have_props = False
-                    break
-        except (KeyError, ValueError):
-            have_props = False
-
-        # If the partition has all the plus features, none of the minus
-        # all of the properties and the system:partition spec (if any)
-        # matched, this partition is valid
-        if (have_plus_feats and
-            not have_minus_feats and
-            have_props and
-            valid_match):
-            return True
-
-    return False
 
+        # The last system:partition subspec, if any, is the one that counts
+        self._syspart = others[-1] if others else None
 
-def _is_valid_env(env, valid_prog_environs):
-    if '*' in valid_prog_environs:
-        return True
+    def _has_feature(self, part, ft):
+        return ft in part.features or ft in part.resources or ft in part.extras
+
+    def matches(self, part):
+        if self._syspart is not None:
+            # Make sure that the system:partition spec matches any of the
+            # system:partition patterns of the partition
+            sysname, partname = part.fullname.split(':')
+            syspart_matches = ('*', '*:*', sysname, f'{sysname}:*',
+                               f'*:{partname}', part.fullname)
+            if self._syspart not in syspart_matches:
+                return False
+
+        # The partition must have all the plus features, none of the minus
+        # and all of the properties
+        return (all(self._has_feature(part, ft) for ft in self._plus_feats) and
+                not any(self._has_feature(part, ft)
+                        for ft in self._minus_feats) and
+                _have_props(part.extras, self._props))
+
+
+class _EnvironSpec:
+    '''A compiled spec of a test's :attr:`valid_prog_environs`.'''
 
-    for spec in valid_prog_environs:
+    def __init__(self, spec):
         if spec[0] not in ('+', '-', '%'):
             # This is the standard case
-            if env.name == spec:
-                return True
+            self._name = spec
         else:
-            plus_feats = []
-            minus_feats = []
-            props = {}
-            for subspec in spec.split(' '):
-                if subspec.startswith('+'):
-                    plus_feats.append(subspec[1:])
-                elif subspec.startswith('-'):
-                    minus_feats.append(subspec[1:])
-                elif subspec.startswith('%'):
-                    key, val = subspec[1:].split('=')
-                    props[key] = val
-
-            have_plus_feats = all(ft in env.features or ft in env.extras
-                                  for ft in plus_feats)
-            have_minus_feats = any(ft in env.features or ft in env.extras
-                                   for ft in minus_feats)
-            try:
-                have_props = True
-                for k, v in props.items():
-                    extra_value = env.extras[k]
-                    extra_type  = type(extra_value)
-                    if extra_value != extra_type(v):
-                        have_props = False
-                        break
-            except (KeyError, ValueError):
-                have_props = False
-
-            if have_plus_feats and not have_minus_feats and have_props:
-                return True
-
-    return False
+            self._name = None
+            self._plus_feats, self._minus_feats, self._props, _ = (
+                _parse_features(spec)
+            )
+
+    def _has_feature(self, env, ft):
+        return ft in env.features or ft in env.extras
+
+    def matches(self, env):
+        if self._name is not None:
+            return env.name == self._name
+
+        return (all(self._has_feature(env, ft) for ft in self._plus_feats) and
+                not any(self._has_feature(env, ft)
+                        for ft in self._minus_feats) and
+                _have_props(env.extras, self._props))
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_system_specs(valid_systems):
+    return tuple(_SystemSpec(spec) for spec in valid_systems)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_environ_specs(valid_prog_environs):
+    if '*' in valid_prog_environs:
+        return None
+
+    return tuple(_EnvironSpec(spec) for spec in valid_prog_environs)
+
+
+def _is_valid_part(part, valid_systems):
+    # If any of the specs in valid_systems matches, this is a valid partition
+    return any(spec.matches(part)
+               for spec in _compile_system_specs(tuple(valid_systems)))
+
+
+def _is_valid_env(env, valid_prog_environs):
+    specs = _compile_environ_specs(tuple(valid_prog_environs))
+    if specs is None:
+        return True
+
+    return any(spec.matches(env) for spec in specs)
 
 
 def valid_sysenv_comb(valid_systems, valid_prog_environs,
                       check_systems=True, check_environs=True):
+    # The valid combinations are resolved once for every distinct set of
+    # arguments and then cached in the runtime
+    key = (tuple(valid_systems), tuple(valid_prog_environs),
+           check_systems, check_environs)
+    sysenv_cache = runtime()._sysenv_cache
+    try:
+        valid_comb = sysenv_cache[key]
+    except KeyError:
+        valid_comb = sysenv_cache[key] = _valid_sysenv_comb(*key)
+
+    # Return a copy, so that the callers cannot modify the cached entry
+    return {part: list(environs) for part, environs in valid_comb.items()}
+
+
+def _valid_sysenv_comb(valid_systems, valid_prog_environs,
+                       check_systems=True, check_environs=True):
     ret = {}
     curr_sys = runtime().system
     for part in curr_sys.partitions:
@@ -27,6 +27,10 @@ class _UndefinedType:
 
 Undefined = _UndefinedType()
 
+# Types of variable values that need not be copied upon injection
+_IMMUTABLE_TYPES = frozenset({type(None), bool, int, float, complex, str,
+                              bytes})
+
 DEPRECATE_RD = 1
 DEPRECATE_WR = 2
 DEPRECATE_RDWR = DEPRECATE_RD | DEPRECATE_WR
@@ -827,6 +831,10 @@ class VarSpace(namespaces.Namespace):
     def __init__(self, target_cls=None, illegal_names=None):
         # Set to register the variables already injected in the class
         self._injected_vars = set()
+
+        # The variables to inject in the test objects; this is set upon the
+        # first injection
+        self._injection_plan = None
         super().__init__(target_cls, illegal_names,
                          ns_name='_rfm_var_space',
                          ns_local_name='_rfm_local_var_space')
@@ -949,20 +957,30 @@ class VarSpace(namespaces.Namespace):
             self._inject(obj, cls)
 
     def _inject(self, obj, cls):
-        for name, var in self.items():
-            # Replace the variable with its descriptor
-            setattr(cls, name, var.field)
-            getattr(cls, name).__set_name__(obj, name)
+        if self._injection_plan is None:
+            # Replace the variables with their descriptors; this needs to be
+            # done only once for each class
+            for name, var in self.items():
+                setattr(cls, name, var.field)
+                getattr(cls, name).__set_name__(obj, name)
+
+                # Track the variables that have been injected.
+                self._injected_vars.add(name)
+
+            self._injection_plan = list(self.items())
 
+        for name, var in self._injection_plan:
             # If the var is defined, set its value
-            if var.is_defined():
+            value = var._default_value
+            if value is not Undefined:
                 # Variable's value is already validated and converted,
                 # so we bypass completely the descriptor logic by not calling
-                # `setattr()`
-                obj.__dict__[name] = var.default_value
+                # `setattr()`; deprecation warnings are also suppressed here,
+                # so we access directly the default value
+                if type(value) not in _IMMUTABLE_TYPES:
+                    value = copy.deepcopy(value)
 
-            # Track the variables that have been injected.
-            self._injected_vars.add(name)
+                obj.__dict__[name] = value
 
     @property
     def vars(self):
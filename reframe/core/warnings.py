@@ -1,6 +1,6 @@
 import contextlib
-import inspect
 import semver
+import sys
 import warnings
 
 import reframe
@@ -48,6 +48,9 @@ warnings.formatwarning = _format_warning
 
 _RAISE_DEPRECATION_ALWAYS = False
 
+# Nesting level of the `suppress_deprecations` contexts
+_suppress_level = 0
+
 
 def user_deprecation_warning(message, from_version='0.0.0'):
     '''Raise a deprecation warning at the user stack frame that eventually
@@ -63,15 +66,20 @@ def user_deprecation_warning(message, from_version='0.0.0'):
 
     '''
 
+    if _suppress_level:
+        return
+
     # Unwind the stack and issue the warning from the first stack frame that is
     # outside the framework.
     stack_level = 1
-    for s in inspect.stack():
-        module = inspect.getmodule(s.frame)
-        if module is None or not module.__name__.startswith('reframe'):
+    frame = sys._getframe()
+    while frame is not None:
+        module = frame.f_globals.get('__name__')
+        if module is None or not module.startswith('reframe'):
             break
 
         stack_level += 1
+        frame = frame.f_back
 
     min_version = semver.VersionInfo.parse(from_version)
     version = semver.VersionInfo.parse(reframe.VERSION)
@@ -93,9 +101,15 @@ class suppress_deprecations:
         self._ctxmgr = warnings.catch_warnings(*args, **kwargs)
 
     def __enter__(self):
+        global _suppress_level
+
         ret = self._ctxmgr.__enter__()
         warnings.simplefilter('ignore', ReframeDeprecationWarning)
+        _suppress_level += 1
         return ret
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        global _suppress_level
+
+        _suppress_level -= 1
         return self._ctxmgr.__exit__(exc_type, exc_val, exc_tb)
@@ -4,7 +4,6 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import json
-import jsonschema
 import os
 import shutil
 import tempfile
@@ -88,11 +87,14 @@ def _validate_info(info, schema):
     if schema is None:
         return info
 
+    import jsonschema
     jsonschema.validate(info, schema)
     return info
 
 
 def _load_info(filename, schema=None):
+    import jsonschema
+
     try:
         with open(filename) as fp:
             return _validate_info(json.load(fp), schema)
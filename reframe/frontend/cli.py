@@ -24,6 +24,7 @@ import reframe.frontend.ci as ci
 import reframe.frontend.dependencies as dependencies
 import reframe.frontend.filters as filters
 import reframe.frontend.reporting as reporting
+import reframe.frontend.testindex as testindex
 import reframe.utility as util
 import reframe.utility.jsonext as jsonext
 import reframe.utility.osext as osext
@@ -400,6 +401,11 @@ def main():
         envvar='RFM_CHECK_SEARCH_RECURSIVE',
         configvar='general/check_search_recursive'
     )
+    locate_options.add_argument(
+        '--load-workers', action='store', metavar='N', default=1, type=int,
+        help='Import the test files using N worker processes (default: 1)',
+        envvar='RFM_LOAD_WORKERS'
+    )
 
     # Select options
     select_options.add_argument(
@@ -773,6 +779,12 @@ def main():
         type=typ.Bool,
         help="Use Cray's xthostname file to retrieve the host name"
     )
+    argparser.add_argument(
+        dest='config_cache_dir',
+        envvar='RFM_CONFIG_CACHE_DIR',
+        action='store',
+        help='Directory for caching the validated configuration'
+    )
     argparser.add_argument(
         dest='config_path',
         envvar='RFM_CONFIG_PATH :',
@@ -1022,7 +1034,12 @@ def main():
         conf_files = config.find_config_files(
             options.config_path, options.config_files
         )
-        site_config = config.load_config(*conf_files)
+        config_cache_dir = options.config_cache_dir
+        if config_cache_dir:
+            config_cache_dir = osext.expandvars(config_cache_dir)
+
+        site_config = config.load_config(*conf_files,
+                                         cache_dir=config_cache_dir)
         site_config.validate()
 
         # Issue deprecation warnings
@@ -1357,7 +1374,8 @@ def main():
                                    check_search_recursive,
                                    external_vars,
                                    options.skip_system_check,
-                                   options.skip_prgenv_check)
+                                   options.skip_prgenv_check,
+                                   options.load_workers)
 
     def print_infoline(param, value):
         param = param + ':'
@@ -1411,7 +1429,22 @@ def main():
         # invocations from the command line and has practically no effect, but
         # it is needed to better emulate the behavior of running reframe's CLI
         # from within the unit tests, which call repeatedly `main()`.
-        checks_found = loader.load_all(force=True)
+        #
+        # The name, tag and maintainer filters are first applied on the test
+        # index, so that only the selected test variants are instantiated;
+        # the filters are re-applied on the generated test cases below.
+        index_filters = [filters.have_not_name(name)
+                         for name in options.exclude_names]
+        if options.names:
+            index_filters.append(filters.have_any_name(options.names))
+
+        index_filters += [testindex.if_static(filters.have_not_tag(tag))
+                          for tag in options.exclude_tags]
+        index_filters += [testindex.if_static(filters.have_tag(tag))
+                          for tag in options.tags]
+        index_filters += [testindex.if_static(filters.have_maintainer(m))
+                          for m in options.maintainers]
+        checks_found = loader.load_all(force=True, select=index_filters)
         printer.verbose(f'Loaded {len(checks_found)} test(s)')
 
         # Generate all possible test cases first; we will need them for
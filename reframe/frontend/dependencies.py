@@ -42,18 +42,16 @@ def build_deps(cases, default_cases=None):
     default_cases_map = build_index(default_cases)
 
     def resolve_dep(src, dst):
-        errmsg = f'could not resolve dependency: {src!r} -> {dst!r}'
         try:
             ret = all_cases_map[dst]
         except KeyError:
             # Try to resolve the dependency in the fallback map
-            try:
-                ret = default_cases_map[dst]
-            except KeyError:
-                raise DependencyError(errmsg) from None
+            ret = default_cases_map.get(dst)
 
         if not ret:
-            raise DependencyError(errmsg)
+            raise DependencyError(
+                f'could not resolve dependency: {src!r} -> {dst!r}'
+            )
 
         return ret
 
@@ -85,15 +83,25 @@ def build_deps(cases, default_cases=None):
 
         graph[c] = util.OrderedSet(c.deps)
 
-    # Skip also all cases that depend on the unresolved ones
+    # Skip also all cases that depend on the unresolved ones; we walk the
+    # reverse edges of the graph starting from the unresolved cases
     skipped_cases = []
-    skip_nodes = set(unresolved_cases)
-    while skip_nodes:
-        v = skip_nodes.pop()
-        skipped_cases.append(v)
+    if unresolved_cases:
+        dependents = {}
         for u, adj in graph.items():
-            if v in adj:
-                skip_nodes.add(u)
+            for v in adj:
+                dependents.setdefault(v, [])
+                dependents[v].append(u)
+
+        skip_nodes = collections.deque(unresolved_cases)
+        seen = set(unresolved_cases)
+        while skip_nodes:
+            v = skip_nodes.popleft()
+            skipped_cases.append(v)
+            for u in dependents.get(v, []):
+                if u not in seen:
+                    seen.add(u)
+                    skip_nodes.append(u)
 
     # Prune graph
     for c in skipped_cases:
@@ -153,34 +161,33 @@ def validate_deps(graph):
     test_graph = _reduce_deps(graph)
 
     # Check for cyclic dependencies in the test name graph
+    #
+    # We do an iterative DFS starting from every node that has not been
+    # visited yet, since the graph may comprise multiple not connected
+    # subgraphs; `path` holds the nodes of the current DFS path and
+    # `unvisited` the iterators over their adjacent nodes.
     visited = set()
-    sources = set(test_graph.keys())
-    path = []
+    for source in test_graph.keys():
+        if source in visited:
+            continue
 
-    # Since graph may comprise multiple not connected subgraphs, we search for
-    # cycles starting from all possible sources
-    while sources:
-        unvisited = [(sources.pop(), None)]
+        path = util.OrderedSet([source])
+        unvisited = [iter(test_graph[source])]
         while unvisited:
-            node, parent = unvisited.pop()
-            while path and path[-1] != parent:
-                path.pop()
-
-            adjacent = test_graph[node]
-            path.append(node)
-            for n in adjacent:
+            for n in unvisited[-1]:
                 if n in path:
-                    cycle_str = '->'.join(path + [n])
+                    cycle_str = '->'.join(list(path) + [n])
                     raise DependencyError(
                         'found cyclic dependency between tests: ' + cycle_str
                     )
 
                 if n not in visited:
-                    unvisited.append((n, node))
-
-            visited.add(node)
-
-        sources -= visited
+                    path.add(n)
+                    unvisited.append(iter(test_graph.get(n, [])))
+                    break
+            else:
+                visited.add(path.pop())
+                unvisited.pop()
 
 
 @time_function
@@ -191,19 +198,21 @@ def prune_deps(graph, testcases, max_depth=None):
     Graph is assumed to by a DAG.
     '''
 
+    # Do a BFS from every test case; each node is expanded only once, unless
+    # it was first reached beyond `max_depth`
     max_depth = max_depth or sys.maxsize
     pruned_graph = {}
     for tc in testcases:
-        unvisited = [tc]
-        curr_depth = 0
-        while unvisited and curr_depth < max_depth:
-            node = unvisited.pop()
-            pruned_graph.setdefault(node, util.OrderedSet())
+        unvisited = collections.deque([(tc, 0)])
+        while unvisited:
+            node, depth = unvisited.popleft()
+            if node in pruned_graph or depth >= max_depth:
+                continue
+
+            pruned_graph[node] = util.OrderedSet(graph[node])
             for adj in graph[node]:
-                pruned_graph[node].add(adj)
-                curr_depth += 1
                 if adj not in pruned_graph:
-                    unvisited.append(adj)
+                    unvisited.append((adj, depth + 1))
 
     # Re-calculate the in-degree of the pruned graph nodes
     for u in pruned_graph:
@@ -236,29 +245,34 @@ def toposort(graph, is_subgraph=False):
             else:
                 raise
 
-    def visit(node, path):
-        # We assume an acyclic graph
-        assert node not in path
-
-        path.add(node)
-
-        # Do a DFS visit of all the adjacent nodes
-        adjacent = retrieve(test_deps, node, [])
-        for u in adjacent:
-            if u not in visited:
-                visit(u, path)
-
-        if adjacent:
-            levels[node] = max(levels[u] for u in adjacent) + 1
-        else:
-            levels[node] = 0
-
-        path.pop()
-        visited.add(node)
-
+    # Do an iterative DFS visit; the nodes are added to `visited` in
+    # post-order, i.e., after all their adjacent nodes
     for r in test_deps.keys():
-        if r not in visited:
-            visit(r, util.OrderedSet())
+        if r in visited:
+            continue
+
+        path = util.OrderedSet([r])
+        adjacent = [retrieve(test_deps, r, [])]
+        unvisited = [iter(adjacent[-1])]
+        while unvisited:
+            for u in unvisited[-1]:
+                if u not in visited:
+                    # We assume an acyclic graph
+                    assert u not in path
+
+                    path.add(u)
+                    adjacent.append(retrieve(test_deps, u, []))
+                    unvisited.append(iter(adjacent[-1]))
+                    break
+            else:
+                node, node_adj = path.pop(), adjacent.pop()
+                unvisited.pop()
+                if node_adj:
+                    levels[node] = max(levels[u] for u in node_adj) + 1
+                else:
+                    levels[node] = 0
+
+                visited.add(node)
 
     # Index test cases by test name
     cases_by_name = {}
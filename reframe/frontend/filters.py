@@ -7,6 +7,7 @@ import re
 
 from reframe.core.exceptions import ReframeError
 from reframe.core.logging import getlogger
+from reframe.frontend.testindex import TestIndexEntry
 
 
 def re_compile(patt):
@@ -16,6 +17,13 @@ def re_compile(patt):
         raise ReframeError(f'invalid regex: {patt!r}')
 
 
+def _test_class(check):
+    if isinstance(check, TestIndexEntry):
+        return check.test_class
+
+    return type(check)
+
+
 def _have_name(patt):
     regex = re_compile(patt)
 
@@ -63,7 +71,7 @@ def have_any_name(names):
     def _fn(case):
         # Check the variant matches
         for m in variant_matches:
-            cls_name = type(case.check).__name__
+            cls_name = _test_class(case.check).__name__
             if (cls_name, case.check.variant_num) == m:
                 return True
 
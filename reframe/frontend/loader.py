@@ -8,16 +8,21 @@
 #
 
 import ast
+import concurrent.futures
 import contextlib
+import functools
 import inspect
+import multiprocessing
 import os
 import sys
 import traceback
 
+import reframe.core.logging as logging
 import reframe.utility as util
 import reframe.utility.osext as osext
 from reframe.core.exceptions import NameConflictError, is_severe, what
 from reframe.core.logging import getlogger, time_function
+from reframe.frontend.testindex import TestIndex, TestIndexEntry
 
 
 class no_op:
@@ -54,9 +59,59 @@ class RegressionCheckValidator(ast.NodeVisitor):
                     break
 
 
+# The loader, the selection filters and the `force` argument of the parallel
+# test loading; set in each worker process by `_init_load_worker()`
+_worker_state = None
+
+
+def _init_load_worker(loader, select, force):
+    global _worker_state
+
+    # Silence the logging of the worker and turn any warnings into errors;
+    # the parent process imports itself the test files that failed in the
+    # workers, so that the warnings and errors are reported as in the
+    # sequential loading
+    logging.configure_logging(None)
+    logging.getlogger().warn_as_error = True
+    _worker_state = (loader, select, force)
+
+
+def _select_from_file(filename):
+    '''Import a test file and select its test variants.
+
+    This runs in the worker processes of the parallel test loading. It returns
+    :obj:`None` if ``filename`` is not a test file; otherwise a tuple of the
+    names of the test classes registered in the file, the total number of
+    their variants and the selected variants as ``(test_pos, args, kwargs)``
+    tuples, where ``test_pos`` is the position of the test class in the test
+    registry of the module.
+    '''
+    loader, select, force = _worker_state
+    if not loader._validate_source(filename):
+        return None
+
+    module = util.import_module_from_file(filename, force=force,
+                                          load_parents=True)
+    registry = getattr(module, '_rfm_test_registry', None)
+    if not registry:
+        return [], 0, []
+
+    registry.setvars(loader._external_vars)
+    tests = list(registry)
+    index = TestIndex()
+    index.add_module(module)
+    selected = []
+    for e in index.select(*select):
+        test, args, kwargs = e.variant
+        selected.append((tests.index(test), args, kwargs))
+
+    return [t.__name__ for t in tests], len(index), selected
+
+
 class RegressionCheckLoader:
     def __init__(self, load_path, recurse=False, external_vars=None,
-                 skip_system_check=False, skip_prgenv_check=False):
+                 skip_system_check=False, skip_prgenv_check=False,
+                 load_workers=1):
         # Expand any environment variables and symlinks
         load_path = [os.path.realpath(osext.expandvars(p)) for p in load_path]
         self._load_path = osext.unique_abs_paths(load_path, recurse)
@@ -65,12 +120,18 @@ class RegressionCheckLoader:
         # Loaded tests by name; maps test names to the file that were defined
         self._loaded = {}
 
+        # Index of the registered tests of the loaded modules
+        self._index = None
+
         # Variables set in the command line
         self._external_vars = external_vars or {}
         self._unset_vars = {}
         self._skip_system_check = bool(skip_system_check)
         self._skip_prgenv_check = bool(skip_prgenv_check)
 
+        # Number of worker processes for importing the test files
+        self._load_workers = load_workers
+
     def unset_vars(self, testname):
         return self._unset_vars.get(testname, [])
 
@@ -140,12 +201,21 @@ class RegressionCheckLoader:
     def recurse(self):
         return self._recurse
 
-    def load_from_module(self, module):
+    @property
+    def index(self):
+        '''The test index built by the last call to :func:`load_all` with
+        selection filters or :obj:`None`.'''
+        return self._index
+
+    def load_from_module(self, module, variants=None):
         '''Load user checks from module.
 
         This method tries to load the test registry from a given module and
         instantiates all the tests in the registry. The instantiated checks
         are validated before return.
+
+        If ``variants`` is not :obj:`None`, only these test variants of the
+        registry will be instantiated.
         '''
         registry = getattr(module, '_rfm_test_registry', None)
         if registry:
@@ -154,7 +224,8 @@ class RegressionCheckLoader:
         reset_sysenv = self._skip_prgenv_check << 1 | self._skip_system_check
         if registry:
             candidate_tests = registry.instantiate_all(reset_sysenv,
-                                                       self._external_vars)
+                                                       self._external_vars,
+                                                       variants)
             self._unset_vars.update(registry.unset_vars)
         else:
             candidate_tests = []
@@ -196,53 +267,239 @@ class RegressionCheckLoader:
                 filename, force=force, load_parents=True
             ))
         except Exception:
-            exc_info = sys.exc_info()
-            if not is_severe(*exc_info):
-                # Simply skip the file in this case
-                getlogger().warning(
-                    f"skipping test file {osext.relpath_subdir(filename)!r}: "
-                    f"{what(*exc_info)}\n"
-                    f"rerun with '-v' for a backtrace"
+            self._handle_load_error(filename)
+            return []
+
+    def _import_from_file(self, filename, force=False):
+        filename = os.path.abspath(filename)
+        if not self._validate_source(filename):
+            return None
+
+        try:
+            module = util.import_module_from_file(
+                filename, force=force, load_parents=True
+            )
+            registry = getattr(module, '_rfm_test_registry', None)
+            if registry:
+                self._unset_vars.update(
+                    registry.setvars(self._external_vars)
                 )
-                getlogger().verbose(traceback.format_exc())
-                return []
-            else:
-                raise
 
-    def load_from_dir(self, dirname, recurse=False, force=False):
-        checks = []
+            return module
+        except Exception:
+            self._handle_load_error(filename)
+            return None
+
+    def _handle_load_error(self, filename):
+        exc_info = sys.exc_info()
+        if not is_severe(*exc_info):
+            # Simply skip the file in this case
+            getlogger().warning(
+                f"skipping test file {osext.relpath_subdir(filename)!r}: "
+                f"{what(*exc_info)}\n"
+                f"rerun with '-v' for a backtrace"
+            )
+            getlogger().verbose(traceback.format_exc())
+        else:
+            raise
+
+    def _test_files(self, dirname, recurse=False):
         for entry in os.scandir(dirname):
             if recurse and entry.is_dir():
-                checks += self.load_from_dir(entry.path, recurse, force)
+                yield from self._test_files(entry.path, recurse)
 
             if (entry.name.startswith('.') or
                 not entry.name.endswith('.py') or
                 not entry.is_file()):
                 continue
 
-            checks += self.load_from_file(entry.path, force)
+            yield entry.path
+
+    def load_from_dir(self, dirname, recurse=False, force=False):
+        checks = []
+        for filename in self._test_files(dirname, recurse):
+            checks += self.load_from_file(filename, force)
 
         return checks
 
+    def _load_paths(self):
+        for d in self._load_path:
+            getlogger().debug(f'Looking for tests in {d!r}')
+            if not os.path.exists(d):
+                getlogger().warning(f'check path {d!r} does not exist')
+                continue
+
+            yield d
+
     @time_function
-    def load_all(self, force=False):
+    def load_all(self, force=False, select=None):
         '''Load all checks in self._load_path.
 
         If a prefix exists, it will be prepended to each path.
 
         :arg force: Force reloading of test files.
+        :arg select: A list of test filters from
+            :mod:`reframe.frontend.filters` to apply on the test index. If not
+            empty, the test files are first indexed and only the test variants
+            that pass all filters are instantiated along with any tests they
+            depend on.
         :returns: The list of loaded tests.
         '''
-        checks = []
-        for d in self._load_path:
-            getlogger().debug(f'Looking for tests in {d!r}')
-            if not os.path.exists(d):
-                getlogger().warning(f'check path {d!r} does not exist')
-                continue
+        if select:
+            return self._load_selected(select, force)
 
+        checks = []
+        for d in self._load_paths():
             if os.path.isdir(d):
                 checks += self.load_from_dir(d, self._recurse, force)
             else:
                 checks += self.load_from_file(d, force)
 
         return checks
+
+    def _all_test_files(self):
+        for d in self._load_paths():
+            if os.path.isdir(d):
+                yield from self._test_files(d, self._recurse)
+            else:
+                yield d
+
+    @time_function
+    def _build_index(self, force=False):
+        modules = []
+        for f in self._all_test_files():
+            mod = self._import_from_file(f, force)
+            if mod is not None:
+                modules.append(mod)
+
+        index = TestIndex()
+        for mod in modules:
+            index.add_module(mod)
+
+        return index
+
+    def _select_in_workers(self, filenames, select, force=False):
+        '''Run :func:`_select_from_file` on ``filenames`` in a process pool.
+
+        Yields a ``(filename, result, exception)`` tuple for each file in the
+        order of ``filenames``.
+        '''
+        try:
+            # The selection filters are closures that cannot be pickled, so
+            # we pass them to the workers by forking the current process
+            mp_context = multiprocessing.get_context('fork')
+        except ValueError:
+            getlogger().warning(
+                'parallel test loading is not supported on this platform; '
+                'test files will be loaded sequentially'
+            )
+            for f in filenames:
+                yield f, None, None
+
+            return
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self._load_workers, mp_context=mp_context,
+            initializer=_init_load_worker, initargs=(self, select, force)
+        ) as executor:
+            futures = [executor.submit(_select_from_file, f)
+                       for f in filenames]
+            for f, fut in zip(filenames, futures):
+                try:
+                    yield f, fut.result(), None
+                except Exception as err:
+                    yield f, None, err
+
+    @time_function
+    def _build_index_parallel(self, select, force=False):
+        '''Build the test index and select its entries in worker processes.
+
+        The test files are imported and their variants are selected by the
+        workers, which return only the positions and the constructor
+        arguments of the selected variants. The parent process imports only
+        the files with selected variants and rebuilds their index entries
+        from the returned variant specs, whereas the rest of the files are
+        indexed lazily, so that they are imported only if a selected test
+        depends on them. Any file that the workers fail to import is imported
+        or that issue any warnings while being imported is imported by the
+        parent, so that these are reported exactly as in the sequential
+        loading.
+        '''
+        filenames = [os.path.abspath(f) for f in self._all_test_files()]
+        index = TestIndex()
+        entries = []
+        for f, result, err in self._select_in_workers(filenames,
+                                                      select, force):
+            if err is not None:
+                getlogger().debug(
+                    f'could not select tests from {f!r} in parallel: '
+                    f'{what(type(err), err, err.__traceback__)}'
+                )
+
+            if result is None:
+                # Either not a test file or the import failed in the worker
+                # or issued a warning
+                mod = self._import_from_file(f, force)
+                if mod is not None:
+                    mod_index = TestIndex()
+                    mod_index.add_module(mod)
+                    entries += mod_index.select(*select)
+                    index.add_module(mod)
+
+                continue
+
+            test_names, num_variants, selected = result
+            if not selected:
+                index.add_lazy_module(
+                    test_names, num_variants,
+                    functools.partial(self._import_from_file, f, force)
+                )
+                continue
+
+            mod = self._import_from_file(f, force)
+            if mod is not None:
+                index.add_module(mod)
+                tests = list(mod._rfm_test_registry)
+                entries += [TestIndexEntry(tests[pos], args, kwargs, mod)
+                            for pos, args, kwargs in selected]
+
+        return index, entries
+
+    def _load_selected(self, select, force=False):
+        if self._load_workers > 1:
+            self._index, entries = self._build_index_parallel(select, force)
+        else:
+            self._index = self._build_index(force)
+            entries = self._index.select(*select)
+
+        getlogger().debug(
+            f'Selected {len(entries)} out of {len(self._index)} '
+            f'test variant(s) from the test index'
+        )
+
+        # Instantiate the selected variants and then iteratively any of their
+        # dependencies that have not been selected
+        checks = []
+        instantiated = set()
+        while entries:
+            by_module = {}
+            for e in entries:
+                if e not in instantiated:
+                    instantiated.add(e)
+                    by_module.setdefault(e.module, [])
+                    by_module[e.module].append(e.variant)
+
+            new_checks = []
+            for mod, variants in by_module.items():
+                try:
+                    new_checks += self.load_from_module(mod, variants)
+                except Exception:
+                    self._handle_load_error(mod.__file__)
+
+            entries = [e for c in new_checks
+                       for name, _ in c.user_deps()
+                       for e in self._index.lookup(name)
+                       if e not in instantiated]
+            checks += new_checks
+
+        return checks
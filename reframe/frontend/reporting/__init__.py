@@ -7,8 +7,6 @@ import decimal
 import functools
 import inspect
 import json
-import jsonschema
-import lxml.etree as etree
 import math
 import os
 import re
@@ -21,7 +19,8 @@ import reframe as rfm
 import reframe.utility.jsonext as jsonext
 import reframe.utility.osext as osext
 from reframe.core.exceptions import ReframeError, what, is_severe, reraise_as
-from reframe.core.logging import getlogger, _format_time_rfc3339, time_function
+from reframe.core.logging import (getlogger, _format_time_rfc3339,
+                                  time_function, ColumnarFileHandler)
 from reframe.core.warnings import suppress_deprecations
 from reframe.utility import nodelist_abbrev, OrderedSet
 from .storage import StorageBackend
@@ -192,6 +191,8 @@ def _expand_report_filename(filepatt, *, newfile):
 
 
 def _restore_session(filename):
+    import jsonschema
+
     filename = _expand_report_filename(filename, newfile=False)
     try:
         with open(filename) as fp:
@@ -496,6 +497,8 @@ class RunReport:
     def generate_xml_report(self):
         '''Generate a JUnit report from a standard ReFrame JSON report.'''
 
+        import lxml.etree as etree
+
         report = self.__report
         xml_testsuites = etree.Element('testsuites')
         # Create a XSD-friendly timestamp
@@ -549,6 +552,8 @@ class RunReport:
         return xml_testsuites
 
     def save_junit(self, filename):
+        import lxml.etree as etree
+
         with open(filename, 'w') as fp:
             xml = self.generate_xml_report()
             fp.write(
@@ -802,3 +807,56 @@ def testcase_info(query, namepatt=None, test_filter=None):
 @time_function
 def delete_sessions(query):
     return StorageBackend.default().remove_sessions(parse_query_spec(query))
+
+
+def _perflog_files(path):
+    if not os.path.isdir(path):
+        yield path
+        return
+
+    for dirpath, _, filenames in os.walk(path):
+        for filename in sorted(filenames):
+            filename = os.path.join(dirpath, filename)
+            if (filename.endswith('.csv') and
+                os.path.exists(ColumnarFileHandler.schema_filename(filename))):
+                yield filename
+
+
+@time_function
+def load_perflogs(*paths):
+    '''Load the performance logs written by the ``columnar`` log handler in a
+    data frame.
+
+    :arg paths: The performance log files to load; any directories are
+        searched recursively for performance log files.
+    :returns: A :class:`polars.DataFrame` with all the rows of the loaded
+        files.
+
+    .. versionadded:: 4.11
+    '''
+    import polars as pl
+
+    frames = []
+    for path in paths:
+        for filename in _perflog_files(path):
+            schema_file = ColumnarFileHandler.schema_filename(filename)
+            try:
+                with open(schema_file) as fp:
+                    columns = json.load(fp)['columns']
+
+                schema = {c['name']: getattr(pl, c['type']) for c in columns}
+            except (OSError, KeyError, TypeError, AttributeError,
+                    json.JSONDecodeError) as err:
+                raise ReframeError(
+                    f'could not load the schema of perflog {filename!r}'
+                ) from err
+
+            frames.append(pl.scan_csv(filename, schema=schema))
+
+    if not frames:
+        return pl.DataFrame(schema={name: getattr(pl, dtype)
+                                    for name, dtype in
+                                    ColumnarFileHandler.COLUMNS})
+
+    # The files are scanned in parallel when the frames are collected
+    return pl.concat(frames, how='diagonal_relaxed').collect()
@@ -0,0 +1,283 @@
+# Copyright 2016-2026 Swiss National Supercomputing Centre (CSCS/ETH Zurich)
+# ReFrame Project Developers. See the top-level LICENSE file for details.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+#
+# Metadata index of the registered tests
+#
+
+import collections
+import functools
+import weakref
+
+from reframe.core.pipeline import RegressionTest, _display_name_hashcode
+
+
+# Cache of the static test classes
+_static_tests = weakref.WeakKeyDictionary()
+
+
+def _is_static(test):
+    try:
+        return _static_tests[test]
+    except KeyError:
+        ret = (test.__init__ is RegressionTest.__init__ and
+               'post_init' not in test.pipeline_hooks())
+        _static_tests[test] = ret
+        return ret
+
+
+class TestIndexEntry:
+    '''Metadata of a registered test variant.
+
+    The entry exposes the test attributes that the test filters inspect, so
+    that the filters can run on the index before any test is instantiated.
+    The names and the parameters of a variant are always known from its
+    class. The rest of the attributes are taken from the class-level values
+    of the test variables; these are only reliable if the test does not
+    define an ``__init__()`` method or any post-init hooks, in which case the
+    entry is marked as *static*. Otherwise, they are :obj:`None`.
+    '''
+
+    def __init__(self, test, args, kwargs, module):
+        self._test = test
+        self._args = args
+        self._kwargs = kwargs
+        self._module = module
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.unique_name!r})'
+
+    def __eq__(self, other):
+        if not isinstance(other, type(self)):
+            return NotImplemented
+
+        return self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    @property
+    def key(self):
+        '''A key identifying the test variant across index lookups.'''
+        return (self._test, self._args,
+                tuple(sorted(self._kwargs.items())))
+
+    @property
+    def test_class(self):
+        return self._test
+
+    @property
+    def variant(self):
+        '''The ``(test, args, kwargs)`` tuple of this registered variant.'''
+        return self._test, self._args, self._kwargs
+
+    @property
+    def module(self):
+        return self._module
+
+    @property
+    def variant_num(self):
+        return self._kwargs.get('variant_num')
+
+    @functools.cached_property
+    def unique_name(self):
+        return self._test.variant_name(self.variant_num)
+
+    @functools.cached_property
+    def display_name(self):
+        return self._test._variant_display_name(self.variant_num)
+
+    @functools.cached_property
+    def hashcode(self):
+        return _display_name_hashcode(self.display_name)
+
+    @functools.cached_property
+    def params(self):
+        return self._test.get_variant_info(self.variant_num)['params']
+
+    @property
+    def is_static(self):
+        return _is_static(self._test)
+
+    def is_fixture(self):
+        return False
+
+    def _class_value(self, name):
+        if not self.is_static:
+            return None
+
+        try:
+            var = self._test.var_space[name]
+        except KeyError:
+            return None
+
+        return var._default_value if var.is_defined() else None
+
+    @property
+    def tags(self):
+        return self._class_value('tags')
+
+    @property
+    def maintainers(self):
+        return self._class_value('maintainers')
+
+    @property
+    def valid_systems(self):
+        return self._class_value('valid_systems')
+
+    @property
+    def valid_prog_environs(self):
+        return self._class_value('valid_prog_environs')
+
+
+_IndexCase = collections.namedtuple('_IndexCase', ['check'])
+
+
+def if_static(filter_fn):
+    '''Apply ``filter_fn`` on an index entry only if the entry is static.
+
+    Non-static entries are always selected, since their attributes are only
+    known after the test is instantiated.
+    '''
+
+    def _fn(case):
+        return not case.check.is_static or filter_fn(case)
+
+    return _fn
+
+
+class TestIndex:
+    '''Index of the registered test variants of a set of test modules.
+
+    The index does not store any per-variant data; the entries of the test
+    variants are generated on demand from the test registries of the indexed
+    modules, so that selecting a few variants out of a large parameter space
+    requires memory proportional only to the selected variants. The test
+    filters of :mod:`reframe.frontend.filters` can be applied on the index
+    through :func:`select`.
+
+    Modules may also be indexed lazily with :func:`add_lazy_module`, in which
+    case they are only loaded when their tests are needed.
+    '''
+
+    def __init__(self):
+        self._registries = []
+
+        # Test classes by name
+        self._tests = {}
+
+        # Lazily indexed modules by their id; each module is stored as a
+        # ``(load_module, num_variants, test_names)`` tuple
+        self._lazy_mods = {}
+
+        # The ids of the lazily indexed modules by test class name; the ids
+        # are stored as dictionary keys, so that they are kept in order
+        self._lazy = {}
+
+    def __len__(self):
+        num_lazy = sum(m[1] for m in self._lazy_mods.values())
+        return num_lazy + sum(reg.num_variants()
+                              for _, reg in self._registries)
+
+    def __iter__(self):
+        return self.entries()
+
+    def add_module(self, module):
+        '''Index all the test variants registered in ``module``.'''
+
+        registry = getattr(module, '_rfm_test_registry', None)
+        if not registry:
+            return
+
+        self._registries.append((module, registry))
+        for test in registry:
+            self._tests.setdefault(test.__name__, [])
+            self._tests[test.__name__].append((module, registry, test))
+
+    def add_lazy_module(self, test_names, num_variants, load_module):
+        '''Index a module that will be loaded on demand.
+
+        :param test_names: The names of the test classes registered in the
+            module.
+        :param num_variants: The number of the test variants registered in
+            the module.
+        :param load_module: A callable that loads and returns the module or
+            :obj:`None` if the module cannot be loaded. It is called once,
+            the first time that any of its tests is looked up or that the
+            index entries are iterated.
+        '''
+        lazy_mod = (load_module, num_variants, tuple(test_names))
+        mod_id = id(lazy_mod)
+        self._lazy_mods[mod_id] = lazy_mod
+        for name in lazy_mod[2]:
+            self._lazy.setdefault(name, {})
+            self._lazy[name][mod_id] = None
+
+    def _load_lazy(self, test_names=None):
+        if test_names is None:
+            mod_ids = list(self._lazy_mods)
+        else:
+            mod_ids = {}
+            for name in test_names:
+                mod_ids.update(self._lazy.get(name, {}))
+
+        for mod_id in mod_ids:
+            load_module, _, mod_test_names = self._lazy_mods.pop(mod_id)
+            for name in mod_test_names:
+                mods = self._lazy.get(name, {})
+                mods.pop(mod_id, None)
+                if not mods:
+                    self._lazy.pop(name, None)
+
+            module = load_module()
+            if module is not None:
+                self.add_module(module)
+
+    def entries(self, **conditions):
+        '''Iterate over the entries of the indexed test variants.
+
+        :param conditions: Parameter conditions to filter the variants of
+            each test before generating their entries; see
+            :func:`reframe.core.decorators.TestRegistry.variants` for the
+            accepted conditions.
+        '''
+        self._load_lazy()
+        for module, registry in self._registries:
+            for test, args, kwargs in registry.variants(
+                conditions=conditions
+            ):
+                yield TestIndexEntry(test, args, kwargs, module)
+
+    def lookup(self, name):
+        '''Return the index entries of the test with the given unique name.'''
+
+        # The unique name is either the class name or the class name followed
+        # by the zero-padded variant number
+        clsnames = [name]
+        basename, _, suffix = name.rpartition('_')
+        if suffix.isdigit():
+            clsnames.append(basename)
+
+        self._load_lazy(clsnames)
+        ret = []
+        for clsname in clsnames:
+            for module, registry, test in self._tests.get(clsname, []):
+                for test, args, kwargs in registry.variants(tests=[test]):
+                    entry = TestIndexEntry(test, args, kwargs, module)
+                    if entry.unique_name == name:
+                        ret.append(entry)
+
+        return ret
+
+    def select(self, *filters, **conditions):
+        '''Return the entries for which all ``filters`` evaluate to true.
+
+        :param filters: Test filters to apply on the index entries.
+        :param conditions: Parameter conditions to apply before the filters;
+            see :func:`entries`.
+        '''
+
+        return [e for e in self.entries(**conditions)
+                if all(fn(_IndexCase(e)) for fn in filters)]
@@ -31,6 +31,7 @@ class TimeProfiler:
     def __init__(self):
         self._region_stack = ['root']
         self._region_times = {}
+        self._counters = {}
 
     @property
     def current_region(self):
@@ -71,6 +72,17 @@ class TimeProfiler:
     def time_region(self, region):
         return globals()['time_region'](region, self)
 
+    def increment(self, counter, value=1):
+        '''Increment ``counter`` by ``value``.
+
+        Counters are reported along with the region times and may be used to
+        report statistics, such as cache hits.
+        '''
+        self._counters[counter] = self._counters.get(counter, 0) + value
+
+    def counter(self, name):
+        return self._counters.get(name, 0)
+
     def print_report(self, print_fn=None):
         if print_fn is None:
             print_fn = print
@@ -87,4 +99,7 @@ class TimeProfiler:
 
             print_fn(msg)
 
+        for name, value in self._counters.items():
+            print_fn(f'{name}: {value}')
+
         print_fn('>>> profiler report [ end ] <<<')
@@ -4,19 +4,24 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import builtins
+import codecs
 import collections.abc
 import contextlib
+import functools
 import glob as pyglob
+import inspect
 import itertools
 import math
+import mmap
 import os
 import re
 import sys
 
 import reframe.utility as util
-from reframe.core.deferrable import (deferrable, _DeferredExpression,
+from reframe.core.deferrable import (deferrable, _pure, _DeferredExpression,
                                      _DeferredPerformanceExpression)
 from reframe.core.exceptions import SanityError
+from reframe.core.logging import getprofiler
 
 
 def _format(s, *args, **kwargs):
@@ -41,6 +46,293 @@ def _open(filename, *args, **kwargs):
         raise SanityError(f'{filename}: {e.strerror}')
 
 
+class _FileCache:
+    '''Cache of the decoded contents of the files read by the sanity
+    functions.
+
+    The contents are keyed by the file path, its identity, modification time
+    and size, as well as the encoding, so that a modified file is read again.
+    '''
+
+    def __init__(self):
+        self._contents = {}
+        self._matches = {}
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.scans_saved = 0
+
+    def _key(self, filename, encoding):
+        try:
+            st = os.stat(filename)
+        except OSError as e:
+            raise SanityError(f'{filename}: {e.strerror}')
+
+        return (os.fspath(filename), st.st_dev, st.st_ino,
+                st.st_mtime_ns, st.st_size, encoding), st
+
+    def read(self, filename, encoding):
+        key, st = self._key(filename, encoding)
+        try:
+            contents = self._contents[key]
+        except KeyError:
+            self.misses += 1
+            with _open(filename, 'rt', encoding=encoding) as fp:
+                contents = self._contents[key] = fp.read()
+        else:
+            self.hits += 1
+            self.bytes_saved += st.st_size
+
+        return contents
+
+    def scan(self, patts, filename, encoding):
+        '''Search for all the patterns ``patts`` in ``filename`` at once.
+
+        The matches of each pattern are cached and returned by any subsequent
+        call to :func:`matches`.
+        '''
+        key, _ = self._key(filename, encoding)
+        patts = [p for p in dict.fromkeys(patts)
+                 if isinstance(p, str) and (key, p) not in self._matches]
+        if builtins.len(patts) < 2:
+            return
+
+        matches = _finditer_many(patts, self.read(filename, encoding))
+        if matches is not None:
+            for p, m in builtins.zip(patts, matches):
+                self._matches[key, p] = m
+
+    def matches(self, patt, filename, encoding):
+        '''Return the cached matches of ``patt`` in ``filename`` or
+        :obj:`None`.'''
+        if not self._matches:
+            return None
+
+        try:
+            key, _ = self._key(filename, encoding)
+            ret = self._matches[key, patt]
+        except (SanityError, KeyError, TypeError):
+            return None
+
+        self.scans_saved += 1
+        return ret
+
+
+# The file cache of the current evaluation scope
+_file_cache = None
+
+
+@contextlib.contextmanager
+def file_cache():
+    '''Cache the contents of the files read by the sanity functions.
+
+    Inside this context, the functions that read a file, such as
+    :func:`extractall` or :func:`assert_found`, read and decode each file only
+    once; any subsequent call on the same file reuses its contents, unless the
+    file has been modified in the meantime. The cached contents are released
+    when the context exits and the cache statistics are added to the
+    framework's profiler. Nested contexts share the cache of the outermost
+    one.
+
+    The framework evaluates the sanity and performance checks of the tests
+    in such a context.
+
+    .. versionadded:: 4.11
+    '''
+    global _file_cache
+
+    if _file_cache is not None:
+        yield _file_cache
+        return
+
+    _file_cache = _FileCache()
+    try:
+        yield _file_cache
+    finally:
+        cache, _file_cache = _file_cache, None
+        profiler = getprofiler()
+        profiler.increment('file cache hits', cache.hits)
+        profiler.increment('file cache misses', cache.misses)
+        profiler.increment('file cache bytes saved', cache.bytes_saved)
+        profiler.increment('file cache scans saved', cache.scans_saved)
+
+
+def _read(filename, encoding):
+    '''Read the contents of ``filename`` through the current file cache.'''
+
+    if _file_cache is None or not isinstance(filename, (str, os.PathLike)):
+        # File descriptors are not cached
+        with _open(filename, 'rt', encoding=encoding) as fp:
+            return fp.read()
+
+    return _file_cache.read(filename, encoding)
+
+
+# Approximate size of the chunks of lines read at once by the ``'lines'`` scan
+# mode of the file-based functions
+_SCAN_CHUNK_SIZE = 1 << 20
+
+
+def _bytes_regex(patt, encoding):
+    '''Compile ``patt`` to a bytes regex for searching raw file contents.'''
+
+    flags = re.MULTILINE
+    if isinstance(patt, re.Pattern):
+        flags |= patt.flags & ~re.UNICODE
+        patt = patt.pattern
+
+    if isinstance(patt, str):
+        # The encoded pattern matches the encoded text only if the encoding is
+        # ASCII-compatible
+        if '\n'.encode(encoding) != b'\n':
+            raise SanityError(f'cannot scan memory-mapped files with '
+                              f'encoding {encoding!r}')
+
+        patt = patt.encode(encoding)
+
+    return re.compile(patt, flags)
+
+
+def _finditer(patt, filename, encoding, scan):
+    '''Iterate over the matches of ``patt`` in ``filename``.'''
+
+    if scan == 'read':
+        if _file_cache is not None:
+            matches = _file_cache.matches(patt, filename, encoding)
+            if matches is not None:
+                yield from matches
+                return
+
+        yield from re.finditer(patt, _read(filename, encoding), re.MULTILINE)
+    elif scan == 'lines':
+        # Search in chunks of whole lines, so as to avoid the per-line
+        # overhead
+        regex = re.compile(patt, re.MULTILINE)
+        with _open(filename, 'rt', encoding=encoding) as fp:
+            while lines := fp.readlines(_SCAN_CHUNK_SIZE):
+                yield from regex.finditer(''.join(lines))
+    elif scan == 'mmap':
+        regex = _bytes_regex(patt, encoding)
+        with _open(filename, 'rb') as fp:
+            try:
+                contents = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                return
+            except OSError as e:
+                raise SanityError(f'{filename}: {e.strerror}')
+
+        # The mapping is not closed explicitly, since the returned matches
+        # refer to it; it is closed when the last of them is released
+        yield from regex.finditer(contents)
+    else:
+        raise ValueError(f'unknown scan mode: {scan!r}')
+
+
+# Maximum number of positions examined by a multi-pattern scan; beyond that,
+# the rest of the file is searched separately for each pattern, which is
+# faster for dense matches
+_MULTI_SCAN_MAX_POSITIONS = 4096
+
+# Pattern constructs that refer to groups by number, which are renumbered when
+# the patterns are combined
+_NUMBERED_GROUP_REFS = re.compile(r'\\[1-9]|\(\?\(\d')
+
+
+@functools.lru_cache(maxsize=128)
+def _multi_scanner(patts):
+    '''Combine the patterns ``patts`` for a multi-pattern scan.
+
+    Returns a locator regex matching wherever any of the patterns matches, a
+    regex capturing the spans of all the patterns that match at a given
+    position and the indices of these captures, or :obj:`None` if the
+    patterns cannot be combined.
+    '''
+    if builtins.any(_NUMBERED_GROUP_REFS.search(p) for p in patts):
+        return None
+
+    try:
+        locator = re.compile('|'.join(f'(?:{p})' for p in patts),
+                             re.MULTILINE)
+        spans = re.compile(''.join(f'(?:(?=(?P<_rfm_patt{i}>{p}))|)'
+                                   for i, p in builtins.enumerate(patts)),
+                           re.MULTILINE)
+    except re.error:
+        # Incompatible patterns, e.g., defining the same group names
+        return None
+
+    return locator, spans, [spans.groupindex[f'_rfm_patt{i}']
+                            for i in builtins.range(builtins.len(patts))]
+
+
+def _finditer_many(patts, string):
+    '''Find the matches of all the patterns ``patts`` in ``string`` at once.
+
+    Returns a list with the matches of each pattern, which are the same as
+    those of :func:`re.finditer`, or :obj:`None` if the patterns cannot be
+    combined.
+
+    Every position of ``string`` where any of the patterns matches is visited
+    once and the matches of each pattern are collected from there, skipping
+    those that overlap with the previous match of the same pattern. If too
+    many positions are visited or a pattern matches the empty string, the
+    scan stops there and the rest of ``string`` is searched separately for
+    each pattern.
+    '''
+    scanner = _multi_scanner(tuple(patts))
+    if scanner is None:
+        return None
+
+    locator, spans, groups = scanner
+    regexes = [re.compile(p, re.MULTILINE) for p in patts]
+    ret = [[] for _ in patts]
+    resume = [0] * builtins.len(patts)
+    pos = 0
+    for _ in builtins.range(_MULTI_SCAN_MAX_POSITIONS):
+        m = locator.search(string, pos)
+        if m is None:
+            return ret
+
+        pos = m.start()
+        found = spans.match(string, pos)
+        empty_match = False
+        for i, g in builtins.enumerate(groups):
+            if found.start(g) < 0 or pos < resume[i]:
+                continue
+
+            match = regexes[i].match(string, pos)
+            if match.end() == pos:
+                # Empty matches follow different rules in `re.finditer()`, so
+                # we leave them to it
+                empty_match = True
+                break
+
+            ret[i].append(match)
+            resume[i] = match.end()
+
+        if empty_match:
+            break
+
+        pos += 1
+
+    # All the matches starting before `pos` have been collected; search for
+    # the rest without discarding them
+    for i, regex in builtins.enumerate(regexes):
+        ret[i] += regex.finditer(string, builtins.max(pos, resume[i]))
+
+    return ret
+
+
+def _group(match, tag, encoding):
+    '''Return the capturing group ``tag`` of ``match`` as a string.'''
+
+    val = match.group(tag)
+    if isinstance(val, bytes):
+        val = val.decode(encoding)
+
+    return val
+
+
 def make_performance_function(func, unit, *args, **kwargs):
     '''Convert a callable or deferred expression into a performance function.
 
@@ -67,18 +359,21 @@ def make_performance_function(func, unit, *args, **kwargs):
 # Deferrable versions of selected builtins
 
 @deferrable
+@_pure
 def abs(x):
     '''Replacement for the built-in :func:`abs() <python:abs>` function.'''
     return builtins.abs(x)
 
 
 @deferrable
+@_pure
 def all(iterable):
     '''Replacement for the built-in :func:`all() <python:all>` function.'''
     return builtins.all(iterable)
 
 
 @deferrable
+@_pure
 def any(iterable):
     '''Replacement for the built-in :func:`any() <python:any>` function.'''
     return builtins.any(iterable)
@@ -120,6 +415,7 @@ def hasattr(obj, name):
 
 
 @deferrable
+@_pure
 def len(s):
     '''Replacement for the built-in :func:`len() <python:len>` function.'''
     return builtins.len(s)
@@ -132,14 +428,30 @@ def map(function, *iterables):
 
 
 @deferrable
+@_pure
 def max(*args):
-    '''Replacement for the built-in :func:`max() <python:max>` function.'''
+    '''Replacement for the built-in :func:`max() <python:max>` function.
+
+    .. versionchanged:: 4.11
+       One-dimensional NumPy arrays are reduced by NumPy.
+    '''
+    if builtins.len(args) == 1 and _is_array(args[0]) and args[0].ndim == 1:
+        return args[0].max().item()
+
     return builtins.max(*args)
 
 
 @deferrable
+@_pure
 def min(*args):
-    '''Replacement for the built-in :func:`min() <python:min>` function.'''
+    '''Replacement for the built-in :func:`min() <python:min>` function.
+
+    .. versionchanged:: 4.11
+       One-dimensional NumPy arrays are reduced by NumPy.
+    '''
+    if builtins.len(args) == 1 and _is_array(args[0]) and args[0].ndim == 1:
+        return args[0].min().item()
+
     return builtins.min(*args)
 
 
@@ -189,6 +501,7 @@ def reversed(seq):
 
 
 @deferrable
+@_pure
 def round(number, *args):
     '''Replacement for the built-in
     :func:`round() <python:round>` function.'''
@@ -203,6 +516,7 @@ def setattr(obj, name, value):
 
 
 @deferrable
+@_pure
 def sorted(iterable, *args):
     '''Replacement for the built-in
     :func:`sorted() <python:sorted>` function.'''
@@ -210,8 +524,17 @@ def sorted(iterable, *args):
 
 
 @deferrable
+@_pure
 def sum(iterable, *args):
-    '''Replacement for the built-in :func:`sum() <python:sum>` function.'''
+    '''Replacement for the built-in :func:`sum() <python:sum>` function.
+
+    .. versionchanged:: 4.11
+       NumPy arrays are reduced by NumPy.
+    '''
+    if _is_array(iterable) and iterable.ndim > 0:
+        start = args[0] if args else 0
+        return (start + iterable.sum(axis=0)).tolist()
+
     return builtins.sum(iterable, *args)
 
 
@@ -224,6 +547,7 @@ def zip(*iterables):
 # Alternatives for non-overridable operators
 
 @deferrable
+@_pure
 def and_(a, b):
     '''Deferrable version of the :keyword:`and` operator.
 
@@ -232,6 +556,7 @@ def and_(a, b):
 
 
 @deferrable
+@_pure
 def or_(a, b):
     '''Deferrable version of the :keyword:`or` operator.
 
@@ -240,6 +565,7 @@ def or_(a, b):
 
 
 @deferrable
+@_pure
 def not_(a):
     '''Deferrable version of the :keyword:`not` operator.
 
@@ -248,6 +574,7 @@ def not_(a):
 
 
 @deferrable
+@_pure
 def contains(seq, key):
     '''Deferrable version of the :keyword:`in` operator.
 
@@ -258,6 +585,7 @@ def contains(seq, key):
 # Deferrable assert functions
 
 @deferrable
+@_pure
 def assert_true(x, msg=None):
     '''Assert that ``x`` is evaluated to ``True``.
 
@@ -275,6 +603,7 @@ def assert_true(x, msg=None):
 
 
 @deferrable
+@_pure
 def assert_false(x, msg=None):
     '''Assert that ``x`` is evaluated to ``False``.
 
@@ -291,6 +620,7 @@ def assert_false(x, msg=None):
 
 
 @deferrable
+@_pure
 def assert_eq(a, b, msg=None):
     '''Assert that ``a == b``.
 
@@ -307,6 +637,7 @@ def assert_eq(a, b, msg=None):
 
 
 @deferrable
+@_pure
 def assert_ne(a, b, msg=None):
     '''Assert that ``a != b``.
 
@@ -323,6 +654,7 @@ def assert_ne(a, b, msg=None):
 
 
 @deferrable
+@_pure
 def assert_in(item, container, msg=None):
     '''Assert that ``item`` is in ``container``.
 
@@ -339,6 +671,7 @@ def assert_in(item, container, msg=None):
 
 
 @deferrable
+@_pure
 def assert_not_in(item, container, msg=None):
     '''Assert that ``item`` is not in ``container``.
 
@@ -355,6 +688,7 @@ def assert_not_in(item, container, msg=None):
 
 
 @deferrable
+@_pure
 def assert_gt(a, b, msg=None):
     '''Assert that ``a > b``.
 
@@ -371,6 +705,7 @@ def assert_gt(a, b, msg=None):
 
 
 @deferrable
+@_pure
 def assert_ge(a, b, msg=None):
     '''Assert that ``a >= b``.
 
@@ -387,6 +722,7 @@ def assert_ge(a, b, msg=None):
 
 
 @deferrable
+@_pure
 def assert_lt(a, b, msg=None):
     '''Assert that ``a < b``.
 
@@ -403,6 +739,7 @@ def assert_lt(a, b, msg=None):
 
 
 @deferrable
+@_pure
 def assert_le(a, b, msg=None):
     '''Assert that ``a <= b``.
 
@@ -419,7 +756,8 @@ def assert_le(a, b, msg=None):
 
 
 @deferrable
-def assert_found(patt, filename, msg=None, encoding='utf-8'):
+@_pure
+def assert_found(patt, filename, msg=None, encoding='utf-8', *, scan='read'):
     '''Assert that regex pattern ``patt`` is found in the file ``filename``.
 
     :arg patt: The regex pattern to search.
@@ -435,17 +773,29 @@ def assert_found(patt, filename, msg=None, encoding='utf-8'):
     :arg msg: The error message to use if the assertion fails. You may use
         ``{0}`` ... ``{N}`` as placeholders for the function arguments.
     :arg encoding: The name of the encoding used to decode the file.
+    :arg scan: How to scan the file; see :func:`findall`.
     :returns: ``True`` on success.
     :raises reframe.core.exceptions.SanityError: if assertion fails.
+
+    .. versionchanged:: 4.11
+       The ``scan`` argument is added.
     '''
-    with _open(filename, 'rt', encoding=encoding) as fp:
+    if scan == 'read':
         return assert_found_s(
-            patt, fp.read(),
+            patt, _read(filename, encoding),
             msg or f'pattern {patt!r} not found in {filename!r}'
         )
 
+    # Stop scanning at the first match
+    if builtins.any(True for _ in _finditer(patt, filename, encoding, scan)):
+        return True
+
+    error_msg = msg or f'pattern {patt!r} not found in {filename!r}'
+    raise SanityError(_format(error_msg, patt, filename))
+
 
 @deferrable
+@_pure
 def assert_found_s(patt, string, msg=None):
     '''Assert that regex pattern ``patt`` is found in the string ``string``.
 
@@ -469,7 +819,9 @@ def assert_found_s(patt, string, msg=None):
 
 
 @deferrable
-def assert_not_found(patt, filename, msg=None, encoding='utf-8'):
+@_pure
+def assert_not_found(patt, filename, msg=None, encoding='utf-8', *,
+                     scan='read'):
     '''Assert that regex pattern ``patt`` is not found in the file
     ``filename``.
 
@@ -477,14 +829,26 @@ def assert_not_found(patt, filename, msg=None, encoding='utf-8'):
 
     :returns: ``True`` on success.
     :raises reframe.core.exceptions.SanityError: if assertion fails.
+
+    .. versionchanged:: 4.11
+       The ``scan`` argument is added.
     '''
-    with _open(filename, 'rt', encoding=encoding) as fp:
+    if scan == 'read':
         return assert_not_found_s(
-            patt, fp.read(), msg or f'pattern {patt!r} found in {filename!r}'
+            patt, _read(filename, encoding),
+            msg or f'pattern {patt!r} found in {filename!r}'
         )
 
+    if not builtins.any(True
+                        for _ in _finditer(patt, filename, encoding, scan)):
+        return True
+
+    error_msg = msg or f'pattern {patt!r} found in {filename!r}'
+    raise SanityError(_format(error_msg, patt, filename))
+
 
 @deferrable
+@_pure
 def assert_not_found_s(patt, string, msg=None):
     '''Assert that regex pattern ``patt`` is not found in ``string``.
 
@@ -505,6 +869,7 @@ def assert_not_found_s(patt, string, msg=None):
 
 
 @deferrable
+@_pure
 def assert_bounded(val, lower=None, upper=None, msg=None):
     '''Assert that ``lower <= val <= upper``.
 
@@ -594,6 +959,7 @@ def reference_bounds(ref, lower_thres=None, upper_thres=None):
 
 
 @deferrable
+@_pure
 def assert_reference(val, ref, lower_thres=None, upper_thres=None, msg=None):
     '''Assert that value ``val`` respects the reference value ``ref``.
 
@@ -627,15 +993,17 @@ def assert_reference(val, ref, lower_thres=None, upper_thres=None, msg=None):
 # Pattern matching functions
 
 @deferrable
-def finditer(patt, filename, encoding='utf-8'):
+def finditer(patt, filename, encoding='utf-8', *, scan='read'):
     '''Get an iterator over the matches of the regex ``patt`` in ``filename``.
 
     This function is equivalent to :func:`findall()` except that it returns
     a generator object instead of a list, which you can use to iterate over
     the raw matches.
+
+    .. versionchanged:: 4.11
+       The ``scan`` argument is added.
     '''
-    with _open(filename, 'rt', encoding=encoding) as fp:
-        yield from re.finditer(patt, fp.read(), re.MULTILINE)
+    yield from _finditer(patt, filename, encoding, scan)
 
 
 @deferrable
@@ -652,7 +1020,8 @@ def finditer_s(patt, string):
 
 
 @deferrable
-def findall(patt, filename, encoding='utf-8'):
+@_pure
+def findall(patt, filename, encoding='utf-8', *, scan='read'):
     '''Get all matches of regex ``patt`` in ``filename``.
 
     :arg patt: The regex pattern to search.
@@ -664,15 +1033,38 @@ def findall(patt, filename, encoding='utf-8'):
         is set for the pattern search.
     :arg filename: The name of the file to examine.
     :arg encoding: The name of the encoding used to decode the file.
+    :arg scan: How to scan the file. The following modes are supported:
+
+        - ``'read'``: The whole file is read and decoded in memory and the
+          pattern is searched in its contents. This is the default.
+        - ``'mmap'``: The file is memory-mapped and the pattern, encoded with
+          ``encoding``, is searched in its raw bytes. The file is neither
+          read nor decoded in memory, so that this mode is suitable for very
+          large files. The encoding must be ASCII-compatible and the
+          character classes of the pattern, such as ``\\d`` or ``\\w``, match
+          only ASCII characters. The matches returned by this function refer
+          to the raw bytes of the file, but the values extracted by the
+          ``extract*()`` functions are decoded.
+        - ``'lines'``: The file is read and searched in chunks of whole
+          lines, so that only a single chunk is kept in memory. This mode
+          may only be used if the pattern cannot match across multiple lines,
+          since such matches may be missed, and the positions of the
+          returned matches are relative to the chunk they were found in.
+
     :returns: A list of raw `regex match objects
         <https://docs.python.org/3/library/re.html#match-objects>`_.
     :raises reframe.core.exceptions.SanityError: In case an :class:`OSError` is
         raised while processing ``filename``.
+
+    .. versionchanged:: 4.11
+       The ``scan`` argument is added.
     '''
-    return list(evaluate(x) for x in finditer(patt, filename, encoding))
+    return list(evaluate(x)
+                for x in _finditer(patt, filename, encoding, scan))
 
 
 @deferrable
+@_pure
 def findall_s(patt, string):
     '''Get all matches of regex ``patt`` in ``string``.
 
@@ -700,14 +1092,14 @@ def _callable_name(fn):
     return fn_name
 
 
-def _extractiter_singletag(patt, string, tag, conv):
+def _extractiter_singletag(patt, matches, tag, conv, encoding=None):
     if isinstance(conv, collections.abc.Iterable):
         raise SanityError(f'multiple conversion functions given for the '
                           f'single capturing group {tag!r}')
 
-    for m in finditer_s(patt, string):
+    for m in matches:
         try:
-            val = m.group(tag)
+            val = _group(m, tag, encoding)
         except (IndexError, KeyError):
             raise SanityError(f'no such group in pattern {patt!r}: {tag}')
 
@@ -720,12 +1112,12 @@ def _extractiter_singletag(patt, string, tag, conv):
             )
 
 
-def _extractiter_multitag(patt, string, tags, conv):
-    for m in finditer_s(patt, string):
+def _extractiter_multitag(patt, matches, tags, conv, encoding=None):
+    for m in matches:
         val = []
         for t in tags:
             try:
-                val.append(m.group(t))
+                val.append(_group(m, t, encoding))
             except (IndexError, KeyError):
                 raise SanityError(f'no such group in pattern {patt!r}: {t}')
 
@@ -749,17 +1141,33 @@ def _extractiter_multitag(patt, string, tags, conv):
         yield tuple(converted_vals)
 
 
+def _is_multitag(tag):
+    return (isinstance(tag, collections.abc.Iterable) and
+            not isinstance(tag, str))
+
+
+def _extractiter(patt, matches, tag, conv, encoding=None):
+    if _is_multitag(tag):
+        yield from _extractiter_multitag(patt, matches, tag, conv, encoding)
+    else:
+        yield from _extractiter_singletag(patt, matches, tag, conv, encoding)
+
+
 @deferrable
-def extractiter(patt, filename, tag=0, conv=None, encoding='utf-8'):
+def extractiter(patt, filename, tag=0, conv=None, encoding='utf-8', *,
+                scan='read'):
     '''Get an iterator over the values extracted from the capturing group
     ``tag`` of a matching regex ``patt`` in the file ``filename``.
 
     This function is equivalent to :func:`extractall` except that it returns
     a generator object, instead of a list, which you can use to iterate over
     the extracted values.
+
+    .. versionchanged:: 4.11
+       The ``scan`` argument is added.
     '''
-    with _open(filename, 'rt', encoding=encoding) as fp:
-        yield from extractiter_s(patt, fp.read(), tag, conv)
+    yield from _extractiter(patt, _finditer(patt, filename, encoding, scan),
+                            tag, conv, encoding)
 
 
 @deferrable
@@ -773,14 +1181,13 @@ def extractiter_s(patt, string, tag=0, conv=None):
 
     .. versionadded:: 3.4.1
     '''
-    if isinstance(tag, collections.abc.Iterable) and not isinstance(tag, str):
-        yield from _extractiter_multitag(patt, string, tag, conv)
-    else:
-        yield from _extractiter_singletag(patt, string, tag, conv)
+    yield from _extractiter(patt, finditer_s(patt, string), tag, conv)
 
 
 @deferrable
-def extractall(patt, filename, tag=0, conv=None, encoding='utf-8'):
+@_pure
+def extractall(patt, filename, tag=0, conv=None, encoding='utf-8', *,
+               scan='read'):
     '''Extract all values from the capturing group ``tag`` of a matching regex
     ``patt`` in the file ``filename``.
 
@@ -794,6 +1201,7 @@ def extractall(patt, filename, tag=0, conv=None, encoding='utf-8'):
     :arg filename: The name of the file to examine or a file descriptor as in
         :py:func:`open`.
     :arg encoding: The name of the encoding used to decode the file.
+    :arg scan: How to scan the file; see :func:`findall`.
     :arg tag: The regex capturing group to be extracted.
         Group ``0`` refers always to the whole match.
         Since the file is processed line by line, this means that group ``0``
@@ -816,12 +1224,17 @@ def extractall(patt, filename, tag=0, conv=None, encoding='utf-8'):
     .. versionchanged:: 3.1
         Multiple regex capturing groups are now supporetd via ``tag`` and
         multiple conversion functions can be used in ``conv``.
+
+    .. versionchanged:: 4.11
+       The ``scan`` argument is added.
     '''
+    matches = _finditer(patt, filename, encoding, scan)
     return list(evaluate(x)
-                for x in extractiter(patt, filename, tag, conv, encoding))
+                for x in _extractiter(patt, matches, tag, conv, encoding))
 
 
 @deferrable
+@_pure
 def extractall_s(patt, string, tag=0, conv=None):
     '''Extract all values from the capturing group ``tag`` of a matching regex
     ``patt`` in ``string``.
@@ -838,7 +1251,9 @@ def extractall_s(patt, string, tag=0, conv=None):
 
 
 @deferrable
-def extractsingle(patt, filename, tag=0, conv=None, item=0, encoding='utf-8'):
+@_pure
+def extractsingle(patt, filename, tag=0, conv=None, item=0, encoding='utf-8',
+                  *, scan='read'):
     '''Extract a single value from the capturing group ``tag`` of a matching
     regex ``patt`` in the file ``filename``.
 
@@ -849,18 +1264,23 @@ def extractsingle(patt, filename, tag=0, conv=None, item=0, encoding='utf-8'):
     :arg patt: as in :func:`extractall`.
     :arg filename: as in :func:`extractall`.
     :arg encoding: as in :func:`extractall`.
+    :arg scan: as in :func:`extractall`.
     :arg tag: as in :func:`extractall`.
     :arg conv: as in :func:`extractall`.
     :arg item: the specific element to extract.
     :returns: The extracted value.
     :raises reframe.core.exceptions.SanityError: In case of errors.
 
+    .. versionchanged:: 4.11
+       The ``scan`` argument is added.
     '''
     try:
         # Explicitly evaluate the expression here, so as to force any exception
         # to be thrown in this context and not during the evaluation of an
         # expression containing this one.
-        return evaluate(extractall(patt, filename, tag, conv, encoding)[item])
+        return evaluate(
+            extractall(patt, filename, tag, conv, encoding, scan=scan)[item]
+        )
     except IndexError:
         raise SanityError(
             f'not enough matches of pattern {patt!r} in file {filename!r} '
@@ -869,6 +1289,7 @@ def extractsingle(patt, filename, tag=0, conv=None, item=0, encoding='utf-8'):
 
 
 @deferrable
+@_pure
 def extractsingle_s(patt, string, tag=0, conv=None, item=0):
     '''Extract a single value from the capturing group ``tag`` of a matching
     regex ``patt`` in ``string``.
@@ -899,11 +1320,367 @@ def extractsingle_s(patt, string, tag=0, conv=None, item=0):
         )
 
 
+@deferrable
+@_pure
+def _extractall_batched(patts, patt, filename, tag, conv, encoding):
+    if _file_cache is not None:
+        _file_cache.scan(patts, filename, encoding)
+
+    return extractall(patt, filename, tag, conv, encoding)
+
+
+def extract_many(patterns, filename, tag=0, conv=None, encoding='utf-8'):
+    '''Extract the values of multiple regex patterns from the file
+    ``filename`` in a single scan.
+
+    The file is scanned once for all the patterns, so that this function is
+    more efficient than calling :func:`extractall` for each pattern
+    separately, especially if the patterns share a common prefix or are
+    anchored to the start of the line. The values extracted for each pattern
+    are the same as those returned by :func:`extractall`.
+
+    .. code-block:: python
+
+       values = sn.extract_many({
+           'copy': (r'Copy:\\s+(\\S+)', 1, float),
+           'triad': (r'Triad:\\s+(\\S+)', 1, float)
+       }, self.stdout)
+       return sn.avg(values['copy'])
+
+    The single scan is shared by the returned expressions only if they are
+    evaluated in the same :func:`file_cache` context, as is the case for the
+    sanity and performance functions of a test. Otherwise, each expression
+    scans the file separately.
+
+    :arg patterns: A mapping of names to regex patterns. Each pattern may be
+        given also as a ``(patt, tag)`` or ``(patt, tag, conv)`` tuple to
+        override the ``tag`` and ``conv`` arguments for this pattern.
+    :arg filename: as in :func:`extractall`.
+    :arg tag: as in :func:`extractall`.
+    :arg conv: as in :func:`extractall`.
+    :arg encoding: as in :func:`extractall`.
+    :returns: A dictionary of deferred expressions evaluating to the values
+        extracted from each pattern, under the same names as in
+        ``patterns``.
+
+    .. versionadded:: 4.11
+    '''
+    specs = {}
+    for name, spec in patterns.items():
+        if not isinstance(spec, tuple):
+            spec = (spec,)
+
+        if not 1 <= builtins.len(spec) <= 3:
+            raise ValueError(f'invalid pattern specification for {name!r}: '
+                             f'{spec!r}')
+
+        specs[name] = spec + (tag, conv)[builtins.len(spec) - 1:]
+
+    patts = tuple(patt for patt, *_ in specs.values())
+    return {
+        name: _extractall_batched(patts, patt, filename, t, c, encoding)
+        for name, (patt, t, c) in specs.items()
+    }
+
+
+def _numpy():
+    '''Return the NumPy module or :obj:`None` if it is not available.'''
+
+    try:
+        import numpy
+    except ImportError:
+        return None
+
+    return numpy
+
+
+def _is_array(obj):
+    '''Check if ``obj`` is a NumPy array without importing NumPy.'''
+
+    np = sys.modules.get('numpy')
+    return np is not None and isinstance(obj, np.ndarray)
+
+
+def _extract_strings(patt, filename, tag, encoding, scan):
+    '''Extract the strings of the capturing groups ``tag`` of all the
+    matches of ``patt`` in ``filename``.'''
+
+    multitag = _is_multitag(tag)
+    matches = None
+    if scan == 'read':
+        if _file_cache is not None:
+            matches = _file_cache.matches(patt, filename, encoding)
+
+        regex = re.compile(patt, re.MULTILINE)
+        if (matches is None and not multitag and
+            ((regex.groups == 0 and tag == 0) or
+             (regex.groups == 1 and regex.groupindex.get(tag, tag) == 1))):
+            # Let the regex engine collect the strings of the group, since
+            # the pattern has no other groups
+            return regex.findall(_read(filename, encoding))
+
+    if matches is None:
+        matches = _finditer(patt, filename, encoding, scan)
+
+    tags = tag if multitag else [tag]
+    ret = []
+    for m in matches:
+        try:
+            vals = [_group(m, t, encoding) for t in tags]
+        except (IndexError, KeyError):
+            raise SanityError(f'no such group in pattern {patt!r}: {tag}')
+
+        ret.append(vals if multitag else vals[0])
+
+    return ret
+
+
+@deferrable
+@_pure
+def extractall_array(patt, filename, tag=0, dtype=float, encoding='utf-8', *,
+                     scan='read'):
+    '''Extract all values from the capturing group ``tag`` of a matching regex
+    ``patt`` in the file ``filename`` into a NumPy array.
+
+    This function is equivalent to :func:`extractall`, except that the
+    extracted values are converted in bulk to a NumPy array of type
+    ``dtype``, which is much faster for large numbers of values. The
+    returned array can be passed directly to the numeric functions of this
+    module, such as :func:`avg` or :func:`percentile`, which reduce it
+    without iterating over its elements in Python.
+
+    :arg patt: as in :func:`extractall`.
+    :arg filename: as in :func:`extractall`.
+    :arg tag: as in :func:`extractall`. If ``tag`` is an iterable, a
+        two-dimensional array is returned with a column per capturing group.
+    :arg dtype: The NumPy data type of the array.
+    :arg encoding: as in :func:`extractall`.
+    :arg scan: as in :func:`extractall`.
+    :returns: A NumPy array of the extracted values.
+    :raises reframe.core.exceptions.SanityError: In case of errors or if
+        NumPy is not available.
+
+    .. versionadded:: 4.11
+    '''
+    np = _numpy()
+    if np is None:
+        raise SanityError('extractall_array() requires NumPy')
+
+    vals = _extract_strings(patt, filename, tag, encoding, scan)
+    try:
+        ret = np.array(vals, dtype=dtype)
+    except ValueError as err:
+        raise SanityError(f'could not convert values to {dtype!r}: {err}')
+
+    if not vals and _is_multitag(tag):
+        ret = ret.reshape(0, builtins.len(tag))
+
+    return ret
+
+
+@functools.lru_cache(maxsize=None)
+def _scanning_functions():
+    return {fn.__wrapped__: inspect.signature(fn.__wrapped__)
+            for fn in (finditer, findall, extractiter, extractall,
+                       extractall_array, extractsingle, _extractall_batched)}
+
+
+def _file_scans(expr):
+    '''Iterate over the file scans of the deferred expression ``expr``.
+
+    Each scan is returned as a ``(filename, encoding, patt)`` tuple. Only the
+    scans of the ``'read'`` mode whose arguments are not deferred are
+    considered.
+    '''
+    functions = _scanning_functions()
+    visited = set()
+    exprs = [expr]
+    while exprs:
+        expr = exprs.pop()
+        if builtins.id(expr) in visited:
+            continue
+
+        visited.add(builtins.id(expr))
+        args = itertools.chain(expr._args, expr._kwargs.values())
+        exprs += [a for a in args if isinstance(a, _DeferredExpression)]
+        try:
+            args = functions[expr._fn].bind(*expr._args, **expr._kwargs)
+        except (KeyError, TypeError):
+            continue
+
+        args.apply_defaults()
+        args = args.arguments
+        if (args.get('scan', 'read') == 'read' and
+            isinstance(args['patt'], str) and
+            isinstance(args['filename'], (str, os.PathLike)) and
+            isinstance(args['encoding'], str)):
+            yield args['filename'], args['encoding'], args['patt']
+
+
+def _raise(exc):
+    raise exc
+
+
+def _evaluate_batched(exprs):
+    '''Prepare the evaluation of the deferred expressions ``exprs`` so that
+    the files that they extract values from are scanned only once.
+
+    The outermost function of each expression, typically a performance
+    function, is called first and the file scans of the returned deferred
+    expressions are batched per file in the current :func:`file_cache`
+    context.
+
+    :arg exprs: A mapping of deferred expressions.
+    :returns: A dictionary of callables completing the evaluation of each
+        expression, under the same keys as in ``exprs``. The callables raise
+        any error that occurred while preparing the evaluation.
+    '''
+    functions = _scanning_functions()
+    evaluators, scans = {}, {}
+    for key, expr in exprs.items():
+        try:
+            if expr._fn in functions or expr._return_cached:
+                expanded = expr
+                evaluators[key] = expr.evaluate
+            else:
+                expanded = expr._expand()
+                evaluators[key] = functools.partial(expr._resolve, expanded)
+        except Exception as err:
+            evaluators[key] = functools.partial(_raise, err)
+            continue
+
+        if isinstance(expanded, _DeferredExpression):
+            for filename, encoding, patt in _file_scans(expanded):
+                scans.setdefault((filename, encoding), [])
+                scans[filename, encoding].append(patt)
+
+    if _file_cache is not None:
+        for (filename, encoding), patts in scans.items():
+            try:
+                _file_cache.scan(patts, filename, encoding)
+            except SanityError:
+                # Any error will be raised when evaluating the expressions
+                pass
+
+    return evaluators
+
+
+class _IncrementalSearch:
+    '''Search for a pattern in the lines appended to a file since the last
+    search.'''
+
+    def __init__(self, patt, filename, msg, encoding):
+        self._patt = patt
+        self._filename = filename
+        self._msg = msg or f'pattern {patt!r} found in {filename!r}'
+        self._encoding = encoding
+        self._offset = 0
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+
+        # The last unterminated line of the file
+        self._tail = ''
+
+    def __call__(self):
+        try:
+            with open(self._filename, 'rb') as fp:
+                if os.fstat(fp.fileno()).st_size < self._offset:
+                    # The file was truncated; start over
+                    self._offset = 0
+                    self._decoder.reset()
+                    self._tail = ''
+
+                fp.seek(self._offset)
+                data = fp.read()
+        except FileNotFoundError:
+            # The output may not have been created yet
+            return
+        except OSError as e:
+            raise SanityError(f'{self._filename}: {e.strerror}')
+
+        self._offset += builtins.len(data)
+        lines, nl, self._tail = (
+            self._tail + self._decoder.decode(data)
+        ).rpartition('\n')
+        match = re.search(self._patt, lines + nl, re.MULTILINE)
+        if match:
+            line_start = lines.rfind('\n', 0, match.start()) + 1
+            line_end = lines.find('\n', match.start())
+            if line_end < 0:
+                line_end = builtins.len(lines)
+
+            raise SanityError(
+                f'{_format(self._msg, self._patt, self._filename)}: '
+                f'{lines[line_start:line_end]!r}'
+            )
+
+
+class _OutputMonitor:
+    '''Evaluate deferred sanity expressions periodically on the output of a
+    running job.
+
+    The expressions are passed as a mapping from the name of the check that
+    created them to the expression. Expressions of :func:`assert_not_found`
+    are evaluated incrementally by searching only the complete lines appended
+    to the file since the last check, so that patterns spanning multiple lines
+    may be missed. Their arguments are evaluated once, when the monitor is
+    created. Any other expression is evaluated in full on every check.
+    '''
+
+    def __init__(self, exprs):
+        self._checks = []
+        signature = inspect.signature(assert_not_found.__wrapped__)
+        for name, expr in exprs.items():
+            if (isinstance(expr, _DeferredExpression) and
+                expr._fn is assert_not_found.__wrapped__):
+                bound = signature.bind(*expr._args, **expr._kwargs)
+                bound.apply_defaults()
+                args = bound.arguments
+                args.pop('scan', None)
+                check = _IncrementalSearch(
+                    **{k: evaluate(v) for k, v in args.items()}
+                )
+            else:
+                check = functools.partial(self._evaluate, expr)
+
+            self._checks.append((name, check))
+
+    @staticmethod
+    def _evaluate(expr):
+        ret = evaluate(expr)
+        if not ret:
+            raise SanityError(f'{ret!r} is not True')
+
+    def check(self):
+        '''Evaluate all the expressions.
+
+        :raises reframe.core.exceptions.SanityError: If any of the
+            expressions fails.
+        '''
+        for name, check in self._checks:
+            try:
+                check()
+            except SanityError as err:
+                raise SanityError(
+                    f'early failure check {name!r} failed: {err}'
+                ) from None
+
+
 # Numeric functions
 
 @deferrable
+@_pure
 def avg(iterable):
-    '''Return the average of all the elements of ``iterable``.'''
+    '''Return the average of all the elements of ``iterable``.
+
+    .. versionchanged:: 4.11
+       NumPy arrays are reduced by NumPy.
+    '''
+
+    if _is_array(iterable) and iterable.ndim > 0:
+        if builtins.len(iterable) == 0:
+            raise SanityError('attempt to get average on an empty container')
+
+        return iterable.mean(axis=0).tolist()
 
     # We walk over the iterable manually in case this is a generator
     total = 0
@@ -917,9 +1694,131 @@ def avg(iterable):
     return total / num_vals
 
 
+def _values(iterable):
+    return iterable if _is_array(iterable) else builtins.list(iterable)
+
+
+def _interpolate(vals, q):
+    pos = (builtins.len(vals) - 1) * q / 100
+    lower, upper = math.floor(pos), math.ceil(pos)
+    return vals[lower] + (vals[upper] - vals[lower]) * (pos - lower)
+
+
+@deferrable
+@_pure
+def percentile(iterable, q):
+    '''Return the ``q``-th percentile of the elements of ``iterable``.
+
+    The percentile is interpolated linearly between the two closest elements,
+    as :func:`numpy.percentile` does by default. NumPy is used if it is
+    available, otherwise the percentile is computed in Python.
+
+    :arg iterable: The numeric values, e.g., as returned by
+        :func:`extractall_array`.
+    :arg q: The percentile in the range ``[0, 100]`` or a sequence of
+        percentiles.
+    :returns: The percentile or a list of the percentiles, if ``q`` is a
+        sequence.
+    :raises reframe.core.exceptions.SanityError: If ``iterable`` is empty.
+
+    .. versionadded:: 4.11
+    '''
+    multi = isinstance(q, collections.abc.Iterable)
+    qs = builtins.list(q) if multi else [q]
+    if not builtins.all(0 <= x <= 100 for x in qs):
+        raise ValueError('percentiles must be in the range [0, 100]')
+
+    vals = _values(iterable)
+    if builtins.len(vals) == 0:
+        raise SanityError('attempt to get percentile on an empty container')
+
+    np = _numpy()
+    if np is not None:
+        ret = np.percentile(vals, qs).tolist()
+    else:
+        vals = builtins.sorted(vals)
+        ret = [_interpolate(vals, x) for x in qs]
+
+    return ret if multi else ret[0]
+
+
+@deferrable
+@_pure
+def stddev(iterable, ddof=0):
+    '''Return the standard deviation of the elements of ``iterable``.
+
+    NumPy is used if it is available, otherwise the standard deviation is
+    computed in Python.
+
+    :arg iterable: The numeric values, e.g., as returned by
+        :func:`extractall_array`.
+    :arg ddof: The delta degrees of freedom: the sum of the squared
+        deviations from the mean is divided by ``N - ddof``, where ``N`` is
+        the number of elements. The default ``0`` gives the population
+        standard deviation, whereas ``1`` gives the sample standard
+        deviation.
+    :raises reframe.core.exceptions.SanityError: If ``iterable`` has not
+        more than ``ddof`` elements.
+
+    .. versionadded:: 4.11
+    '''
+    vals = _values(iterable)
+    num_vals = builtins.len(vals)
+    if num_vals <= ddof:
+        raise SanityError(f'attempt to get standard deviation on '
+                          f'{num_vals} element(s) with ddof={ddof}')
+
+    np = _numpy()
+    if np is not None:
+        return float(np.std(vals, ddof=ddof))
+
+    mean = math.fsum(vals) / num_vals
+    return math.sqrt(math.fsum((x - mean)**2 for x in vals) /
+                     (num_vals - ddof))
+
+
+@deferrable
+@_pure
+def trimmed_mean(iterable, proportion):
+    '''Return the mean of the elements of ``iterable`` after trimming a
+    ``proportion`` of the smallest and the largest of them.
+
+    For ``N`` elements, ``int(proportion * N)`` elements are removed from each
+    end, as :func:`scipy.stats.trim_mean` does. NumPy is used if it is
+    available, otherwise the mean is computed in Python.
+
+    :arg iterable: The numeric values, e.g., as returned by
+        :func:`extractall_array`.
+    :arg proportion: The proportion of the elements to trim from each end in
+        the range ``[0, 0.5)``.
+    :raises reframe.core.exceptions.SanityError: If ``iterable`` is empty.
+
+    .. versionadded:: 4.11
+    '''
+    if not 0 <= proportion < 0.5:
+        raise ValueError('proportion must be in the range [0, 0.5)')
+
+    vals = _values(iterable)
+    num_vals = builtins.len(vals)
+    if num_vals == 0:
+        raise SanityError('attempt to get trimmed mean on an empty container')
+
+    cut = builtins.int(proportion * num_vals)
+    np = _numpy()
+    if np is not None:
+        # Partition instead of sorting, since only the trimmed elements need
+        # to be separated from the rest
+        vals = np.partition(vals, (cut, num_vals - cut - 1))
+        return float(vals[cut:num_vals - cut].mean())
+
+    vals = builtins.sorted(vals)[cut:num_vals - cut]
+    return math.fsum(vals) / builtins.len(vals)
+
+
 # Other utility functions
 
 @deferrable
+@_pure
 def allx(iterable):
     '''Same as the built-in :func:`all() <python:all>` function, except that it
     returns :class:`False` if ``iterable`` is empty.
@@ -969,6 +1868,7 @@ def evaluate(expr, cache=False):
 
 
 @deferrable
+@_pure
 def getitem(container, item):
     '''Get ``item`` from ``container``.
 
@@ -986,6 +1886,7 @@ def getitem(container, item):
 
 
 @deferrable
+@_pure
 def count(iterable):
     '''Return the element count of ``iterable``.
 
@@ -1005,6 +1906,7 @@ def count(iterable):
 
 
 @deferrable
+@_pure
 def count_uniq(iterable):
     '''Return the unique element count of ``iterable``.'''
     return builtins.len(builtins.set(iterable))
@@ -92,11 +92,20 @@ In the above example :class:`T` may refer to any type, so that
 :class:`List[List[int]]` is an instance of :class:`List`, but not an instance
 of :class:`List[int]`.
 
+The :py:func:`__isinstancecheck__` method of each type delegates to a checker
+function that is generated on first use specifically for the type
+specification, so that nested types are checked with direct function calls
+and elements of builtin types are checked by :py:func:`isinstance` itself.
+Lists and dictionaries can also be checked incrementally with
+:func:`revalidate`, in which case only their changed elements are checked.
+
 '''
 
 import abc
 import datetime
+import itertools
 import json
+import operator
 import re
 
 
@@ -155,6 +164,92 @@ class ConvertibleType(abc.ABCMeta):
 # container types
 
 
+# Sentinel values of the incremental validators: `_INVALID` denotes a value
+# that failed the type check, whereas `_NOSNAP` denotes either a missing
+# snapshot or a valid value that cannot be validated incrementally
+_INVALID = object()
+_NOSNAP = object()
+
+
+def _is_plain_type(t):
+    # Types that do not customize the `isinstance()` check
+    return type(t) is type or type(t) is abc.ABCMeta
+
+
+def _checker(t):
+    '''Return a function checking if a value is an instance of ``t``.'''
+
+    if isinstance(t, _BuiltinType):
+        return t._checker
+
+    def _check(inst):
+        return isinstance(inst, t)
+
+    return _check
+
+
+def _revalidator(t):
+    '''Return the incremental validator of type ``t``.
+
+    The validator is a function ``(inst, snapshot)`` returning the new
+    snapshot of ``inst`` if it is an instance of ``t`` or :obj:`_INVALID`
+    otherwise. The snapshot of a previous check of ``inst`` allows the
+    validator to skip the elements that have not changed since then.
+    '''
+
+    if isinstance(t, _BuiltinType):
+        return t._revalidator
+
+    if _is_plain_type(t):
+        return _identity_revalidator(_checker(t))
+
+    def _revalidate(inst, snapshot):
+        return _NOSNAP if isinstance(inst, t) else _INVALID
+
+    return _revalidate
+
+
+def _identity_revalidator(check):
+    # For types whose instance check does not depend on the contents of the
+    # instance, the snapshot is the instance itself
+    def _revalidate(inst, snapshot):
+        return inst if inst is snapshot or check(inst) else _INVALID
+
+    return _revalidate
+
+
+def _is_identity_safe(t):
+    if isinstance(t, _BuiltinType):
+        return t._identity_safe()
+
+    return _is_plain_type(t)
+
+
+def revalidate(typ, value, snapshot=None):
+    '''Check if ``value`` is an instance of ``typ`` incrementally.
+
+    :arg snapshot: The snapshot returned by a previous call for the same type
+        or :obj:`None`. If ``value`` is a list or a dictionary that was
+        validated before and has only been extended since then, only its new
+        elements are checked.
+    :returns: A tuple ``(valid, snapshot)``, where ``snapshot`` is to be
+        passed to the next call.
+
+    .. versionadded:: 4.11
+    '''
+
+    if snapshot is None:
+        snapshot = _NOSNAP
+
+    ret = _revalidator(typ)(value, snapshot)
+    if ret is _INVALID:
+        return False, None
+    elif ret is _NOSNAP:
+        return True, None
+    else:
+        return True, ret
+
+
 class _BuiltinType(ConvertibleType):
     def __init__(cls, name, bases, namespace):
         # Make sure that the class defines `_type`
@@ -163,15 +258,71 @@ class _BuiltinType(ConvertibleType):
         assert hasattr(cls, '_type')
         cls.register(cls._type)
 
-    def __instancecheck__(cls, inst):
+    # The type checks are compiled lazily to specialized functions on first
+    # use, since the type specification is only complete after the type is
+    # created; the compiled functions are stored in the class' namespace, so
+    # that they are not inherited
+
+    @property
+    def _checker(cls):
+        try:
+            return cls.__dict__['_rfm_checker']
+        except KeyError:
+            cls._rfm_checker = cls._compile_checker()
+            return cls._rfm_checker
+
+    @property
+    def _revalidator(cls):
+        try:
+            return cls.__dict__['_rfm_revalidator']
+        except KeyError:
+            cls._rfm_revalidator = cls._compile_revalidator()
+            return cls._rfm_revalidator
+
+    def _compile_checker(cls):
+        if hasattr(cls, '_types'):
+            checkers = tuple(_checker(t) for t in cls._types)
+
+            def _check(inst):
+                return any(check(inst) for check in checkers)
+        elif hasattr(cls, '_xtype'):
+            xcheck = _checker(cls._xtype)
+
+            def _check(inst):
+                return not xcheck(inst)
+        else:
+            builtin_type = cls._type
+
+            def _check(inst):
+                return (type(inst) is builtin_type or
+                        issubclass(type(inst), cls))
+
+        return _check
+
+    def _compile_revalidator(cls):
+        if cls._identity_safe():
+            return _identity_revalidator(cls._checker)
+
+        check = cls._checker
+
+        def _revalidate(inst, snapshot):
+            return _NOSNAP if check(inst) else _INVALID
+
+        return _revalidate
+
+    def _identity_safe(cls):
+        '''Check if the validity of an instance depends only on its type.'''
+
         if hasattr(cls, '_types'):
-            return isinstance(inst, cls._types)
-            # return any(issubclass(type(inst), t) for t in cls._types)
+            return all(_is_identity_safe(t) for t in cls._types)
 
         if hasattr(cls, '_xtype'):
-            return not isinstance(inst, cls._xtype)
+            return _is_identity_safe(cls._xtype)
 
-        return issubclass(type(inst), cls)
+        return True
+
+    def __instancecheck__(cls, inst):
+        return cls._checker(inst)
 
     def __or__(cls, other):
         new_type = _BuiltinType(f'{cls.__name__}|{other.__name__}',
@@ -193,14 +344,83 @@ class _SequenceType(_BuiltinType):
         super().__init__(name, bases, namespace)
         cls._elem_type = None
 
-    def __instancecheck__(cls, inst):
-        if not super().__instancecheck__(inst):
-            return False
+    def _compile_checker(cls):
+        base_check = super()._compile_checker()
+        elem_type = cls._elem_type
+        if elem_type is None:
+            return base_check
+
+        if _is_plain_type(elem_type):
+            # Let `isinstance()` iterate over the elements
+            def _check(inst):
+                return base_check(inst) and all(
+                    map(isinstance, inst, itertools.repeat(elem_type))
+                )
+        else:
+            elem_check = _checker(elem_type)
+
+            def _check(inst):
+                return base_check(inst) and all(map(elem_check, inst))
+
+        return _check
+
+    def _compile_revalidator(cls):
+        if (cls._elem_type is None or cls._type is not list or
+            _is_plain_type(cls._elem_type)):
+            # Checking the elements against a plain type is as cheap as
+            # comparing them against a snapshot
+            return super()._compile_revalidator()
+
+        base_check = super()._compile_checker()
+        elem_check = _checker(cls._elem_type)
+        if _is_identity_safe(cls._elem_type):
+            # The snapshot is the list and a copy of its elements; only the
+            # elements appended to the same list since the snapshot was taken
+            # need to be checked
+            def _revalidate(inst, snapshot):
+                if not base_check(inst):
+                    return _INVALID
+
+                start = 0
+                if snapshot is not _NOSNAP and snapshot[0] is inst:
+                    elems = snapshot[1]
+                    if (len(inst) >= len(elems) and
+                        all(map(operator.is_, elems, inst))):
+                        start = len(elems)
+
+                if not all(map(elem_check,
+                               itertools.islice(inst, start, None))):
+                    return _INVALID
+
+                return inst, tuple(inst)
+        else:
+            elem_revalidate = _revalidator(cls._elem_type)
 
-        if cls._elem_type is None:
-            return True
+            def _revalidate(inst, snapshot):
+                if not base_check(inst):
+                    return _INVALID
 
-        return all(isinstance(c, cls._elem_type) for c in inst)
+                if snapshot is not _NOSNAP and snapshot[0] is inst:
+                    elem_snapshots = snapshot[1]
+                else:
+                    elem_snapshots = ()
+
+                ret = []
+                for elem, elem_snapshot in itertools.zip_longest(
+                    inst, elem_snapshots[:len(inst)], fillvalue=_NOSNAP
+                ):
+                    elem_snapshot = elem_revalidate(elem, elem_snapshot)
+                    if elem_snapshot is _INVALID:
+                        return _INVALID
+
+                    ret.append(elem_snapshot)
+
+                return inst, tuple(ret)
+
+        return _revalidate
+
+    def _identity_safe(cls):
+        return cls._elem_type is None
 
     def __getitem__(cls, elem_type):
         if not isinstance(elem_type, type):
@@ -236,26 +456,34 @@ class _TupleType(_SequenceType):
     Tuples may contain uniformly-typed elements or non-uniformly typed ones.
     '''
 
-    def __instancecheck__(cls, inst):
-        if not super().__instancecheck__(inst):
-            return False
-
-        if not issubclass(type(inst), cls):
-            return False
-
+    def _compile_checker(cls):
+        base_check = _BuiltinType._compile_checker(cls)
         if cls._elem_type is None:
-            return True
+            return base_check
 
         if len(cls._elem_type) == 1:
             # tuple with elements of the same type
-            return all(isinstance(c, cls._elem_type[0]) for c in inst)
+            elem_check = _checker(cls._elem_type[0])
+
+            def _check(inst):
+                return base_check(inst) and all(map(elem_check, inst))
+
+            return _check
 
         # Non-uniformly typed tuple
-        if len(inst) != len(cls._elem_type):
-            return False
+        elem_checks = tuple(_checker(t) for t in cls._elem_type)
+        num_elems = len(elem_checks)
 
-        return all(isinstance(elem, req_type)
-                   for req_type, elem in zip(cls._elem_type, inst))
+        def _check(inst):
+            return (base_check(inst) and len(inst) == num_elems and
+                    all(check(elem)
+                        for check, elem in zip(elem_checks, inst)))
+
+        return _check
+
+    def _identity_safe(cls):
+        return (cls._elem_type is None or
+                all(_is_identity_safe(t) for t in cls._elem_type))
 
     def __getitem__(cls, elem_types):
         if not isinstance(elem_types, tuple):
@@ -298,22 +526,65 @@ class _MappingType(_BuiltinType):
         cls._bases = bases
         cls._namespace = namespace
 
-    def __instancecheck__(cls, inst):
-        if not super().__instancecheck__(inst):
-            return False
+    def _compile_checker(cls):
+        base_check = super()._compile_checker()
+        if cls._key_type is None and cls._value_type is None:
+            return base_check
 
-        if not issubclass(type(inst), cls):
-            return False
+        assert cls._key_type is not None and cls._value_type is not None
+        key_check = _checker(cls._key_type)
+        value_check = _checker(cls._value_type)
+
+        def _check(inst):
+            return (base_check(inst) and
+                    all(map(key_check, inst.keys())) and
+                    all(map(value_check, inst.values())))
+
+        return _check
+
+    def _compile_revalidator(cls):
+        if (cls._key_type is None or cls._type is not dict or
+            _is_plain_type(cls._value_type)):
+            return super()._compile_revalidator()
+
+        # The snapshot is the dictionary and a mapping of its keys to the
+        # snapshots of the corresponding values; only the new keys and the
+        # changed values since the snapshot was taken need to be checked
+        base_check = super()._compile_checker()
+        key_check = _checker(cls._key_type)
+        value_revalidate = _revalidator(cls._value_type)
+
+        def _revalidate(inst, snapshot):
+            if not base_check(inst):
+                return _INVALID
+
+            if snapshot is not _NOSNAP and snapshot[0] is inst:
+                entries = snapshot[1]
+            else:
+                entries = {}
+
+            ret = {}
+            for key, value in inst.items():
+                try:
+                    old_key, value_snapshot = entries[key]
+                except KeyError:
+                    old_key, value_snapshot = _NOSNAP, _NOSNAP
 
-        if cls._key_type is None and cls._key_type is None:
-            return True
+                if old_key is not key and not key_check(key):
+                    return _INVALID
 
-        assert cls._key_type is not None and cls._value_type is not None
-        has_valid_keys = all(isinstance(k, cls._key_type)
-                             for k in inst.keys())
-        has_valid_values = all(isinstance(v, cls._value_type)
-                               for v in inst.values())
-        return has_valid_keys and has_valid_values
+                value_snapshot = value_revalidate(value, value_snapshot)
+                if value_snapshot is _INVALID:
+                    return _INVALID
+
+                ret[key] = (key, value_snapshot)
+
+            return inst, ret
+
+        return _revalidate
+
+    def _identity_safe(cls):
+        return cls._key_type is None
 
     def __getitem__(cls, typespec):
         try:
@@ -361,15 +632,21 @@ class _MappingType(_BuiltinType):
 class _StrType(_SequenceType):
     '''A metaclass for type checking string types.'''
 
-    def __instancecheck__(cls, inst):
-        if not issubclass(type(inst), cls):
-            return False
-
+    def _compile_checker(cls):
+        base_check = _BuiltinType._compile_checker(cls)
         if cls._elem_type is None:
-            return True
+            return base_check
 
         # _elem_type is a regex
-        return re.fullmatch(cls._elem_type, inst) is not None
+        fullmatch = re.compile(cls._elem_type).fullmatch
+
+        def _check(inst):
+            return base_check(inst) and fullmatch(inst) is not None
+
+        return _check
+
+    def _identity_safe(cls):
+        return True
 
     def __getitem__(cls, patt):
         if not isinstance(patt, str):
@@ -1559,3 +1559,31 @@ def test_performance_compare(run_reframe, table_format, monkeypatch):
             action='--performance-compare=now-1m:now/now-1d:now/mean:+foo/+bar'
         )
     )
+
+
+def test_import_time():
+    # Import the CLI in a fresh interpreter and check that no heavy optional
+    # modules are imported and that the import time (in us) is within budget
+    completed = osext.run_command(
+        [sys.executable, '-X', 'importtime', '-c',
+         'import reframe.frontend.cli'], check=True, cwd=INSTALL_PREFIX
+    )
+    import_times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        _, cumulative, modname = line.split('|')
+        with contextlib.suppress(ValueError):
+            import_times[modname.strip()] = int(cumulative)
+
+    for modname in ('jinja2', 'jsonschema', 'lxml', 'polars',
+                    'requests', 'yaml'):
+        assert modname not in import_times
+
+    budgets = {
+        'reframe': 2_000_000,
+        'reframe.frontend.cli': 3_000_000
+    }
+    for modname, budget in budgets.items():
+        assert import_times[modname] < budget
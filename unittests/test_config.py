@@ -4,6 +4,8 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import json
+import jsonschema
+import os
 import pytest
 import sys
 import yaml
@@ -388,6 +390,59 @@ def test_sticky_options(site_config):
     assert site_config.get('environments/@PrgEnv-cray/cc') == 'cc'
 
 
+def test_option_cache(site_config):
+    site_config.select_subconfig('testsys:login')
+    assert site_config.get('systems/0/partitions/0/name') == 'login'
+    site_config.select_subconfig('testsys:gpu')
+    assert site_config.get('systems/0/partitions/0/name') == 'gpu'
+    site_config.select_subconfig('testsys:login')
+    assert site_config.get('systems/0/partitions/0/name') == 'login'
+
+    # Sticky and default values must be copied on every access
+    site_config.add_sticky_option('modes/options', ['foo'])
+    site_config.get('modes/0/options').append('bar')
+    assert site_config.get('modes/0/options') == ['foo']
+    site_config.get('general/0/remote_install').append('foo')
+    assert site_config.get('general/0/remote_install') == []
+
+
+def test_config_cache(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / 'cache')
+    num_validations = 0
+    validate = jsonschema.validate
+
+    def _validate(*args, **kwargs):
+        nonlocal num_validations
+        num_validations += 1
+        return validate(*args, **kwargs)
+
+    def _load_config(descr=None):
+        site_config = config.load_config(
+            'unittests/resources/config/settings.py', cache_dir=cache_dir
+        )
+        if descr:
+            site_config['systems'][0]['descr'] = descr
+
+        site_config.validate()
+        site_config.select_subconfig('testsys:gpu')
+        return site_config
+
+    monkeypatch.setattr(jsonschema, 'validate', _validate)
+    site_config = _load_config()
+    assert num_validations == 1
+    assert len(os.listdir(cache_dir)) == 2
+
+    cached_config = _load_config()
+    assert num_validations == 1
+    assert str(cached_config) == str(site_config)
+    assert cached_config.get('systems/0/partitions/0/name') == 'gpu'
+
+    # Any change in the configuration must invalidate the cache
+    _load_config('changed')
+    assert num_validations == 2
+    assert len(os.listdir(cache_dir)) == 4
+
+
 @pytest.fixture
 def write_config(tmp_path):
     def _write_config(config):
@@ -3,6 +3,7 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import io
 import pytest
 import reframe.utility.sanity as sn
 
@@ -73,6 +74,94 @@ def test_evaluate_cached():
     assert expr.evaluate() == 3
 
 
+def test_expression_cache():
+    from reframe.core.deferrable import expression_cache, _pure
+
+    calls = []
+
+    @sn.deferrable
+    @_pure
+    def my_expr(x, *, y=0):
+        calls.append(x)
+        return x + y
+
+    with expression_cache() as cache:
+        shared = my_expr(1)
+        assert sn.evaluate(shared + my_expr(1)) == 2
+        assert sn.evaluate(shared * 3) == 3
+        assert calls == [1]
+        assert cache.hits == 2
+
+        # Expressions with different arguments are evaluated
+        assert my_expr(1, y=1) == 2
+        assert my_expr((1, 2), y=(3,)) == (1, 2, 3)
+        assert my_expr(1.0) == 1.0
+        assert calls == [1, 1, (1, 2), 1.0]
+
+        # Mutable arguments are compared by identity
+        l = [1]
+        assert my_expr(l, y=[2]) == [1, 2]
+        assert my_expr(l, y=[2]) == [1, 2]
+        assert len(calls) == 6
+
+        # Nested contexts share the cache
+        with expression_cache() as inner:
+            assert inner is cache
+
+    # Values are not cached outside the context
+    assert my_expr(1) == 1
+    assert len(calls) == 7
+
+    # Repeated evaluations in a new context are evaluated again
+    with expression_cache():
+        assert my_expr(1) == 1
+        assert len(calls) == 8
+
+
+def test_expression_cache_impure():
+    from reframe.core.deferrable import expression_cache
+
+    class _C:
+        x = 1
+
+    stream = io.StringIO()
+    obj = _C()
+    with expression_cache() as cache:
+        # Functions with side effects are evaluated every time
+        assert sn.evaluate(sn.print(1, file=stream) +
+                           sn.print(1, file=stream)) == 2
+        assert stream.getvalue() == '1\n1\n'
+
+        # Impure expressions are not merged, not even as arguments
+        assert sn.evaluate(sn.getattr(obj, 'x') + 1) == 2
+        obj.x = 2
+        assert sn.evaluate(sn.getattr(obj, 'x') + 1) == 3
+        assert cache.hits == 0
+
+
+def test_expression_cache_mutable_values():
+    from reframe.core.deferrable import expression_cache
+
+    # Every consumer of a cached mutable value gets its own copy
+    l = [3, 1, 2]
+    with expression_cache() as cache:
+        first = sn.evaluate(sn.sorted(l))
+        first.append(4)
+        second = sn.evaluate(sn.sorted(l))
+        assert cache.hits == 1
+        assert second == [1, 2, 3]
+        assert second is not first
+
+
+def test_expression_cache_iterators():
+    from reframe.core.deferrable import expression_cache
+
+    with expression_cache():
+        it = sn.map(lambda x: x, [1, 2])
+        assert sn.evaluate(sn.count(it)) == 2
+        assert sn.evaluate(sn.sum(it)) == 3
+
+
 def test_implicit_eval():
     # Call to bool() on a deferred expression triggers its immediate
     # evaluation.
@@ -3,6 +3,7 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import collections
 import functools
 import itertools
 import pytest
@@ -796,3 +797,53 @@ def test_toposort_subgraph(default_exec_ctx):
 
     assert cases_by_level[1] == {'t3'}
     assert cases_by_level[2] == {'t4'}
+
+
+def test_large_graph():
+    # Build, validate, prune and sort a synthetic graph with a million edges
+    # and a dependency chain much deeper than the recursion limit
+    class _Check:
+        def __init__(self, name, deps):
+            self.unique_name = name
+            self.name = self.display_name = name
+            self._deps = deps
+
+        def user_deps(self):
+            return self._deps
+
+    _P = collections.namedtuple('_Partition', ['name', 'fullname'])
+    _E = collections.namedtuple('_Environment', ['name'])
+
+    num_tests, num_deps = 20000, 50
+    part, env = _P('p0', 'sys0:p0'), _E('e0')
+
+    def make_cases(unresolved=False):
+        cases = []
+        for i in range(num_tests):
+            deps = [(f't{j}', udeps.by_env)
+                    for j in range(max(0, i - num_deps), i)]
+            if unresolved and i == num_tests // 2:
+                deps.append(('tX', udeps.by_env))
+
+            cases.append(executors.TestCase(_Check(f't{i}', deps), part, env))
+
+        return cases
+
+    deps, skipped_cases = dependencies.build_deps(make_cases())
+    assert not skipped_cases
+    assert sum(len(adj) for adj in deps.values()) > 10**6 - num_deps**2
+    dependencies.validate_deps(deps)
+
+    cases = dependencies.toposort(deps)
+    assert [c.check.unique_name for c in cases] == [f't{i}'
+                                                    for i in range(num_tests)]
+    assert cases[-1].level == num_tests - 1
+
+    pruned_deps = dependencies.prune_deps(deps, cases[-1:], max_depth=1)
+    assert len(pruned_deps) == 1
+    assert len(pruned_deps[cases[-1]]) == num_deps
+
+    # All the cases from the unresolved one onwards must be skipped
+    deps, skipped_cases = dependencies.build_deps(make_cases(unresolved=True))
+    assert len(deps) == num_tests // 2
+    assert len(skipped_cases) == num_tests // 2
@@ -3,12 +3,14 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import gc
 import pytest
 import semver
 import warnings
 
 import reframe
 import reframe.core.fields as fields
+import reframe.utility.typecheck as typ
 from reframe.core.warnings import ReframeDeprecationWarning
 from reframe.utility import ScopedDict
 
@@ -92,6 +94,72 @@ def test_typed_field():
     tester.field_convertible = '1'
 
 
+def test_typed_field_cached_check():
+    class FieldTester:
+        field = fields.TypedField(typ.Str[r'^\S+$'], float)
+
+    tester = FieldTester()
+    for _ in range(2):
+        tester.field = 'foo'
+        tester.field = 1.0
+        assert tester.field == 1.0
+
+    # Values that compare equal to a valid value must still be checked
+    with pytest.raises(TypeError):
+        tester.field = 1
+
+    with pytest.raises(TypeError):
+        tester.field = 'foo bar'
+
+
+def test_typed_field_incremental_check(monkeypatch):
+    class FieldTester:
+        field = fields.TypedField(typ.List[typ.Str[r'^\S+$']])
+        scoped = fields.ScopedDictField(typ.Tuple[float, str])
+
+    # No snapshots are kept for short values
+    tester = FieldTester()
+    tester.field = ['-a', '-b']
+    tester.field += ['-c']
+    assert not FieldTester.__dict__['field']._snapshots
+
+    monkeypatch.setattr(fields, '_INCREMENTAL_MIN_LEN', 1)
+    tester.field = ['-a', '-b']
+    tester.field += ['-c']
+    assert tester.field == ['-a', '-b', '-c']
+
+    # Appended and replaced elements must be checked
+    with pytest.raises(TypeError):
+        tester.field += ['-d e']
+
+    tester.field = ['-a', '-b']
+    tester.field[0] = 'a b'
+    with pytest.raises(TypeError):
+        tester.field = tester.field
+
+    refs = {'a': {'k1': (1.0, 's')}}
+    tester.scoped = refs
+    refs['b'] = {'k1': (2.0, 's')}
+    tester.scoped = refs
+    assert tester.scoped['b:k1'] == (2.0, 's')
+
+    refs['a']['k2'] = (1, 's')
+    with pytest.raises(TypeError):
+        tester.scoped = refs
+
+    # The snapshots are kept per object and they are released with it
+    field = FieldTester.__dict__['field']
+    other = FieldTester()
+    other.field = ['-a']
+    assert len(field._snapshots) == 2
+    del tester, other
+
+    # Collect the reference cycles of the tracebacks of the errors above
+    gc.collect()
+    assert not field._snapshots
+    assert not FieldTester.__dict__['scoped']._snapshots
+
+
 def test_typed_field_convertible():
     class FieldTester:
         fieldA = fields.TypedField(int, str)
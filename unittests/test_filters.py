@@ -10,6 +10,7 @@ import reframe as rfm
 import reframe.core.exceptions as errors
 import reframe.frontend.executors as executors
 import reframe.frontend.filters as filters
+import reframe.frontend.testindex as testindex
 import reframe.utility.sanity as sn
 import unittests.utility as test_util
 
@@ -168,3 +169,47 @@ def test_validates_expr_invalid(sample_cases):
 
     # invalid syntax
     assert count_checks(validates('"foo" i tags'), sample_cases) == 0
+
+
+def test_filters_on_index():
+    class _T(rfm.RegressionTest):
+        p = parameter([1] + list(range(11)))
+        valid_systems = ['*']
+        valid_prog_environs = ['*']
+        tags = {'foo'}
+
+    class _D(rfm.RegressionTest):
+        valid_systems = ['*']
+        valid_prog_environs = ['*']
+        tags = {'foo'}
+
+        @run_after('init')
+        def set_tags(self):
+            self.tags = {'bar'}
+
+    index_cases = [
+        testindex._IndexCase(
+            testindex.TestIndexEntry(cls, (), {'variant_num': v}, None)
+        )
+        for cls in (_T, _D) for v in range(cls.num_variants)
+    ]
+    check_cases = [executors.TestCase(_T(variant_num=v), None, None)
+                   for v in range(_T.num_variants)]
+    for i, case in enumerate(check_cases):
+        entry = index_cases[i].check
+        assert entry.is_static
+        assert entry.unique_name == case.check.unique_name
+        assert entry.display_name == case.check.display_name
+        assert entry.hashcode == case.check.hashcode
+
+    assert not index_cases[-1].check.is_static
+    assert index_cases[-1].check.tags is None
+    for names in (['.*%p=1'], ['_T@2'], ['/0951c7ff', '/37e9e1c6']):
+        assert (count_checks(filters.have_any_name(names), index_cases) ==
+                count_checks(filters.have_any_name(names), check_cases))
+
+    # Non-static entries are always selected by the tag filters
+    assert 13 == count_checks(testindex.if_static(filters.have_tag('foo')),
+                              index_cases)
+    assert 1 == count_checks(testindex.if_static(filters.have_tag('bar')),
+                             index_cases)
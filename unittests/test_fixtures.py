@@ -254,6 +254,29 @@ def test_fixture_space_access():
     assert Foo.fixture_space['f1'].action == 'join'
 
 
+def test_fixture_space_large():
+    class P0(rfm.RunOnlyRegressionTest):
+        p0 = parameter(range(100))
+
+    class Foo(rfm.RegressionTestPlugin):
+        f0 = fixture(P0)
+        f1 = fixture(P0)
+        f2 = fixture(P0)
+        f3 = fixture(P0)
+        f4 = fixture(P0)
+
+    # The fixture space points are not enumerated eagerly
+    assert len(Foo.fixture_space) == 100**5
+    assert Foo.num_variants == 100**5
+    assert Foo.fixture_space[0] == {f'f{i}': (0,) for i in range(5)}
+    assert Foo.fixture_space[-1] == {f'f{i}': (99,) for i in range(5)}
+    assert Foo.fixture_space[123] == {'f0': (23,), 'f1': (1,), 'f2': (0,),
+                                      'f3': (0,), 'f4': (0,)}
+    assert next(iter(Foo.fixture_space)) == ((0,),) * 5
+    with pytest.raises(IndexError):
+        Foo.fixture_space[100**5]
+
+
 def test_fixture_inject_bad_index():
     class Foo(rfm.RegressionTest):
         f = fixture(rfm.RegressionTest)
@@ -377,6 +400,31 @@ def test_fixture_registry_all(ctx_sys, simple_fixture):
     assert simple_fixture().cls in reg
 
 
+def test_fixture_registry_names(ctx_sys, simple_fixture, simple_test):
+    def register(reg, **kwargs):
+        return reg.add(simple_fixture(scope='session', **kwargs), 0,
+                       simple_test(['*'], ['*']))
+
+    # Registering the same fixture from different tests yields the same name
+    names = register(fixtures.FixtureRegistry())
+    assert register(fixtures.FixtureRegistry()) == names
+    assert register(fixtures.FixtureRegistry(), variables={'v': 2}) != names
+
+    # Variables that compare equal, but are formatted differently, yield
+    # different names
+    names = register(fixtures.FixtureRegistry(), variables={'v': 1})
+    assert register(fixtures.FixtureRegistry(),
+                    variables={'v': True}) != names
+
+    # Unhashable variables are also supported
+    assert (register(fixtures.FixtureRegistry(), variables={'v': [1]}) ==
+            register(fixtures.FixtureRegistry(), variables={'v': [1]}))
+
+    # The index of the names is scoped to the session
+    assert fixtures.FixtureRegistry()._names is rt.runtime()._fixture_names
+    assert rt.runtime()._fixture_names
+
+
 def test_fixture_registry_edge_cases(ctx_sys, simple_fixture, simple_test):
     '''Test edge cases.'''
 
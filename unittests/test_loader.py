@@ -8,6 +8,7 @@ import pytest
 import shutil
 
 import reframe as rfm
+import reframe.frontend.filters as filters
 from reframe.core.exceptions import ReframeSyntaxError
 from reframe.frontend.loader import RegressionCheckLoader
 
@@ -63,6 +64,64 @@ def test_load_all(loader_with_path):
     assert 12 == len(checks)
 
 
+def test_load_all_select():
+    loader = RegressionCheckLoader(
+        ['unittests/resources/checks_unlisted/deps_complex.py']
+    )
+    checks = loader.load_all(select=[filters.have_any_name(['T1$'])])
+
+    # Only T1 and the tests it depends on must be instantiated
+    assert {c.unique_name for c in checks} == {'T0', 'T1', 'T4', 'T5'}
+    assert len(loader.index) == 10
+    assert [e.unique_name for e in loader.index.lookup('T4')] == ['T4']
+    assert loader.index.lookup('T10') == []
+    assert 3 == len(loader.index.select(filters.have_any_name(['T[0-2]$'])))
+
+
+def test_load_all_select_parallel(tmp_path):
+    (tmp_path / 'base.py').write_text(
+        'import reframe as rfm\n'
+        '@rfm.simple_test\n'
+        'class T0(rfm.RunOnlyRegressionTest):\n'
+        '    valid_systems = ["*"]\n'
+        '    valid_prog_environs = ["*"]\n'
+        '    executable = "echo"\n'
+    )
+    (tmp_path / 'derived.py').write_text(
+        'import reframe as rfm\n'
+        '@rfm.simple_test\n'
+        'class T1(rfm.RunOnlyRegressionTest):\n'
+        '    p = parameter(range(10))\n'
+        '    valid_systems = ["*"]\n'
+        '    valid_prog_environs = ["*"]\n'
+        '    executable = "echo"\n'
+        '    @run_after("init")\n'
+        '    def set_deps(self):\n'
+        '        self.depends_on("T0")\n'
+    )
+    (tmp_path / 'other.py').write_text(
+        'import reframe as rfm\n'
+        '@rfm.simple_test\n'
+        'class T2(rfm.RunOnlyRegressionTest):\n'
+        '    valid_systems = ["*"]\n'
+        '    valid_prog_environs = ["*"]\n'
+        '    executable = "echo"\n'
+    )
+    (tmp_path / 'broken.py').write_text(
+        'import reframe as rfm\nraise OSError("foo")\n'
+    )
+    (tmp_path / 'notatest.py').write_text('x = 1\n')
+    select = [filters.have_any_name(['T1%p=[13]'])]
+    loaders = [RegressionCheckLoader([str(tmp_path)], load_workers=n)
+               for n in (1, 2)]
+    checks = [loader.load_all(force=True, select=select)
+              for loader in loaders]
+    assert ([c.unique_name for c in checks[0]] ==
+            [c.unique_name for c in checks[1]] == ['T1_01', 'T1_03', 'T0'])
+    assert len(loaders[0].index) == len(loaders[1].index) == 12
+    assert [e.unique_name for e in loaders[1].index.lookup('T2')] == ['T2']
+
+
 def test_load_error(loader):
     with pytest.raises(OSError):
         loader.load_from_file('unittests/resources/checks/foo.py')
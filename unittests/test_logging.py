@@ -3,12 +3,17 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import gzip
+import http.server
+import json
 import logging
 import logging.handlers
 import os
 import pytest
 import re
+import requests
 import sys
+import threading
 import time
 from datetime import datetime
 
@@ -423,6 +428,90 @@ def test_file_handler_timestamp(make_exec_ctx, config_file,
     assert os.path.exists(filename)
 
 
+def test_queued_handler(make_exec_ctx, config_file,
+                        logfile, logging_sandbox):
+    make_exec_ctx(
+        config_file({
+            'level': 'info',
+            'handlers': [
+                {
+                    'type': 'file',
+                    'name': str(logfile),
+                    'level': 'warning',
+                    'queue_enable': True
+                },
+            ],
+            'handlers_perflog': []
+        })
+    )
+    rlog.configure_logging(rt.runtime().site_config)
+    handler = rlog.getlogger().logger.handlers[-1]
+    assert isinstance(handler, rlog.QueuedHandler)
+    assert rlog.log_files() == [str(logfile)]
+    rlog.getlogger().info('foo')
+    rlog.getlogger().warning('bar')
+    assert not _found_in_logfile('foo', logfile)
+    assert _found_in_logfile('bar', logfile)
+
+
+class _SlowHandler(logging.Handler):
+    '''Handler that blocks on its first record until it is released.'''
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.emitting = threading.Event()
+        self.released = threading.Event()
+
+    def emit(self, record):
+        self.emitting.set()
+        self.released.wait()
+        if record.msg == 'error':
+            raise ReframeError('handler error')
+
+        self.records.append(record.msg)
+
+
+@pytest.mark.parametrize('overflow', ['drop', 'spill'])
+def test_queued_handler_overflow(overflow):
+    target = _SlowHandler()
+    handler = rlog.QueuedHandler(target, maxsize=1, overflow=overflow)
+    handler.handle(logging.makeLogRecord({'msg': 'rec0'}))
+
+    # Wait for the listener to block on the first record and fill the queue
+    assert target.emitting.wait(10)
+    for i in range(1, 4):
+        handler.handle(logging.makeLogRecord({'msg': f'rec{i}'}))
+
+    target.released.set()
+    handler.close()
+    if overflow == 'drop':
+        assert target.records == ['rec0', 'rec1']
+    else:
+        assert target.records == ['rec0', 'rec1', 'rec2', 'rec3']
+
+    # Closing the handler again is a no-op
+    handler.close()
+
+
+def test_queued_handler_errors(logging_sandbox):
+    target = _SlowHandler()
+    target.released.set()
+    handler = rlog.QueuedHandler(target)
+    handler.handle(logging.makeLogRecord({'msg': 'error'}))
+    handler.handle(logging.makeLogRecord({'msg': 'rec'}))
+    handler.flush()
+    handler.close()
+
+    # The listener must survive the errors of the handler
+    assert target.records == ['rec']
+
+
+def test_queued_handler_invalid_overflow():
+    with pytest.raises(ValueError):
+        rlog.QueuedHandler(_SlowHandler(), overflow='foo')
+
+
 def test_syslog_handler(make_exec_ctx, config_file, logging_sandbox):
     import platform
 
@@ -499,6 +588,37 @@ def test_logging_context_check(default_exec_ctx, fake_check,
     )
 
 
+def test_logging_context_check_fields(default_exec_ctx, fake_check,
+                                      logfile, logging_sandbox):
+    rlog.configure_logging(rt.runtime().site_config)
+    assert rlog.getlogger().logger.check_fields == {'check_name'}
+    with rlog.logging_context(check=fake_check) as logger:
+        logger.error('error from context')
+
+        # Only the check fields used by the handlers are resolved
+        assert logger.extra['check_name'] == '_FakeCheck %param=10'
+        assert 'check_custom' not in logger.extra
+        assert 'check_custom' in logger.extra['__rfm_loggable_attrs__']
+
+    assert _found_in_logfile(
+        '_FakeCheck %param=10: ERROR: error from context', logfile
+    )
+
+
+def test_check_fields_all(make_exec_ctx, config_file, logging_sandbox):
+    make_exec_ctx(config_file({
+        'level': 'info',
+        'handlers': [{
+            'type': 'stream',
+            'name': 'stderr',
+            'format': '%(check_#ALL)s'
+        }],
+        'handlers_perflog': []
+    }))
+    rlog.configure_logging(rt.runtime().site_config)
+    assert rlog.getlogger().logger.check_fields is None
+
+
 def test_logging_context_error(default_exec_ctx, logfile, logging_sandbox):
     rlog.configure_logging(rt.runtime().site_config)
     try:
@@ -576,10 +696,10 @@ def record_with_check_tags():
 
 @pytest.fixture
 def mock_requests_post_200(monkeypatch):
-    def mock_post(url, **kwargs):
+    def mock_post(session, url, **kwargs):
         return type('Response', (object,), {'status_code': 200, 'ok': True})()
 
-    monkeypatch.setattr(rlog.requests, 'post', mock_post)
+    monkeypatch.setattr(requests.Session, 'post', mock_post)
 
 
 @pytest.fixture
@@ -601,3 +721,107 @@ def test_httpjson_auth_header_set(httpjson_handler,
     httpjson_handler.emit(record_with_check_tags)
     assert httpjson_handler._authorization_header is not None
     assert httpjson_handler._headers['Authorization'] == 'Bearer mocked_token'
+
+
+@pytest.fixture
+def httpjson_server():
+    '''A local HTTP server recording the requests that it receives.
+
+    The server responds with the status codes in its `status_codes` list, as
+    long as there are any, and with 200 afterwards.
+    '''
+
+    class _Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers['Content-Length']))
+            if self.headers.get('Content-Encoding') == 'gzip':
+                body = gzip.decompress(body)
+
+            self.server.requests.append((dict(self.headers), body.decode()))
+            try:
+                code = self.server.status_codes.pop(0)
+            except IndexError:
+                code = 200
+
+            self.send_response(code)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.requests = []
+    server.status_codes = []
+    server.url = f'http://127.0.0.1:{server.server_port}/rfm'
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,))
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def _httpjson_record(name):
+    record = logging.makeLogRecord({'check_name': name})
+    record.check_tags = set()
+    return record
+
+
+def test_httpjson_handler(httpjson_server):
+    httpjson_server.status_codes = [429, 429]
+    handler = rlog.HTTPJSONHandler(httpjson_server.url,
+                                   backoff_intervals=[0.01])
+    handler.emit(_httpjson_record('rec0'))
+    handler.emit(_httpjson_record('rec1'))
+    handler.close()
+
+    # The first record is posted three times due to the backoff
+    assert len(httpjson_server.requests) == 4
+    headers, body = httpjson_server.requests[-1]
+    assert headers['Content-type'] == 'application/json'
+    assert json.loads(body)['check_name'] == 'rec1'
+
+    httpjson_server.status_codes = [500]
+    handler = rlog.HTTPJSONHandler(httpjson_server.url)
+    with pytest.raises(ReframeError, match='HTTP response code 500'):
+        handler.emit(_httpjson_record('rec2'))
+
+    handler.close()
+
+
+def test_httpjson_handler_batches(httpjson_server):
+    handler = rlog.HTTPJSONHandler(httpjson_server.url, batch_size=2,
+                                   compress=True)
+    for i in range(3):
+        handler.emit(_httpjson_record(f'rec{i}'))
+
+    assert len(httpjson_server.requests) == 1
+
+    # The incomplete batch is sent when the handler is closed
+    handler.close()
+    assert len(httpjson_server.requests) == 2
+    batches = []
+    for headers, body in httpjson_server.requests:
+        assert headers['Content-type'] == 'application/x-ndjson'
+        assert headers['Content-Encoding'] == 'gzip'
+        assert body.endswith('\n')
+        batches.append([json.loads(line)['check_name']
+                        for line in body.splitlines()])
+
+    assert batches == [['rec0', 'rec1'], ['rec2']]
+
+
+def test_httpjson_handler_batch_timeout(httpjson_server):
+    handler = rlog.HTTPJSONHandler(httpjson_server.url, batch_size=10,
+                                   batch_timeout=0.1)
+    handler.emit(_httpjson_record('rec0'))
+    timeout = time.time() + 10
+    while not httpjson_server.requests:
+        assert time.time() < timeout
+        time.sleep(0.05)
+
+    handler.close()
+    assert len(httpjson_server.requests) == 1
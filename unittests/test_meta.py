@@ -376,6 +376,48 @@ def test_performance_function_errors(MyMeta):
                 pass
 
 
+def test_early_failure(MyMeta):
+    class Base(MyMeta):
+        @early_failure
+        def check_a(self):
+            return 'A'
+
+        @early_failure
+        def check_b(self):
+            return 'B'
+
+    assert set(Base._rfm_early_failure_fns) == {'check_a', 'check_b'}
+    assert isinstance(Base().check_a(), deferrable._DeferredExpression)
+
+    class Derived(Base):
+        def check_a(self):
+            '''Override check with a normal function.'''
+
+        @early_failure
+        def check_b(self):
+            return 'C'
+
+        @early_failure
+        def check_c(self):
+            return 'D'
+
+    fns = Derived._rfm_early_failure_fns
+    assert set(fns) == {'check_b', 'check_c'}
+    assert fns['check_b']('self').evaluate() == 'C'
+
+
+def test_double_define_early_failure(MyMeta):
+    with pytest.raises(ReframeSyntaxError):
+        class Foo(MyMeta):
+            @early_failure
+            def foo(self):
+                pass
+
+            @early_failure
+            def foo(self):
+                '''This doesn't make sense, so we raise an error'''
+
+
 def test_setting_variables_on_instantiation(MyMeta):
     class Foo(MyMeta):
         v = variable(int, value=1)
@@ -6,6 +6,7 @@
 
 import pytest
 import inspect
+import sys
 
 
 import reframe as rfm
@@ -198,6 +199,28 @@ def test_simple_test_decorator():
         assert test.P2 is not None
 
 
+def test_simple_test_decorator_select():
+    @rfm.simple_test
+    class MyTest(ExtendParams):
+        pass
+
+    registry = inspect.getmodule(MyTest)._rfm_test_registry
+    assert registry.num_variants() >= 8
+
+    conditions = {'P1': lambda x: x in ('c', 'd'), 'P2': 'f'}
+    variants = list(registry.variants(tests=[MyTest], conditions=conditions))
+    assert len(variants) == 2
+
+    tests = registry.instantiate_all(variants=variants)
+    assert len(tests) == 2
+    for test in tests:
+        assert test.P1 in ('c', 'd')
+        assert test.P2 == 'f'
+
+    # Tests not defining the parameters in the conditions are skipped
+    assert [] == list(registry.variants(conditions={'P3': 1}))
+
+
 def test_param_space_clash():
     class Spam(rfm.RegressionTestPlugin):
         P0 = parameter([1])
@@ -345,3 +368,46 @@ def test_get_variant_nums():
 
     with pytest.raises(ValueError):
         MyTest.param_space.get_variant_nums(p=lambda x, y: x == 2)
+
+
+def test_param_space_indexing():
+    class MyTest(rfm.RegressionTest):
+        p0 = parameter(range(3))
+        p1 = parameter(['a', 'b'])
+        p2 = parameter([True, False, None, 1])
+
+    points = list(MyTest.param_space)
+    assert len(points) == len(MyTest.param_space) == 24
+    for i, point in enumerate(points):
+        assert MyTest.param_space[i] == dict(zip(['p0', 'p1', 'p2'], point))
+
+    assert MyTest.param_space[-1] == {'p0': 2, 'p1': 'b', 'p2': 1}
+    with pytest.raises(IndexError):
+        MyTest.param_space[24]
+
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_get_variant_nums_large_space(use_numpy, monkeypatch):
+    if use_numpy:
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setitem(sys.modules, 'numpy', None)
+
+    class MyTest(rfm.RegressionTest):
+        p0 = parameter(range(20))
+        p1 = parameter(range(20))
+        p2 = parameter(range(20))
+        p3 = parameter(range(20))
+        p4 = parameter(range(20))
+
+    param_space = MyTest.param_space
+    assert len(param_space) == 20**5
+    variants = param_space.get_variant_nums(p1=lambda x: x < 10, p3=7)
+    assert len(variants) == 20**3 * 10
+    assert variants == sorted(variants)
+    for v in variants[:100] + variants[-100:]:
+        params = param_space[v]
+        assert params['p1'] < 10
+        assert params['p3'] == 7
+
+    assert param_space.get_variant_nums(p0=lambda x: x > 100) == []
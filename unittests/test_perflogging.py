@@ -12,9 +12,11 @@ import reframe as rfm
 import reframe.core.logging as logging
 import reframe.core.runtime as rt
 import reframe.frontend.executors as executors
+import reframe.frontend.reporting as reporting
 import reframe.utility.osext as osext
 import reframe.utility.sanity as sn
 from reframe.core.builtins import variable, parameter, xfail
+from reframe.core.exceptions import ReframeError
 
 
 class _MyPerfTest(rfm.RunOnlyRegressionTest):
@@ -518,3 +520,94 @@ def test_perf_logging_locking(make_runner, make_exec_ctx,
     logfile = tmp_path / 'perflogs' / 'generic' / 'default' / '_MyPerfTest.log'
     assert os.path.exists(logfile)
     assert _count_lines(logfile) == 2
+
+
+def test_perf_logging_buffered(make_runner, make_exec_ctx, config_perflog,
+                               perf_test, lazy_perf_test, tmp_path):
+    make_exec_ctx(config_perflog(
+        fmt='',
+        logging_opts={
+            'perflog_multiline': True,
+            'handlers_perflog': [{
+                'type': 'filelog',
+                'locking_enable': True,
+                'max_open_files': 1,
+                'flush_interval': 60,
+                'prefix': '%(check_system)s/%(check_partition)s',
+                'level': 'info',
+                'format': (
+                    '%(check_display_name)s,%(check_result)s,'
+                    '%(check_perf_var)s,%(check_perf_value)s'
+                )
+            }]
+        }
+    ))
+    logging.configure_logging(rt.runtime().site_config)
+    runner = make_runner()
+    testcases = executors.generate_testcases([perf_test, lazy_perf_test])
+    _assert_no_logging_error(runner.runall, testcases)
+    logdir = tmp_path / 'perflogs' / 'generic' / 'default'
+    logfiles = [logdir / '_MyPerfTest.log', logdir / '_LazyPerfTest.log']
+
+    # The records of the last logged test are still buffered
+    assert sum(_count_lines(f) for f in logfiles) < 5
+
+    # Reconfiguring the logging closes the handler and flushes its buffers
+    logging.configure_logging(rt.runtime().site_config)
+    assert _count_lines(logfiles[0]) == 3
+    assert _count_lines(logfiles[1]) == 2
+    _assert_header(logfiles[0], 'display_name,result,perf_var,perf_value')
+
+
+@pytest.mark.parametrize('multiline', [False, True])
+def test_perf_logging_columnar(make_runner, make_exec_ctx, perf_test,
+                               simple_test, failing_perf_test,
+                               config_perflog, tmp_path, multiline):
+    pl = pytest.importorskip('polars')
+    make_exec_ctx(config_perflog(
+        fmt='',
+        logging_opts={
+            'perflog_multiline': multiline,
+            'handlers_perflog': [{'type': 'columnar', 'level': 'info'}]
+        }
+    ))
+    logging.configure_logging(rt.runtime().site_config)
+    logdir = tmp_path / 'perflogs' / 'generic' / 'default'
+
+    # Write a log file with a stale schema to check that it is rotated
+    os.makedirs(logdir)
+    (logdir / '_MyPerfTest.csv').write_text('name,pval\n')
+    (logdir / '_MyPerfTest.schema.json').write_text('{}')
+    runner = make_runner()
+    testcases = executors.generate_testcases(
+        [perf_test, simple_test, failing_perf_test]
+    )
+    _assert_no_logging_error(runner.runall, testcases)
+    assert os.path.exists(logdir / '_MyPerfTest.csv.h0')
+    assert os.path.exists(logdir / '_MyPerfTest.schema.json.h0')
+    assert not os.path.exists(logdir / '_MySimpleTest.csv')
+    assert _count_lines(logdir / '_MyPerfTest.csv') == 3
+    _assert_header(logdir / '_MyPerfTest.csv',
+                   ','.join(c for c, _ in
+                            logging.ColumnarFileHandler.COLUMNS))
+
+    df = reporting.load_perflogs(tmp_path / 'perflogs')
+    assert df.columns == [c for c, _ in logging.ColumnarFileHandler.COLUMNS]
+    assert df['job_completion_time'].dtype == pl.Float64
+    assert df['pval'].dtype == pl.Float64
+    assert df['name'].to_list() == ['_MyPerfTest', '_MyPerfTest']
+    assert df['system'].to_list() == ['generic', 'generic']
+    assert df['pvar'].to_list() == ['perf0', 'perf1']
+    assert df['pval'].to_list() == [100.0, 50.0]
+    assert df['punit'].to_list() == ['unit0', 'unit1']
+    assert df['presult'].to_list() == perf_test.expected_presults
+    assert df['plower'][0] == pytest.approx(95.0)
+    assert df['pupper'][0] == pytest.approx(105.0)
+
+    # Loading the same log file multiple times concatenates its rows
+    df = reporting.load_perflogs(logdir / '_MyPerfTest.csv',
+                                 tmp_path / 'perflogs')
+    assert len(df) == 4
+
+    with pytest.raises(ReframeError):
+        reporting.load_perflogs(logdir / '_MyPerfTest.csv.h0')
@@ -3,15 +3,21 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import copy
+import functools
 import os
 import pytest
 import re
 import sys
+import time
+import tracemalloc
 import yaml
 from pathlib import Path, PosixPath, WindowsPath
 
 import reframe as rfm
 import reframe.core.builtins as builtins
+import reframe.core.hooks as hooks
+import reframe.core.logging as logging
 import reframe.core.runtime as rt
 import reframe.utility.osext as osext
 import reframe.utility.sanity as sn
@@ -271,6 +277,43 @@ def test_run_only_decorated_sanity(local_exec_ctx):
         _run(MyOtherTest(), *local_exec_ctx)
 
 
+def test_early_failure(local_exec_ctx):
+    class MyTest(rfm.RunOnlyRegressionTest, custom_prefix='foo/bar/'):
+        executable = 'echo'
+        executable_opts = ['Hello']
+        valid_prog_environs = ['*']
+        valid_systems = ['*']
+        sourcesdir = None
+        sanity_patterns = sn.assert_true(1)
+
+        @early_failure
+        def fatal_error(self):
+            return sn.assert_not_found(r'FATAL', self.stdout)
+
+    _run(MyTest(), *local_exec_ctx)
+
+    class MyFailingTest(MyTest):
+        executable_opts = ['FATAL && sleep 60']
+
+    test = MyFailingTest()
+    test.setup(*local_exec_ctx)
+    test.compile()
+    test.compile_wait()
+    test.run()
+    timeout = time.time() + 30
+    with pytest.raises(SanityError,
+                       match=(r"early failure check 'fatal_error' failed: "
+                              r"pattern 'FATAL' found in 'rfm_job.out': "
+                              r"'FATAL'")):
+        while not test.run_complete():
+            assert time.time() < timeout
+            time.sleep(0.1)
+
+    # The job must have been cancelled
+    test.job.wait()
+    assert time.time() < timeout
+
+
 def test_run_only_no_srcdir(local_exec_ctx):
     class MyTest(rfm.RunOnlyRegressionTest, custom_prefix='foo/bar/'):
         valid_systems = ['*']
@@ -769,6 +812,20 @@ def test_supports_sysenv(testsys_exec_ctx):
     )
 
 
+def test_supports_sysenv_cached(testsys_exec_ctx):
+    # Modifying the returned combinations must not affect later calls
+    valid_comb = rt.valid_sysenv_comb(['*'], ['*'])
+    for environs in valid_comb.values():
+        environs.clear()
+
+    valid_comb = rt.valid_sysenv_comb(['*'], ['*'])
+    assert {p.fullname: [e.name for e in environs]
+            for p, environs in valid_comb.items()} == {
+        'testsys:login': ['PrgEnv-cray', 'PrgEnv-gnu'],
+        'testsys:gpu': ['PrgEnv-gnu', 'builtin']
+    }
+
+
 def test_sourcesdir_none(local_exec_ctx):
     class MyTest(rfm.RegressionTest,
                  custom_prefix='unittests/resources/checks'):
@@ -1058,6 +1115,20 @@ def test_setup_hooks(HelloTest, local_exec_ctx):
     assert test.count == 2
 
 
+def test_hooks_stage_bound_to_instance(HelloTest, local_exec_ctx):
+    class MyTest(HelloTest, custom_prefix='unittests/resources/checks'):
+        count = variable(int, value=0)
+
+        @run_before('setup')
+        def prefoo(self):
+            self.count += 1
+
+    test = MyTest()
+    test.setup = functools.partial(MyTest.setup, test)
+    _run(test, *local_exec_ctx)
+    assert test.count == 1
+
+
 def test_compile_hooks(HelloTest, local_exec_ctx):
     class MyTest(HelloTest, custom_prefix='unittests/resources/checks'):
         count = variable(int, value=0)
@@ -2228,6 +2299,101 @@ def test_perf_vars_without_reference(perftest, sanity_file,
     assert 'v3' in log_output
 
 
+@pytest.mark.parametrize('batch_perf_scans', [False, True])
+def test_perf_vars_file_cache(perftest, sanity_file, perf_file,
+                              dummy_gpu_exec_ctx, batch_perf_scans):
+    sanity_file.write_text('result = success\n')
+    perf_file.write_text('perf1 = 1.0\n'
+                         'perf2 = 2.0\n'
+                         'perf3 = 3.3\n')
+    perftest.perf_variables = {
+        f'value{i}': sn.make_performance_function(
+            sn.extractsingle(rf'perf{i} = (\S+)', perf_file, 1, float), 'unit'
+        ) for i in range(1, 4)
+    }
+    profiler = logging.getprofiler()
+    hits = profiler.counter('file cache hits')
+    misses = profiler.counter('file cache misses')
+    scans_saved = profiler.counter('file cache scans saved')
+    perftest.batch_perf_scans = batch_perf_scans
+    _run_sanity(perftest, *dummy_gpu_exec_ctx)
+
+    # The performance file is read only once; it is also scanned only once,
+    # if the scans are batched
+    assert profiler.counter('file cache misses') == misses + 2
+    if batch_perf_scans:
+        assert profiler.counter('file cache hits') == hits
+        assert profiler.counter('file cache scans saved') == scans_saved + 3
+    else:
+        assert profiler.counter('file cache hits') == hits + 2
+        assert profiler.counter('file cache scans saved') == scans_saved
+    assert perftest.perfvalues['testsys:gpu:value3'][0] == 3.3
+
+
+def test_perf_vars_expression_cache(perftest, sanity_file,
+                                    perf_file, dummy_gpu_exec_ctx):
+    sanity_file.write_text('result = success\n')
+    perf_file.write_text('perf1 = 1.0\n'
+                         'perf2 = 2.0\n'
+                         'perf3 = 3.3\n')
+    values = sn.extractall(r'perf\d = (\S+)', perf_file, 1, float)
+    perftest.perf_variables = {
+        'min': sn.make_performance_function(sn.min(values), 'unit'),
+        'max': sn.make_performance_function(sn.max(values), 'unit')
+    }
+    profiler = logging.getprofiler()
+    hits = profiler.counter('expression cache hits')
+    _run_sanity(perftest, *dummy_gpu_exec_ctx)
+
+    # The values are extracted only once
+    assert profiler.counter('expression cache hits') == hits + 1
+    assert perftest.perfvalues['testsys:gpu:min'][0] == 1.0
+    assert perftest.perfvalues['testsys:gpu:max'][0] == 3.3
+
+
+def test_perf_functions_batched_scan(testsys_exec_ctx, sanity_file,
+                                     perf_file, dummy_gpu_exec_ctx):
+    class MyTest(rfm.RunOnlyRegressionTest):
+        sourcesdir = None
+        batch_perf_scans = True
+        num_calls = variable(int, value=0)
+
+        @sanity_function
+        def dummy_sanity(self):
+            return sn.assert_found(r'success', sanity_file)
+
+        @performance_function('unit')
+        def value1(self):
+            self.num_calls += 1
+            return sn.extractsingle(r'perf1 = (\S+)', perf_file, 1, float)
+
+        @performance_function('unit')
+        def value2(self):
+            self.num_calls += 1
+            return sn.extractsingle(r'perf2 = (\S+)', perf_file, 1, float)
+
+        @performance_function('unit')
+        def value3(self):
+            raise ValueError
+
+    sanity_file.write_text('result = success\n')
+    perf_file.write_text('perf1 = 1.0\n'
+                         'perf2 = 2.0\n')
+    test = MyTest()
+    profiler = logging.getprofiler()
+    scans_saved = profiler.counter('file cache scans saved')
+    _run_sanity(test, *dummy_gpu_exec_ctx)
+
+    # Every performance function is called once and the performance file is
+    # scanned once for all of them
+    assert test.num_calls == 2
+    assert profiler.counter('file cache scans saved') == scans_saved + 2
+    assert test.perfvalues['testsys:gpu:value1'][0] == 1.0
+    assert test.perfvalues['testsys:gpu:value2'][0] == 2.0
+    assert 'testsys:gpu:value3' not in test.perfvalues
+    assert test.perf_variables['value2'].__rfm_json_encode__() == 2.0
+
+
 def test_perf_vars_with_reference(perftest, sanity_file,
                                   perf_file, dummy_gpu_exec_ctx):
     # This test also checks that a performance function that raises an
@@ -2640,3 +2806,109 @@ def test_variables_deprecation():
         test.variables['BAR'] = 2
 
     assert test.env_vars['BAR'] == 2
+
+
+def test_clone(HelloTest, local_exec_ctx):
+    test = HelloTest()
+    test.tags = {'a'}
+    test.descr = 'hello'
+    test.reference = {'*': {'x': (1, None, None, 's')}}
+    clone = copy.deepcopy(test)
+
+    # Immutable state is shared and mutable state is copied
+    assert clone.descr is test.descr
+    assert clone._cdt_environ is test._cdt_environ
+    assert clone.tags == test.tags
+    assert clone.tags is not test.tags
+    assert clone.reference == test.reference
+    assert clone.reference is not test.reference
+    assert clone.container_platform is not test.container_platform
+    clone.tags.add('b')
+    clone.executable_opts.append('-v')
+    assert test.tags == {'a'}
+    assert test.executable_opts == []
+
+    # The clone must be runnable independently of the original test
+    _run(clone, *local_exec_ctx)
+    assert test.stagedir is None
+
+
+def test_clone_memory(HelloTest):
+    # Keep the per-clone footprint of a plain test in check; the clones share
+    # all the immutable state of the original test
+    test = HelloTest()
+    num_clones = 1000
+    tracemalloc.start()
+    try:
+        clones = [copy.deepcopy(test) for _ in range(num_clones)]
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(clones) == num_clones
+    assert size / num_clones < 8192
+
+
+def test_pipeline_stage_wrappers(hellotest, monkeypatch):
+    # The pipeline stages are wrapped once, upon class creation, and the
+    # attribute access of the tests is not intercepted
+    cls = type(hellotest)
+    assert cls.__getattribute__ is object.__getattribute__
+
+    for stage in cls._rfm_pipeline_stages:
+        assert hooks.is_stage_wrapper(getattr(cls, stage))
+
+    # The pipeline hooks are processed only upon the first instantiation of
+    # the test class
+    class _T(rfm.RunOnlyRegressionTest):
+        @run_before('run')
+        def set_exec(self):
+            self.executable = 'echo'
+
+    num_calls = 0
+    process_hook_registry = _T._process_hook_registry
+
+    def _process_hook_registry():
+        nonlocal num_calls
+        num_calls += 1
+        return process_hook_registry()
+
+    monkeypatch.setattr(_T, '_process_hook_registry', _process_hook_registry)
+    tests = [_T() for _ in range(3)]
+    assert num_calls == 1
+    assert tests[0].pipeline_hooks() == {'pre_run': [_T.set_exec]}
+
+    # Stages wrapped in a base class are not wrapped again
+    assert _T.run is rfm.RunOnlyRegressionTest.run
+
+
+def test_instantiation_plan(monkeypatch):
+    # The variables are injected following a per-class plan that is built
+    # upon the first instantiation; the variant info is only needed for tests
+    # with fixtures
+    class _T(rfm.RunOnlyRegressionTest):
+        p = parameter(range(10))
+        valid_systems = ['*']
+        valid_prog_environs = ['*']
+        executable = 'echo'
+
+        @run_after('init')
+        def set_opts(self):
+            self.executable_opts = [str(self.p)]
+
+    def _get_variant_info(*args, **kwargs):
+        pytest.fail('get_variant_info() called for a test without fixtures')
+
+    monkeypatch.setattr(_T, 'get_variant_info', _get_variant_info)
+    test = _T(variant_num=0)
+    plan = _T._rfm_var_space._injection_plan
+    assert plan is not None
+
+    tests = [_T(variant_num=i) for i in range(1, _T.num_variants)]
+    assert _T._rfm_var_space._injection_plan is plan
+    assert [t.executable_opts for t in tests[:2]] == [['1'], ['2']]
+
+    # Immutable defaults are shared, mutable ones are copied
+    assert tests[0].executable is test.executable
+    assert tests[0].valid_systems == test.valid_systems
+    assert tests[0].valid_systems is not test.valid_systems
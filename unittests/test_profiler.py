@@ -56,3 +56,15 @@ def test_time_region_profiler_ctxmgr():
     t_forloop = profiler.total_time('forloop')
     assert t_sleep >= 1
     assert t_forloop > t_sleep
+
+
+def test_counters():
+    profiler = prof.TimeProfiler()
+    profiler.increment('hits')
+    profiler.increment('hits', 2)
+    assert profiler.counter('hits') == 3
+    assert profiler.counter('misses') == 0
+
+    lines = []
+    profiler.print_report(lines.append)
+    assert 'hits: 3' in lines
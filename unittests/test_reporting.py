@@ -101,6 +101,8 @@ def test_run_report(make_runner, make_cases, common_exec_ctx, tmp_path):
 
     # Validate the junit report
     _validate_junit_report(report.generate_xml_report())
+    report.save_junit(tmp_path / 'report.xml')
+    _validate_junit_report(etree.parse(tmp_path / 'report.xml'))
 
     # Read and validate the report using the `reporting` module
     reporting.restore_session(tmp_path / 'report.json')
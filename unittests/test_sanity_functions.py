@@ -6,11 +6,15 @@
 import contextlib
 import io
 import itertools
+import json
 import os
 import pytest
+import re
 import sys
+import tracemalloc
 
 
+import reframe.utility.jsonext as jsonext
 import reframe.utility.sanity as sn
 from reframe.core.exceptions import SanityError
 from unittests.utility import TEST_RESOURCES_CHECKS
@@ -831,6 +835,253 @@ def test_extractall_multiple_tags(_extractall):
         )
 
 
+def test_file_cache(tempfile):
+    with sn.file_cache() as cache:
+        steps = sn.extractall(r'Step: (\d+)', tempfile, 1, int)
+        assert sn.evaluate(steps) == [1, 2, 3]
+        assert sn.evaluate(sn.assert_found(r'Number', tempfile))
+        assert sn.evaluate(sn.extractsingle(r'Number: (\d+)', tempfile, 1,
+                                            int)) == 1
+        assert cache.misses == 1
+        assert cache.hits == 2
+        assert cache.bytes_saved == 2*os.path.getsize(tempfile)
+
+        # Nested contexts share the same cache
+        with sn.file_cache() as other:
+            assert other is cache
+
+        # Modified files are read again
+        with open(tempfile, 'a') as fp:
+            fp.write('Step: 4\n')
+
+        assert sn.evaluate(steps) == [1, 2, 3, 4]
+        assert cache.misses == 2
+
+        # Other encodings are read separately
+        sn.evaluate(sn.findall(r'Step', tempfile, encoding='ascii'))
+        assert cache.misses == 3
+
+        # File descriptors are not cached
+        fd = os.open(tempfile, os.O_RDONLY)
+        assert sn.evaluate(sn.assert_found(r'Step: 4', fd))
+
+        assert cache.misses == 3
+        assert cache.hits == 2
+
+    # Files are not cached outside the context
+    with sn.file_cache() as cache:
+        pass
+
+    assert sn.evaluate(steps) == [1, 2, 3, 4]
+    assert cache.misses == 0
+
+
+def test_extract_many(tempfile):
+    values = sn.extract_many({
+        'steps': (r'Step: (\d+)', 1, int),
+        'numbers': (r'Number: (\d+) (\d+)', [1, 2]),
+        'first': r'Number: (\d+)'
+    }, tempfile, tag=1, conv=int)
+    assert list(values.keys()) == ['steps', 'numbers', 'first']
+    with sn.file_cache() as cache:
+        assert sn.evaluate(values['steps']) == [1, 2, 3]
+        assert sn.evaluate(values['numbers']) == [(1, 2), (2, 4), (3, 6)]
+        assert sn.evaluate(values['first']) == [1, 2, 3]
+        assert sn.evaluate(sn.extractall(r'Step: (\d+)', tempfile, 1)) == [
+            '1', '2', '3'
+        ]
+        assert cache.misses == 1
+        assert cache.scans_saved == 4
+
+    # The patterns are scanned separately outside a file cache context
+    assert sn.evaluate(values['steps']) == [1, 2, 3]
+    with pytest.raises(ValueError):
+        sn.extract_many({'x': ()}, tempfile)
+
+
+@pytest.mark.parametrize(
+    'patterns,batched', [
+        # Overlapping matches
+        ([r'Step: (\d+)', r'(\d+)\n', r'\w+: 1', r'(?<=\d) (\d)'], True),
+
+        # Patterns that cannot be combined
+        ([r'(?P<x>Step)', r'(?P<x>Number)'], False),
+        ([r'(\d) \1', r'Step'], False),
+
+        # Empty matches
+        ([r'Step|', r'Number'], True),
+    ]
+)
+@pytest.mark.parametrize('max_positions', [4096, 3])
+def test_extract_many_scan(tempfile, contents, patterns, batched,
+                           max_positions, monkeypatch):
+    monkeypatch.setattr(sn, '_MULTI_SCAN_MAX_POSITIONS', max_positions)
+    values = sn.extract_many(dict(enumerate(patterns)), tempfile)
+    with sn.file_cache() as cache:
+        for i, patt in enumerate(patterns):
+            assert sn.evaluate(values[i]) == [
+                m.group(0) for m in re.finditer(patt, contents, re.MULTILINE)
+            ]
+
+        assert cache.scans_saved == (len(patterns) if batched else 0)
+
+
+def test_extract_many_dense_matches(tmp_path, monkeypatch):
+    monkeypatch.setattr(sn, '_MULTI_SCAN_MAX_POSITIONS', 8)
+    tmp_file = tmp_path / 'dense'
+    tmp_file.write_text(''.join(f'{i}\n' for i in range(100)))
+    values = sn.extract_many({'a': (r'^(\d)$', 1, int),
+                              'b': (r'^(\d\d)$', 1, int)}, tmp_file)
+    with sn.file_cache() as cache:
+        assert sn.evaluate(values['a']) == list(range(10))
+        assert sn.evaluate(values['b']) == list(range(10, 100))
+
+        # The matches of the partial scan are kept
+        assert cache.scans_saved == 2
+
+
+@pytest.fixture(params=['read', 'mmap', 'lines'])
+def scan(request):
+    return request.param
+
+
+def test_scan_modes(tempfile, scan):
+    assert sn.evaluate(sn.assert_found(r'Step: 3', tempfile, scan=scan))
+    assert sn.evaluate(sn.assert_not_found(r'Step: 4', tempfile, scan=scan))
+    with pytest.raises(SanityError, match='not found'):
+        sn.evaluate(sn.assert_found(r'Step: 4', tempfile, scan=scan))
+
+    with pytest.raises(SanityError, match='found'):
+        sn.evaluate(sn.assert_not_found(r'Step: 3', tempfile, scan=scan))
+
+    assert sn.evaluate(sn.count(sn.findall(r'^Step', tempfile,
+                                           scan=scan))) == 3
+    assert sn.evaluate(sn.extractall(r'Step: (\d+)', tempfile, 1, int,
+                                     scan=scan)) == [1, 2, 3]
+    assert sn.evaluate(sn.extractall(r'Number: (?P<no1>\d+) (?P<no2>\d+)',
+                                     tempfile, ('no1', 'no2'),
+                                     scan=scan)) == [('1', '2'), ('2', '4'),
+                                                     ('3', '6')]
+    assert sn.evaluate(sn.extractsingle(r'Step: (\d+)$', tempfile, 1,
+                                        item=-1, scan=scan)) == '3'
+    with pytest.raises(SanityError):
+        sn.evaluate(sn.extractall(r'Step: (\d+)', tempfile, 2, scan=scan))
+
+    with pytest.raises(SanityError):
+        sn.evaluate(sn.extractall(r'Step: (\d+)', 'foo.txt', scan=scan))
+
+
+def test_scan_modes_multiline(tempfile, monkeypatch):
+    patt = r'Step: 3\nNumber: (\d+)'
+    assert sn.evaluate(sn.extractall(patt, tempfile, 1)) == ['1']
+    assert sn.evaluate(sn.extractall(patt, tempfile, 1, scan='mmap')) == ['1']
+
+    # Patterns spanning lines are not searched for across chunks
+    monkeypatch.setattr(sn, '_SCAN_CHUNK_SIZE', 1)
+    assert sn.evaluate(sn.extractall(patt, tempfile, 1, scan='lines')) == []
+    assert sn.evaluate(sn.extractall(r'Step: (\d+)', tempfile, 1, int,
+                                     scan='lines')) == [1, 2, 3]
+
+
+def test_scan_mmap_errors(tempfile, utf16_file, tmp_path):
+    with pytest.raises(SanityError):
+        sn.evaluate(sn.extractall(r'Odyssey', utf16_file, encoding='utf-16',
+                                  scan='mmap'))
+
+    empty_file = tmp_path / 'empty.txt'
+    empty_file.touch()
+    assert sn.evaluate(sn.findall(r'.*', empty_file, scan='mmap')) == []
+    with pytest.raises(ValueError):
+        sn.evaluate(sn.findall(r'Step', tempfile, scan='foo'))
+
+
+def test_scan_memory(tmp_path, monkeypatch):
+    large_file = tmp_path / 'large.out'
+    with open(large_file, 'w') as fp:
+        for i in range(200_000):
+            fp.write(f'iteration {i}: residual = 1e-3\n')
+
+        fp.write('Performance: 3.14 Gflop/s\n')
+
+    def peak_memory(scan):
+        tracemalloc.start()
+        try:
+            value = sn.evaluate(sn.extractsingle(
+                r'Performance: (\S+)', large_file, 1, float, scan=scan
+            ))
+            return value, tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    # The memory needed by the 'lines' mode depends on the chunk size
+    monkeypatch.setattr(sn, '_SCAN_CHUNK_SIZE', 1 << 16)
+    file_size = os.path.getsize(large_file)
+    value, read_peak = peak_memory('read')
+    assert value == 3.14
+    assert read_peak > file_size
+    for scan in ('mmap', 'lines'):
+        value, peak = peak_memory(scan)
+        assert value == 3.14
+        assert peak < file_size // 10
+
+
+def test_output_monitor(tmp_path):
+    outfile = tmp_path / 'out.txt'
+    monitor = sn._OutputMonitor({
+        'fatal': sn.assert_not_found(r'^FATAL', outfile,
+                                     msg='fatal error: {0}')
+    })
+
+    # The output file has not been created yet
+    monitor.check()
+
+    outfile.write_text('step 1\nFAT')
+    monitor.check()
+
+    # The pattern is only searched in complete lines
+    with open(outfile, 'a') as fp:
+        fp.write('AL')
+
+    monitor.check()
+    with open(outfile, 'a') as fp:
+        fp.write('\nstep 2\n')
+
+    with pytest.raises(SanityError,
+                       match=(r"early failure check 'fatal' failed: "
+                              r"fatal error: \^FATAL: 'FATAL'")):
+        monitor.check()
+
+    # Lines already searched are not searched again
+    monitor.check()
+
+    # The search starts over if the file is truncated
+    outfile.write_text('FATAL\n')
+    with pytest.raises(SanityError):
+        monitor.check()
+
+
+def test_output_monitor_full_evaluation(tmp_path):
+    outfile = tmp_path / 'out.txt'
+    outfile.write_text('iterations: 10\n')
+    monitor = sn._OutputMonitor({
+        'iterations': sn.assert_lt(
+            sn.extractsingle(r'iterations: (\d+)', outfile, 1, int), 20
+        ),
+        'error': sn.assert_not_found(r'error', outfile, scan='lines')
+    })
+    monitor.check()
+
+    outfile.write_text('iterations: 30\n')
+    with pytest.raises(SanityError,
+                       match="check 'iterations' failed: 30 >= 20"):
+        monitor.check()
+
+    monitor = sn._OutputMonitor({'done': sn.defer(False)})
+    with pytest.raises(SanityError,
+                       match="check 'done' failed: False is not True"):
+        monitor.check()
+
+
 def test_safe_format():
     from reframe.utility.sanity import _format
 
@@ -862,6 +1113,124 @@ def test_avg():
         sn.evaluate(sn.avg([]))
 
 
+@pytest.fixture(params=['numpy', 'python'])
+def use_numpy(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setitem(sys.modules, 'numpy', None)
+
+    return request.param == 'numpy'
+
+
+def test_percentile(use_numpy):
+    vals = [5, 1, 4, 2, 3]
+    assert sn.evaluate(sn.percentile(vals, 50)) == 3
+    assert sn.evaluate(sn.percentile(vals, [0, 25, 90, 100])) == pytest.approx(
+        [1, 2, 4.6, 5]
+    )
+    assert sn.evaluate(sn.percentile(iter(vals), 10)) == pytest.approx(1.4)
+    with pytest.raises(SanityError):
+        sn.evaluate(sn.percentile([], 50))
+
+    with pytest.raises(ValueError):
+        sn.evaluate(sn.percentile(vals, 101))
+
+
+def test_stddev(use_numpy):
+    vals = [2, 4, 4, 4, 5, 5, 7, 9]
+    assert sn.evaluate(sn.stddev(vals)) == pytest.approx(2)
+    assert sn.evaluate(sn.stddev(sn.defer(vals), ddof=1)) == pytest.approx(
+        2.13809
+    )
+    with pytest.raises(SanityError):
+        sn.evaluate(sn.stddev([1], ddof=1))
+
+
+def test_trimmed_mean(use_numpy):
+    vals = [100, 1, 2, 3, 4, 5, 6, 7, 8, -100]
+    assert sn.evaluate(sn.trimmed_mean(vals, 0)) == pytest.approx(3.6)
+    assert sn.evaluate(sn.trimmed_mean(vals, 0.1)) == pytest.approx(4.5)
+    assert sn.evaluate(sn.trimmed_mean(vals, 0.19)) == pytest.approx(4.5)
+    assert sn.evaluate(sn.trimmed_mean([1], 0.4)) == 1
+    with pytest.raises(SanityError):
+        sn.evaluate(sn.trimmed_mean([], 0.1))
+
+    with pytest.raises(ValueError):
+        sn.evaluate(sn.trimmed_mean(vals, 0.5))
+
+
+def test_extractall_array(tempfile, scan):
+    np = pytest.importorskip('numpy')
+    steps = sn.extractall_array(r'Step: (\d+)', tempfile, 1, scan=scan)
+    assert sn.evaluate(steps).tolist() == [1.0, 2.0, 3.0]
+    assert sn.evaluate(steps).dtype == np.float64
+    assert sn.evaluate(sn.avg(steps)) == 2
+    assert sn.evaluate(sn.sum(steps)) == 6
+    assert sn.evaluate(sn.sum(steps, 1)) == 7
+    assert sn.evaluate(sn.max(steps)) == 3
+    assert sn.evaluate(sn.min(steps)) == 1
+    assert sn.evaluate(sn.percentile(steps, 50)) == 2
+
+    numbers = sn.evaluate(sn.extractall_array(
+        r'Number: (?P<x>\d+) (?P<y>\d+)', tempfile, ['x', 'y'], int, scan=scan
+    ))
+    assert numbers.tolist() == [[1, 2], [2, 4], [3, 6]]
+    assert sn.evaluate(sn.avg(numbers)) == [2, 4]
+    assert sn.evaluate(sn.sum(numbers)) == [6, 12]
+    assert sn.evaluate(sn.extractall_array(
+        r'Number: (?P<x>\d+)', tempfile, 'x', scan=scan
+    )).tolist() == [1, 2, 3]
+    assert sn.evaluate(sn.extractall_array(
+        r'Step: \d+', tempfile, dtype=str, scan=scan
+    )).tolist() == ['Step: 1', 'Step: 2', 'Step: 3']
+    assert sn.evaluate(sn.extractall_array(
+        r'Foo: (\d+) (\d+)', tempfile, [1, 2], scan=scan
+    )).shape == (0, 2)
+    with pytest.raises(SanityError, match='could not convert'):
+        sn.evaluate(sn.extractall_array(r'Step: (\S+)', tempfile, 0,
+                                        scan=scan))
+
+    with pytest.raises(SanityError, match='no such group'):
+        sn.evaluate(sn.extractall_array(r'Step: (\d+)', tempfile, 2,
+                                        scan=scan))
+
+
+def test_extractall_array_reductions_json(tempfile):
+    pytest.importorskip('numpy')
+    steps = sn.extractall_array(r'Step: (\d+)', tempfile, 1, int)
+    numbers = sn.extractall_array(r'Number: (?P<x>\d+) (?P<y>\d+)',
+                                  tempfile, ['x', 'y'], int)
+    values = {
+        'max': sn.max(steps),
+        'min': sn.min(steps),
+        'sum': sn.sum(steps),
+        'avg': sn.avg(steps),
+        'stddev': sn.stddev(steps),
+        'trimmed_mean': sn.trimmed_mean(steps, 0.1),
+        'percentile': sn.percentile(steps, 50),
+        'avg_vec': sn.avg(numbers),
+        'sum_vec': sn.sum(numbers)
+    }
+    values = {name: sn.evaluate(expr) for name, expr in values.items()}
+
+    # The reductions of arrays are Python scalars and lists
+    assert type(values['max']) is int
+    assert type(values['sum']) is int
+    assert type(values['avg']) is float
+    assert json.loads(jsonext.dumps(values)) == {
+        'max': 3, 'min': 1, 'sum': 6, 'avg': 2.0, 'stddev': values['stddev'],
+        'trimmed_mean': 2.0, 'percentile': 2.0,
+        'avg_vec': [2.0, 4.0], 'sum_vec': [6, 12]
+    }
+
+
+def test_extractall_array_no_numpy(tempfile, monkeypatch):
+    monkeypatch.setitem(sys.modules, 'numpy', None)
+    with pytest.raises(SanityError, match='requires NumPy'):
+        sn.evaluate(sn.extractall_array(r'Step: (\d+)', tempfile, 1))
+
+
 def test_path_exists(tmp_path):
     valid_dir = tmp_path / 'foo'
     valid_dir.touch()
@@ -4,6 +4,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import pytest
+import re
 
 import reframe.utility.typecheck as typ
 
@@ -372,3 +373,87 @@ def test_composition_of_types():
     assert isinstance(t, MetaT)
     assert isinstance(1, MetaT | typ.Integer)
     assert isinstance(1, ~MetaT)
+
+
+def test_revalidate():
+    t = typ.List[typ.Str[r'\d+']]
+    value = ['1', '2']
+    valid, snapshot = typ.revalidate(t, value)
+    assert valid
+
+    value.append('3')
+    valid, snapshot = typ.revalidate(t, value, snapshot)
+    assert valid
+
+    value.append('x')
+    assert typ.revalidate(t, value, snapshot) == (False, None)
+
+    value[-1] = '4'
+    value[0] = 'x'
+    assert typ.revalidate(t, value, snapshot) == (False, None)
+
+    # Snapshots of other values are not reused
+    valid, snapshot = typ.revalidate(t, ['1'])
+    assert not typ.revalidate(t, ['x'], snapshot)[0]
+
+    t = typ.Dict[str, typ.List[typ.Str[r'\d+']]]
+    value = {'a': ['1']}
+    valid, snapshot = typ.revalidate(t, value)
+    assert valid
+
+    value['b'] = ['2']
+    valid, snapshot = typ.revalidate(t, value, snapshot)
+    assert valid
+
+    value['a'].append('x')
+    assert typ.revalidate(t, value, snapshot) == (False, None)
+
+    # Plain types are checked directly
+    assert typ.revalidate(typ.List[int], [1]) == (True, None)
+    assert typ.revalidate(typ.List[int], ['1']) == (False, None)
+
+
+def _generic_isinstance(inst, t):
+    # A generic recursive type check, used as a reference
+    if not isinstance(t, type(typ.List)) or t._elem_type is None:
+        return isinstance(inst, t)
+
+    if not isinstance(inst, t._type):
+        return False
+
+    if isinstance(t, type(typ.Str)):
+        return re.fullmatch(t._elem_type, inst) is not None
+
+    return all(_generic_isinstance(e, t._elem_type) for e in inst)
+
+
+def test_compiled_check():
+    elem_type = typ.Str[r'\S+']
+    elem_check = elem_type._checker
+    checked = []
+
+    def _check(inst):
+        checked.append(inst)
+        return elem_check(inst)
+
+    # The compiled checks of the containers call those of their elements
+    elem_type._rfm_checker = _check
+    t = typ.List[elem_type]
+    value = [f'--opt{i}' for i in range(100)]
+    assert isinstance(value, t)
+    assert '_rfm_checker' in vars(t)
+    assert checked == value
+    assert _generic_isinstance(value, t)
+
+    # Only the appended elements are checked again
+    checked.clear()
+    valid, snapshot = typ.revalidate(t, value)
+    assert valid
+    value += ['--new']
+    checked.clear()
+    assert typ.revalidate(t, value, snapshot)[0]
+    assert checked == ['--new']
+
+    value.append('--bad opt')
+    assert not isinstance(value, t)
+    assert not _generic_isinstance(value, t)
@@ -211,6 +211,21 @@ def test_var_deepcopy():
     assert Baz().my_var == []
 
 
+def test_var_injection_after_setvar(OneVarTest):
+    class MyTest(OneVarTest):
+        bar = variable(typ.List[int], value=[1])
+
+    inst = MyTest()
+    inst.bar.append(2)
+    MyTest.setvar('foo', 4)
+
+    # Updated defaults must be injected in new instances
+    inst = MyTest()
+    assert inst.foo == 4
+    assert inst.bar == [1]
+    assert MyTest.bar == [1]
+
+
 def test_variable_access():
     class Foo(rfm.RegressionTestPlugin):
         my_var = variable(str, value='bananas')